@@ -4,7 +4,7 @@ It acts as a base line for our Image Classification Deep Learning Model.
 Since it is just a base line, its architecture is extremely simple and has no optimisation.
 
 @author Benjamin Leong Tjen Ho
-@version 1.0.0
+@version 1.5.0
 @since 29/03/2024
 """
 
@@ -13,10 +13,66 @@ Since it is just a base line, its architecture is extremely simple and has no op
 # Imports
 from __future__ import annotations
 
-import numpy as np
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers, models, activations
+import contextlib
+
+from lazy_module import LazyModule
+
+# TensorFlow takes seconds to import, so it is only imported on first use (e.g. in build_cnn or fit)
+np = LazyModule("numpy")
+tf = LazyModule("tensorflow")
+keras = LazyModule("tensorflow.keras")
+layers = LazyModule("tensorflow.keras.layers")
+models = LazyModule("tensorflow.keras.models")
+activations = LazyModule("tensorflow.keras.activations")
+
+# ============================================================================================================= #
+
+# Constants
+# CPU flags (from /proc/cpuinfo) of native bfloat16 support
+BF16_CPU_FLAGS = ("avx512_bf16", "amx_bf16")
+
+# TFLite export quantisations (@see BaseModel.export_tflite)
+TFLITE_QUANTISATIONS = ("int8", "dynamic", "float32")
+
+# ============================================================================================================= #
+
+
+# Function
+def bfloat16_supported() -> bool:
+    """Checks if the hardware computes in bfloat16 natively
+    Mixed precision only speeds training up on hardware with native bfloat16 support:
+    GPUs with a compute capability of at least 8.0, or CPUs with AVX512_BF16 or AMX instructions.
+
+    @since 1.3.0
+
+    @rtype: bool
+    @return: True if a GPU or the CPU supports bfloat16
+    """
+    # The CPU is checked first, since listing the GPUs imports TensorFlow
+    try:
+        with open("/proc/cpuinfo", "r") as cpuinfo:
+            if any(flag in BF16_CPU_FLAGS for flag in cpuinfo.read().split()):
+                return True
+    except OSError:
+        pass
+
+    for gpu in tf.config.list_physical_devices("GPU"):
+        capability = tf.config.experimental.get_device_details(gpu).get("compute_capability")
+        if capability and capability >= (8, 0):
+            return True
+
+    return False
+
+
+def __getattr__(name: str):
+    """Imports ThroughputLogger (@see callbacks.py) on first use, since it imports TensorFlow"""
+    if name == "ThroughputLogger":
+        from callbacks import ThroughputLogger
+
+        return ThroughputLogger
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
 # ============================================================================================================= #
 
@@ -35,19 +91,33 @@ class BaseModel:
         num_classes (int):        The number of possible (output) classes
 
         activation_func (str):    The name of the activation function to be used in the model (excluding softmax on last layer)
-        optimiser (Optimizer):    The optimisation algorithm function to be used in the model
+        optimiser_name (str):     The name of the optimiser to be used in the model
+        optimiser (Optimizer):    The optimisation algorithm function to be used in the model, created on first use
         batch_size (int):         The size of batches to be used when training
         num_epochs (int):         The number of epochs to be used when training
         verbose (int | bool):     An integer value determining how to output the training progress
 
+        learning_rate (float):    The (base) learning rate when performing back propagation
+        high_throughput (bool):   Boolean stating if the largest batch size that fits in memory is used when training
+        max_batch_size (int):     The largest batch size considered in high throughput mode
+        sparse_labels (bool):     Boolean stating if the classes are integer class ids instead of one-hot vectors
+
+        jit_compile (bool):       Boolean stating if the training step is compiled with XLA
+        dtype_policy (str):       The Keras dtype policy of the layers, "mixed_bfloat16" or "float32"
+
     Methods:
         build_cnn
         fit
+        find_max_batch_size
         compute_accuracy
+        export_tflite
+        compute_tflite_accuracy
         summary
 
     Static Method:
+        _get_validation_data
         _get_optimiser
+        _tflite_predict
     """
 
     # Methods
@@ -64,6 +134,11 @@ class BaseModel:
         num_epochs: int = 20,
         learning_rate: float = 0.0001,
         verbose: int | bool = True,
+        high_throughput: bool = False,
+        max_batch_size: int = 512,
+        sparse_labels: bool = False,
+        jit_compile: bool = False,
+        mixed_precision: bool = False,
     ) -> BaseModel:
         """Constructor for the BaseModel class
 
@@ -83,6 +158,15 @@ class BaseModel:
         @param learning_rate(float): The learning rate when performing back propagation
         @param verbose(int | bool): An integer value determining how to display the training progress
 
+        @param high_throughput(bool): Boolean stating if the largest batch size that fits in memory is used when training
+        @param max_batch_size(int):   The largest batch size considered in high throughput mode
+
+        @param sparse_labels(bool): Boolean stating if the classes are given as integer class ids instead of one-hot vectors
+
+        @param jit_compile(bool):     Boolean stating if the training step is compiled with XLA
+        @param mixed_precision(bool): Boolean stating if the layers compute in bfloat16 (with float32 weights),
+                                      when the hardware supports it (@see bfloat16_supported)
+
         @rtype: BaseModel
         @return: The new constructed BaseModel instance
         """
@@ -98,16 +182,48 @@ class BaseModel:
         self.activation_func: str = activation_func
 
         # Optimiser attribute - also used when setting the model's structure
-        self.optimiser: Optimizer = BaseModel._get_optimiser(optimiser, learning_rate)
+        # The optimiser itself is only created on first use, since it imports TensorFlow (@see optimiser)
+        self.optimiser_name: str = optimiser
+        self._optimiser: Optimizer | None = None
 
         # Attributes used when executing training
         self.batch_size: int = batch_size
         self.num_epochs: int = num_epochs
+        self.learning_rate: float = learning_rate
+
+        # Attributes used for the high throughput training mode
+        self.high_throughput: bool = high_throughput
+        self.max_batch_size: int = max_batch_size
+
+        # Integer class ids take num_classes times less memory than one-hot vectors
+        self.sparse_labels: bool = sparse_labels
+
+        # Attributes used for faster training
+        self.jit_compile: bool = jit_compile
+        self.dtype_policy: str = "float32"
+        if mixed_precision:
+            if bfloat16_supported():
+                self.dtype_policy = "mixed_bfloat16"
+            elif verbose:
+                print("Mixed precision: bfloat16 is not supported by this hardware, using float32")
 
         # Used for printing out progress during training
         # @see https://stackoverflow.com/questions/47902295/what-is-the-use-of-verbose-in-keras-while-validating-the-model
         self.verbose: int | bool = verbose
 
+    @property
+    def optimiser(self) -> Optimizer:
+        """The optimiser of the model, created on first use (@see _get_optimiser)
+
+        @since 1.5.0
+
+        @rtype: Optimizer
+        @return: The optimiser
+        """
+        if self._optimiser is None:
+            self._optimiser = BaseModel._get_optimiser(self.optimiser_name, self.learning_rate)
+        return self._optimiser
+
     def build_cnn(self):
         """Builds the CNN with a simple architecture
         The current architecture is as follows:
@@ -126,40 +242,41 @@ class BaseModel:
         Since we use one-hot vector for the expected output, we are using the categorical_crossentropy loss function.
 
         Note:
-            If the expected output was a singular value, then we would use the sparse_categorical_crossentropy
+            If the expected output is a singular value (sparse_labels), then the sparse_categorical_crossentropy is used instead
         """
-        # Determining the input shape
-        input_shape = (self.height, self.width, self.depth)
-
-        self.model = models.Sequential()
-
-        # Block - Conv2D, Conv2D, AveragePooling
-        self.model.add(
-            layers.Conv2D(
-                32,
-                (3, 3),
-                padding="same",
-                activation=self.activation_func,
-                input_shape=input_shape,
+        with self._precision_scope():
+            # Determining the input shape
+            input_shape = (self.height, self.width, self.depth)
+
+            self.model = models.Sequential()
+
+            # Block - Conv2D, Conv2D, AveragePooling
+            self.model.add(
+                layers.Conv2D(
+                    32,
+                    (3, 3),
+                    padding="same",
+                    activation=self.activation_func,
+                    input_shape=input_shape,
+                )
             )
-        )
-        self.model.add(
-            layers.Conv2D(32, (3, 3), padding="same", activation=self.activation_func)
-        )
-        self.model.add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
+            self.model.add(
+                layers.Conv2D(32, (3, 3), padding="same", activation=self.activation_func)
+            )
+            self.model.add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
 
-        # Block - Conv2D, Conv2D, AveragePooling
-        self.model.add(
-            layers.Conv2D(64, (3, 3), padding="same", activation=self.activation_func)
-        )
-        self.model.add(
-            layers.Conv2D(64, (3, 3), padding="same", activation=self.activation_func)
-        )
-        self.model.add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
+            # Block - Conv2D, Conv2D, AveragePooling
+            self.model.add(
+                layers.Conv2D(64, (3, 3), padding="same", activation=self.activation_func)
+            )
+            self.model.add(
+                layers.Conv2D(64, (3, 3), padding="same", activation=self.activation_func)
+            )
+            self.model.add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
 
-        # Flatten and Softmax
-        self.model.add(layers.Flatten())
-        self.model.add(layers.Dense(self.num_classes, activation="softmax"))
+            # Flatten and Softmax
+            self.model.add(layers.Flatten())
+            self.model.add(self._output_layer())
 
     def fit(
         self, x_train, y_train, x_val=None, y_val=None, num_epochs=None, callbacks=[]
@@ -168,13 +285,24 @@ class BaseModel:
         The model is trained with the number of epochs determined by the input.
         If None, then the num_epochs attributes is used.
 
+        The training (and validation) inputs can either be ndarrays or tf.data Datasets (@see dataset.py).
+        When a Dataset is given, it already yields (input, label) batches, so the matching y value is left as None.
+
+        The classes are encoded as one-hot vectors, or as integer class ids when sparse_labels is set.
+
+        When high_throughput is set, the largest batch size that fits in memory is used instead of batch_size
+        (@see find_max_batch_size), the learning rate is scaled linearly to match,
+        and the number of images processed per second is reported for every epoch.
+        The throughput is also reported when training with XLA or mixed precision,
+        to compare with training in float32 (@see benchmarks/bench_training_precision.py).
+
         @since 1.0.0
 
-        @param x_train (ndarray[List[List[int]]]): The training input values
-        @param y_train (ndarray[List[int]]):       The corresponding classes for every training input value encoded as one-hot vectors
+        @param x_train (ndarray[List[List[int]]] | Dataset): The training input values
+        @param y_train (ndarray[List[int]] | None):          The corresponding classes for every training input value (@see sparse_labels)
 
-        @param x_val (ndarray[List[List[int]]]): The validation input values
-        @param y_val (ndarray[List[int]]):       The corresponding classes for every validation input value encoded as one-hot vectors
+        @param x_val (ndarray[List[List[int]]] | Dataset): The validation input values
+        @param y_val (ndarray[List[int]] | None):          The corresponding classes for every validation input value (@see sparse_labels)
 
         @param num_epochs (int | None):    (Optional) The number of epochs to run during the training.
         @param callbacks (List[Callback]): (Optional) Callbacks to be used during training.
@@ -185,28 +313,107 @@ class BaseModel:
         """
         # Determining which number of epochs to use
         num_epochs = num_epochs or self.num_epochs
+        callbacks = [*callbacks]
+        is_dataset = isinstance(x_train, tf.data.Dataset)
+
+        # Determining which batch size (and learning rate) to use
+        batch_size = self.batch_size
+        if self.high_throughput:
+            batch_size = self.find_max_batch_size()
+            self.optimiser.learning_rate = (
+                self.learning_rate * batch_size / self.batch_size
+            )
+
+            if is_dataset:
+                x_train = x_train.unbatch().batch(batch_size)
+
+        if self.high_throughput or self.jit_compile or self.dtype_policy != "float32":
+            from callbacks import ThroughputLogger
+
+            callbacks.append(
+                ThroughputLogger(
+                    batch_size, None if is_dataset else len(x_train), self.verbose
+                )
+            )
 
         # Compiling and training the model
         self.model.compile(
             optimizer=self.optimiser,
-            loss="categorical_crossentropy",
+            loss=self._get_loss(),
             metrics=["accuracy"],
+            jit_compile=self.jit_compile,
         )
 
+        # Datasets are already batched
         self.history = self.model.fit(
-            x_train, y_train, validation_data= (x_val, y_val), epochs=num_epochs, verbose=self.verbose
+            x_train,
+            y_train,
+            batch_size=None if is_dataset else batch_size,
+            validation_data=BaseModel._get_validation_data(x_val, y_val),
+            epochs=num_epochs,
+            verbose=self.verbose,
+            callbacks=callbacks,
         )
 
         # Returning the History object computed from the .fit() function
         return self.history
 
-    def compute_accuracy(self, x_test, y_test) -> str:
+    def find_max_batch_size(self) -> int:
+        """Finds the largest batch size that fits in memory
+        Starting from batch_size, the batch size is doubled until either max_batch_size is reached
+        or a training step (forward and backward pass) runs out of memory.
+
+        The probing steps do not apply any gradients,
+        and the model's weights (including the Batch Normalisation statistics) are restored afterwards.
+
+        Note:
+            CPUs usually do not report running out of memory (the process gets killed instead),
+            so max_batch_size should be kept within the memory of the machine when training on CPU.
+
+        @since 1.1.0
+
+        @rtype: int
+        @return: The largest batch size that fits in memory
+        """
+        input_shape = (self.height, self.width, self.depth)
+        weights = self.model.get_weights()
+
+        batch_size = self.batch_size
+        candidate = self.batch_size
+
+        try:
+            while candidate <= self.max_batch_size:
+                x = tf.zeros((candidate, *input_shape))
+                y = tf.zeros(candidate, tf.int32)
+                if not self.sparse_labels:
+                    y = tf.one_hot(y, self.num_classes)
+
+                try:
+                    with tf.GradientTape() as tape:
+                        loss = keras.losses.get(self._get_loss())(
+                            y, self.model(x, training=True)
+                        )
+                    tape.gradient(loss, self.model.trainable_variables)
+                except tf.errors.ResourceExhaustedError:
+                    break
+
+                batch_size = candidate
+                candidate *= 2
+        finally:
+            self.model.set_weights(weights)
+
+        if self.verbose:
+            print(f"High throughput mode: using a batch size of {batch_size}")
+
+        return batch_size
+
+    def compute_accuracy(self, x_test, y_test=None) -> str:
         """Computes the accuracy of the model using a testing dataset
 
         @since 1.0.0
 
-        @param x_test(ndarray[List[List[int]]]): The testing input values
-        @param y_test(ndarray[List[int]]):       The corresponding classes for every testing input value encoded as one-hot vectors
+        @param x_test(ndarray[List[List[int]]] | Dataset): The testing input values
+        @param y_test(ndarray[List[int]] | None):          The corresponding classes for every testing input value (@see sparse_labels)
 
         @rtype: str
         @return: The testing loss and accuracy metrics
@@ -226,6 +433,104 @@ class BaseModel:
         )
         return res
 
+    def export_tflite(
+        self,
+        path: str,
+        representative_images=None,
+        quantisation: str = "int8",
+        num_calibration_samples: int = 200,
+    ) -> int:
+        """Exports the model as a TFLite model, for faster and smaller CPU inference
+        The quantisations are as follows:
+            int8:     weights and activations in int8, calibrated on representative_images.
+                      The input is raw uint8 pixel values, so the server passes its images as they are
+            dynamic:  weights in int8, activations quantised on the fly (no calibration needed)
+            float32:  no quantisation
+
+        The calibration images are evenly spaced over representative_images (e.g. the training images),
+        so every class of a class-sorted dataset is represented.
+
+        @since 1.4.0
+
+        @raise ValueError: When the quantisation is unknown, or when int8 is used without representative images
+
+        @param path(str):                       The file path to save the TFLite model to (e.g., model.tflite)
+        @param representative_images(ndarray):  (Optional) The calibration images. Required for int8
+        @param quantisation(str):               The quantisation, one of TFLITE_QUANTISATIONS
+        @param num_calibration_samples(int):    The number of calibration images
+
+        @rtype: int
+        @return: The size of the TFLite model in bytes
+        """
+        if quantisation not in TFLITE_QUANTISATIONS:
+            raise ValueError(
+                f"The quantisation must be one of {TFLITE_QUANTISATIONS}, got quantisation = '{quantisation}'."
+            )
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+
+        if quantisation != "float32":
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+        if quantisation == "int8":
+            if representative_images is None:
+                raise ValueError("int8 quantisation requires representative_images for calibration.")
+
+            indices = np.unique(
+                np.linspace(0, len(representative_images) - 1, num_calibration_samples).astype(int)
+            )
+
+            def representative_dataset():
+                for i in indices:
+                    yield [np.asarray(representative_images[i : i + 1], np.float32)]
+
+            converter.representative_dataset = representative_dataset
+            converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+            converter.inference_input_type = tf.uint8
+
+        tflite_model = converter.convert()
+        with open(path, "wb") as tflite_file:
+            tflite_file.write(tflite_model)
+
+        if self.verbose:
+            print(f"TFLite model ({quantisation}) saved to {path}: {len(tflite_model) / 1e6:.2f} MB")
+
+        return len(tflite_model)
+
+    def compute_tflite_accuracy(self, path: str, x_test, y_test) -> str:
+        """Computes the accuracy of an exported TFLite model, against the accuracy of the (float) model
+
+        @since 1.4.0
+
+        @see export_tflite
+
+        @param path(str):                          The file path of the TFLite model
+        @param x_test(ndarray[List[List[int]]]):   The testing input values
+        @param y_test(ndarray[List[int]]):         The corresponding classes for every testing input value (@see sparse_labels)
+
+        @rtype: str
+        @return: The float accuracy, the TFLite accuracy and their difference
+        """
+        labels = np.asarray(y_test) if self.sparse_labels else np.argmax(y_test, axis=1)
+
+        float_outputs = self.model.predict(x_test, batch_size=self.batch_size, verbose=0)
+        tflite_outputs = BaseModel._tflite_predict(path, x_test, self.batch_size)
+
+        float_accuracy = np.mean(np.argmax(float_outputs, axis=1) == labels)
+        tflite_accuracy = np.mean(np.argmax(tflite_outputs, axis=1) == labels)
+
+        # Print out and return the metric values in a singular string value
+        print(
+            res := "\n".join(
+                [
+                    f"float accuracy: {float_accuracy}",
+                    f"tflite accuracy: {tflite_accuracy}",
+                    f"accuracy delta: {tflite_accuracy - float_accuracy}",
+                ]
+            )
+        )
+        return res
+
     def summary(self):
         """Outputs the summary of the model"""
         print(self.model.summary())
@@ -234,7 +539,103 @@ class BaseModel:
         """Minor convenience function"""
         self.model.add(layer)
 
+    @contextlib.contextmanager
+    def _precision_scope(self):
+        """Context manager building the layers created within it with the model's dtype policy
+        Keras layers take the global dtype policy when they are created, so it is set for the duration of build_cnn only.
+
+        @since 1.3.0
+        """
+        previous_policy = keras.mixed_precision.global_policy()
+        keras.mixed_precision.set_global_policy(self.dtype_policy)
+        try:
+            yield
+        finally:
+            keras.mixed_precision.set_global_policy(previous_policy)
+
+    def _output_layer(self) -> layers.Dense:
+        """Generates the Softmax output layer
+        The layer always computes in float32, since the softmax (and the loss) are not accurate enough in bfloat16.
+
+        @since 1.3.0
+
+        @rtype: Dense
+        @return: The output layer
+        """
+        return layers.Dense(self.num_classes, activation="softmax", dtype="float32")
+
+    def _get_loss(self) -> str:
+        """Generates the name of the loss function matching the label encoding
+
+        @since 1.2.0
+
+        @rtype: str
+        @return: sparse_categorical_crossentropy for integer class ids, categorical_crossentropy for one-hot vectors
+        """
+        if self.sparse_labels:
+            return "sparse_categorical_crossentropy"
+
+        return "categorical_crossentropy"
+
     # Static Method
+    @staticmethod
+    def _get_validation_data(x_val, y_val):
+        """Generates the validation_data argument for keras.Model.fit
+
+        @since 1.0.0
+
+        @param x_val (ndarray[List[List[int]]] | Dataset | None): The validation input values
+        @param y_val (ndarray[List[int]] | None):                 The corresponding classes for every validation input value
+
+        @rtype: Tuple[ndarray, ndarray] | Dataset | None
+        @return: The validation data, or None if there is no validation data
+        """
+        # A Dataset already holds the labels
+        if x_val is None or isinstance(x_val, tf.data.Dataset):
+            return x_val
+
+        return (x_val, y_val)
+
+    @staticmethod
+    def _tflite_predict(path: str, x, batch_size: int = 32) -> np.ndarray:
+        """Runs a TFLite model over the input values, batch by batch
+        Quantised inputs and outputs are converted with the scale and zero point of the model.
+
+        @since 1.4.0
+
+        @param path(str):        The file path of the TFLite model
+        @param x(ndarray):       The input values
+        @param batch_size(int):  The size of each batch
+
+        @rtype: ndarray
+        @return: The model output for every input value
+        """
+        interpreter = tf.lite.Interpreter(model_path=path)
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+
+        outputs = []
+        for start in range(0, len(x), batch_size):
+            batch = np.asarray(x[start : start + batch_size], np.float32)
+            interpreter.resize_tensor_input(input_details["index"], batch.shape)
+            interpreter.allocate_tensors()
+
+            scale, zero_point = input_details["quantization"]
+            if scale:
+                info = np.iinfo(input_details["dtype"])
+                batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max)
+
+            interpreter.set_tensor(input_details["index"], batch.astype(input_details["dtype"]))
+            interpreter.invoke()
+            output = interpreter.get_tensor(output_details["index"])
+
+            scale, zero_point = output_details["quantization"]
+            if scale:
+                output = (output.astype(np.float32) - zero_point) * scale
+            outputs.append(output)
+
+        return np.concatenate(outputs)
+
     @staticmethod
     def _get_optimiser(optimiser_name: str, learning_rate: float) -> Optimizer:
         """Generates a Keras Optimiser based on the input name
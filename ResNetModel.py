@@ -16,12 +16,7 @@ Optimisations include:
 # Imports
 from __future__ import annotations
 
-import numpy as np
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers, models, activations
-
-from BaseModel import BaseModel
+from BaseModel import BaseModel, np, tf, keras, layers, models, activations
 
 # ============================================================================================================= #
 
@@ -54,7 +49,10 @@ class ResNetModel(BaseModel):
     Methods:
         build_cnn
         fit
+        find_max_batch_size
         compute_accuracy
+        export_tflite
+        compute_tflite_accuracy
         summary
 
     Private Method:
@@ -82,6 +80,11 @@ class ResNetModel(BaseModel):
         feature_maps: int = 32,
         batch_norm: bool = True,
         drop_rate: float = 0.2,
+        high_throughput: bool = False,
+        max_batch_size: int = 512,
+        sparse_labels: bool = False,
+        jit_compile: bool = False,
+        mixed_precision: bool = False,
     ) -> BaseModel:
         """Constructor for the BaseModel class
 
@@ -108,6 +111,14 @@ class ResNetModel(BaseModel):
         @param batch_norm(bool):  Boolean stating if Batch Normalisation is needed in the ResNet blocks
         @param drop_rate(float):  The dropout rate of the model for the Dropout layer
 
+        @param high_throughput(bool): Boolean stating if the largest batch size that fits in memory is used when training
+        @param max_batch_size(int):   The largest batch size considered in high throughput mode
+
+        @param sparse_labels(bool): Boolean stating if the classes are given as integer class ids instead of one-hot vectors
+
+        @param jit_compile(bool):     Boolean stating if the training step is compiled with XLA
+        @param mixed_precision(bool): Boolean stating if the layers compute in bfloat16, when the hardware supports it
+
         @rtype: ResNetModel
         @return: The new constructed ResNetModel instance
         """
@@ -124,6 +135,11 @@ class ResNetModel(BaseModel):
             num_epochs,
             learning_rate,
             verbose,
+            high_throughput,
+            max_batch_size,
+            sparse_labels,
+            jit_compile,
+            mixed_precision,
         )
 
         # Assigning new attributes
@@ -162,39 +178,39 @@ class ResNetModel(BaseModel):
         Note:
             If the expected output was a singular value, then we would use the sparse_categorical_crossentropy
         """
-        # Determining the input shape
-        input_shape = (self.height, self.width, self.depth)
+        with self._precision_scope():
+            # Determining the input shape
+            input_shape = (self.height, self.width, self.depth)
 
-        self.model = models.Sequential()
+            self.model = models.Sequential()
 
-        for i, feature_map in enumerate(self.feature_maps):
-            self._add(
-                layers.Conv2D(
-                    feature_map, (3, 3), padding="same", input_shape=input_shape
+            for i, feature_map in enumerate(self.feature_maps):
+                self._add(
+                    layers.Conv2D(
+                        feature_map, (3, 3), padding="same", input_shape=input_shape
+                    )
                 )
-            )
 
-            if self.batch_norm:
-                self._add(layers.BatchNormalization())
+                if self.batch_norm:
+                    self._add(layers.BatchNormalization())
 
-            self._add(layers.Activation(self.activation_func.lower()))
+                self._add(layers.Activation(self.activation_func.lower()))
 
-            self._add(layers.Conv2D(feature_map, (3, 3), padding="same"))
+                self._add(layers.Conv2D(feature_map, (3, 3), padding="same"))
 
-            if self.batch_norm:
-                self._add(layers.BatchNormalization())
+                if self.batch_norm:
+                    self._add(layers.BatchNormalization())
 
-            self._add(layers.Activation(self.activation_func.lower()))
+                self._add(layers.Activation(self.activation_func.lower()))
 
-            self._add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
+                self._add(layers.AveragePooling2D(pool_size=(2, 2), padding="same"))
 
-            self._add(layers.Dropout(self.drop_rate))
+                self._add(layers.Dropout(self.drop_rate))
 
-        # Flatten and Softmax
-        self.model.add(layers.Flatten())
-        self.model.add(layers.Dense(self.num_classes, activation="softmax"))
+            # Flatten and Softmax
+            self.model.add(layers.Flatten())
+            self.model.add(self._output_layer())
 
-    
 
 # ============================================================================================================= #
 
@@ -17,115 +17,13 @@ Optimisations include:
 # Imports
 from __future__ import annotations
 
-import numpy as np
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers, models, activations
-
-from ResNetModel import ResNetModel
+from ResNetModel import ResNetModel, np, tf, keras, layers, models, activations
 from constants import *
 
 # ============================================================================================================= #
 
 
 # Class
-class Residual(tf.keras.Model):
-    """Class representing a single Residual Block
-    A single block consists of the following layers:
-        Conv2D
-        BatchNormalisation
-        Activation
-
-        Conv2D
-        BatchNormalisation
-        SkipConnection (may be with Conv2D layer)
-        Activation
-
-        AveragePooling2D
-        Dropout
-
-    Note:
-        Documentation is using UK english. Normalisation refers to Normalization in TensorFlow
-
-    Attributes:
-        conv1 (Conv2D)
-        conv2 (Conv2D)
-
-        act1 (Activation)
-        act2 (Activation)
-
-        bn1 (BatchNormalisation)
-        bn2 (BatchNormalisation)
-
-        pool (AveragePooling2D)
-        drop_out (Dropout)
-    """
-
-    def __init__(
-        self,
-        num_channels,
-        use_conv=False,
-        activation_func=RELU,
-        drop_rate=0.2,
-        input_shape=None,
-    ):
-        super().__init__()
-        # Conv layers
-        self.conv1 = layers.Conv2D(
-            filters=num_channels, kernel_size=(3, 3), padding="same"
-        )
-
-        self.conv2 = layers.Conv2D(
-            filters=num_channels, kernel_size=(3, 3), padding="same"
-        )
-
-        # Activation
-        self.act1 = layers.Activation(activation_func)
-        self.act2 = layers.Activation(activation_func)
-
-        # Skip Connection
-        self.skip_conn = None
-        if use_conv:
-            self.skip_conn = layers.Conv2D(filters=num_channels, kernel_size=1)
-
-        # Batch Normalisation
-        self.bn1 = layers.BatchNormalization()
-        self.bn2 = layers.BatchNormalization()
-
-        # Ending
-        self.pool = layers.AveragePooling2D(pool_size=(2, 2), padding="same")
-        self.drop_out = layers.Dropout(drop_rate)
-
-    def call(self, X):
-        Y = self.act1(self.bn1(self.conv1(X)))
-        Y = self.bn2(self.conv2(Y))
-        if self.skip_conn:
-            X = self.skip_conn(X)
-        Y += X
-        Y = self.drop_out(self.pool(self.act2(Y)))
-        return Y
-
-
-class ResNetBlock(tf.keras.layers.Layer):
-    def __init__(
-        self, num_channels, num_residuals, first_block=False, input_shape=None, **kwargs
-    ):
-        super(ResNetBlock, self).__init__(**kwargs)
-        self.residual_layers = [
-            Residual(
-                num_channels,
-                use_conv=(i == 0 and not first_block),
-                input_shape=input_shape,
-            )
-            for i in range(num_residuals)
-        ]
-
-    def call(self, X):
-        for layer in self.residual_layers:
-            X = layer(X)
-        return X
-
-
 class SkipConnModel(ResNetModel):
     """A simple CNN Model class
 
@@ -153,7 +51,10 @@ class SkipConnModel(ResNetModel):
     Methods:
         build_cnn
         fit
+        find_max_batch_size
         compute_accuracy
+        export_tflite
+        compute_tflite_accuracy
         summary
 
     Private Method:
@@ -181,6 +82,11 @@ class SkipConnModel(ResNetModel):
         feature_maps: int = 32,
         batch_norm: bool = True,
         drop_rate: float = 0.2,
+        high_throughput: bool = False,
+        max_batch_size: int = 512,
+        sparse_labels: bool = False,
+        jit_compile: bool = False,
+        mixed_precision: bool = False,
     ) -> BaseModel:
         """Constructor for the BaseModel class
 
@@ -207,6 +113,14 @@ class SkipConnModel(ResNetModel):
         @param batch_norm(bool):  Boolean stating if Batch Normalisation is needed in the ResNet blocks
         @param drop_rate(float):  The dropout rate of the model for the Dropout layer
 
+        @param high_throughput(bool): Boolean stating if the largest batch size that fits in memory is used when training
+        @param max_batch_size(int):   The largest batch size considered in high throughput mode
+
+        @param sparse_labels(bool): Boolean stating if the classes are given as integer class ids instead of one-hot vectors
+
+        @param jit_compile(bool):     Boolean stating if the training step is compiled with XLA
+        @param mixed_precision(bool): Boolean stating if the layers compute in bfloat16, when the hardware supports it
+
         @rtype: ResNetModel
         @return: The new constructed ResNetModel instance
         """
@@ -227,6 +141,11 @@ class SkipConnModel(ResNetModel):
             feature_maps,
             batch_norm,
             drop_rate,
+            high_throughput,
+            max_batch_size,
+            sparse_labels,
+            jit_compile,
+            mixed_precision,
         )
 
     def build_cnn(self):
@@ -253,35 +172,52 @@ class SkipConnModel(ResNetModel):
         Note:
             If the expected output was a singular value, then we would use the sparse_categorical_crossentropy
         """
-        # Determining the input shape
-        input_shape = (self.height, self.width, self.depth)
-
-        self.model = models.Sequential(
-            [
-                tf.keras.layers.Conv2D(
-                    filters=32,
-                    kernel_size=(3, 3),
-                    padding="same",
-                    input_shape=input_shape,
-                ),
-                tf.keras.layers.BatchNormalization(),
-                tf.keras.layers.Activation(self.activation_func),
-            ]
-        )
+        from residual_layers import ResNetBlock
+
+        with self._precision_scope():
+            # Determining the input shape
+            input_shape = (self.height, self.width, self.depth)
+
+            self.model = models.Sequential(
+                [
+                    tf.keras.layers.Conv2D(
+                        filters=32,
+                        kernel_size=(3, 3),
+                        padding="same",
+                        input_shape=input_shape,
+                    ),
+                    tf.keras.layers.BatchNormalization(),
+                    tf.keras.layers.Activation(self.activation_func),
+                ]
+            )
 
-        for i, feature_map in enumerate(self.feature_maps):
-            self._add(
-                ResNetBlock(
-                    feature_map,
-                    1,
-                    first_block=not i,
-                    input_shape=input_shape if not i else None,
+            for i, feature_map in enumerate(self.feature_maps):
+                self._add(
+                    ResNetBlock(
+                        feature_map,
+                        1,
+                        first_block=not i,
+                        input_shape=input_shape if not i else None,
+                    )
                 )
-            )
 
-        # Flatten and Softmax
-        self._add(layers.Flatten())
-        self._add(layers.Dense(self.num_classes, activation="softmax"))
+            # Flatten and Softmax
+            self._add(layers.Flatten())
+            self._add(self._output_layer())
+
+
+# ============================================================================================================= #
+
+
+# Function
+def __getattr__(name: str):
+    """Imports Residual and ResNetBlock (@see residual_layers.py) on first use, since they import TensorFlow"""
+    if name in ("Residual", "ResNetBlock"):
+        import residual_layers
+
+        return getattr(residual_layers, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # ============================================================================================================= #
@@ -0,0 +1,178 @@
+""" FIT3162 - MCS13 Code
+This file contains the data augmentation functions for the face image datasets.
+Instead of adding translated copies of every image to the dataset up front (tripling its size),
+the augmentations are applied lazily to every batch while training runs:
+    - memory stays at 1x the dataset
+    - every epoch sees freshly drawn augmentations
+    - every augmentation is vectorised over the whole batch
+
+The augmentation returned by build_augmentation is passed to the input pipelines of dataset.py, e.g.
+    build_array_dataset(images, labels, num_classes, augmentation=build_augmentation())
+
+translate_batch is the NumPy equivalent of translate, for augmenting arrays outside of a tf.data pipeline.
+
+@author MCS13
+@version 1.1.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+import tensorflow as tf
+from numpy.typing import NDArray
+
+# ============================================================================================================= #
+
+# Constants
+# Translations are drawn from [MIN_TRANSLATION, MAX_TRANSLATION), as with np.random.randint(-5, 5)
+MIN_TRANSLATION = -5
+MAX_TRANSLATION = 5
+
+# ============================================================================================================= #
+
+
+# Functions
+def translate(images: tf.Tensor, dx: tf.Tensor, dy: tf.Tensor) -> tf.Tensor:
+    """Translates every image of a batch by its own offsets, wrapping around the edges
+    Image i is shifted the same way as np.roll(np.roll(images[i], dy[i], axis=0), dx[i], axis=1).
+
+    @since 1.0.0
+
+    @param images(Tensor): The batch of images, of shape (N, H, W, C)
+    @param dx(Tensor):     The lateral offset of every image, int32 of shape (N,)
+    @param dy(Tensor):     The vertical offset of every image, int32 of shape (N,)
+
+    @rtype: Tensor
+    @return: The translated images
+    """
+    shape = tf.shape(images)
+    height, width = shape[1], shape[2]
+
+    # Pixel i of the output is pixel (i - offset) of the input
+    rows = tf.math.floormod(tf.range(height)[tf.newaxis, :] - dy[:, tf.newaxis], height)
+    cols = tf.math.floormod(tf.range(width)[tf.newaxis, :] - dx[:, tf.newaxis], width)
+
+    images = tf.gather(images, rows, axis=1, batch_dims=1)
+    return tf.gather(images, cols, axis=2, batch_dims=1)
+
+
+def translate_batch(
+    images: NDArray, dx: NDArray, dy: NDArray, out: NDArray | None = None
+) -> NDArray:
+    """Translates every image of a batch by its own offsets, wrapping around the edges (NumPy)
+    Image i is shifted the same way as np.roll(np.roll(images[i], dy[i], axis=0), dx[i], axis=1).
+    Instead of two np.roll copies per image (and a copy to stack them), every image is written
+    straight into the output as its four wrapped-around blocks, so each pixel is copied once.
+
+    @since 1.1.0
+
+    @param images(ndarray):     The batch of images, of shape (N, H, W, C)
+    @param dx(ndarray):         The lateral offset of every image, of shape (N,)
+    @param dy(ndarray):         The vertical offset of every image, of shape (N,)
+    @param out(ndarray | None): (Optional) The preallocated buffer to write the translated images to.
+                                Must have the shape and dtype of images, and must not be images itself
+
+    @rtype: ndarray
+    @return: The translated images (out, if given)
+    """
+    height, width = images.shape[1:3]
+
+    if out is None:
+        out = np.empty_like(images)
+
+    for src, dst, x, y in zip(images, out, np.mod(dx, width), np.mod(dy, height)):
+        dst[y:, x:] = src[: height - y, : width - x]
+        dst[y:, :x] = src[: height - y, width - x :]
+        dst[:y, x:] = src[height - y :, : width - x]
+        dst[:y, :x] = src[height - y :, width - x :]
+
+    return out
+
+
+def random_translate(
+    images: tf.Tensor,
+    min_translation: int = MIN_TRANSLATION,
+    max_translation: int = MAX_TRANSLATION,
+    seed: int | None = None,
+) -> tf.Tensor:
+    """Translates every image of a batch laterally and vertically by random amounts
+
+    @since 1.0.0
+
+    @param images(Tensor):       The batch of images, of shape (N, H, W, C)
+    @param min_translation(int): The smallest offset (inclusive)
+    @param max_translation(int): The largest offset (exclusive)
+    @param seed(int | None):     (Optional) The seed used for the offsets
+
+    @rtype: Tensor
+    @return: The translated images
+    """
+    offsets = tf.random.uniform(
+        (2, tf.shape(images)[0]), min_translation, max_translation, tf.int32, seed=seed
+    )
+    return translate(images, offsets[0], offsets[1])
+
+
+def random_flip(images: tf.Tensor, seed: int | None = None) -> tf.Tensor:
+    """Flips half of the images of a batch left to right, at random
+
+    @since 1.0.0
+
+    @param images(Tensor):   The batch of images, of shape (N, H, W, C)
+    @param seed(int | None): (Optional) The seed used to pick the images
+
+    @rtype: Tensor
+    @return: The batch of images, some of them flipped
+    """
+    flip = tf.random.uniform((tf.shape(images)[0], 1, 1, 1), seed=seed) < 0.5
+    return tf.where(flip, tf.reverse(images, axis=[2]), images)
+
+
+def build_augmentation(
+    min_translation: int = MIN_TRANSLATION,
+    max_translation: int = MAX_TRANSLATION,
+    flip: bool = False,
+    seed: int | None = None,
+) -> Callable[[tf.Tensor, tf.Tensor], Tuple[tf.Tensor, tf.Tensor]]:
+    """Builds the augmentation stage of an input pipeline
+    The stage maps every (images, labels) batch to a batch of augmented images, with the labels unchanged.
+
+    @since 1.0.0
+
+    @param min_translation(int): The smallest offset (inclusive)
+    @param max_translation(int): The largest offset (exclusive). Translations are disabled if equal to min_translation
+    @param flip(bool):           Boolean stating if the images are flipped left to right at random.
+                                 Off by default, as the original augmentation only translated the images
+    @param seed(int | None):     (Optional) The seed used for the augmentations
+
+    @rtype: Callable[[Tensor, Tensor], Tuple[Tensor, Tensor]]
+    @return: The augmentation, to be used with Dataset.map on batches
+    """
+
+    def augment(images, labels):
+        if max_translation > min_translation:
+            images = random_translate(images, min_translation, max_translation, seed)
+        if flip:
+            images = random_flip(images, seed)
+        return images, labels
+
+    return augment
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+- Batched random translations (with wraparound) and flips
+
+1.1.0
+- NumPy batched translation, writing into an optional preallocated buffer
+"""
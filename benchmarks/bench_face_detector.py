@@ -0,0 +1,148 @@
+""" FIT3162: Benchmark - Face Detector
+This file measures how the face detector settings trade detector time against crop agreement.
+
+Every setting is compared with the default detector, which crops like the original pipeline: the first face found
+at full resolution, with the original parameters (scaleFactor=1.1, minNeighbors=3).
+A crop agrees with the original one when both find no face, or when both boxes overlap with an IoU of at least --min-iou.
+
+Usage:
+    python benchmarks/bench_face_detector.py --images <directory of face photos> [--max-sides none,1280,960,640,480,320]
+                                             [--faces first,largest] [--scale-factors 1.1] [--min-size 0] [--repeat 3]
+
+@author MCS13
+@version 1.1.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import itertools
+import time
+
+import cv2
+import numpy as np
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "my_app", "lib"))
+
+from detection import FaceDetector
+
+# ============================================================================================================= #
+
+# Constants
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def load_images(directory: str) -> list:
+    """Loads every image of a directory (recursively) as a BGR image"""
+    imgs = []
+    for root, _, files in os.walk(directory):
+        for file in sorted(files):
+            if file.lower().endswith(IMAGE_EXTENSIONS):
+                img = cv2.imread(os.path.join(root, file), cv2.IMREAD_COLOR)
+                if img is not None:
+                    imgs.append(img)
+    return imgs
+
+
+def iou(box_a, box_b) -> float:
+    """Computes the intersection over union of two (x, y, w, h) boxes"""
+    ax, ay, aw, ah = box_a
+    bx, by, bw, bh = box_b
+    inter_w = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    inter_h = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = inter_w * inter_h
+    return inter / (aw * ah + bw * bh - inter)
+
+
+def run(detector: FaceDetector, imgs: list, repeat: int):
+    """Runs a detector on every image
+
+    @rtype:  Tuple[List[Tuple[int] | None], ndarray]
+    @return: The box found in every image, the fastest detection time of every image in milliseconds
+    """
+    boxes = []
+    times = []
+    for img in imgs:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            box = detector.detect(img)
+            best = min(best, time.perf_counter() - start)
+        boxes.append(box)
+        times.append(1000 * best)
+    return boxes, np.array(times)
+
+
+def agreement(boxes, reference_boxes, min_iou: float) -> float:
+    """Computes the fraction of images whose box agrees with the reference box"""
+    agree = [
+        (box is None and ref is None)
+        or (box is not None and ref is not None and iou(box, ref) >= min_iou)
+        for box, ref in zip(boxes, reference_boxes)
+    ]
+    return float(np.mean(agree))
+
+
+def parse_max_side(value: str):
+    return None if value.lower() == "none" else int(value)
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--images", required=True, help="Directory of face photos")
+    parser.add_argument("--max-sides", default="none,1280,960,640,480,320")
+    parser.add_argument("--faces", default="first,largest", help="Which face is cropped (@see detection.FACE_CHOICES)")
+    parser.add_argument("--scale-factors", default="1.1")
+    parser.add_argument("--min-neighbors", type=int, default=3)
+    parser.add_argument("--min-size", type=int, default=0, help="Smallest face side in full-resolution pixels")
+    parser.add_argument("--min-iou", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    imgs = load_images(args.images)
+    print(f"{len(imgs)} images, mean size {np.mean([img.shape[1] for img in imgs]):.0f}x{np.mean([img.shape[0] for img in imgs]):.0f}\n")
+
+    reference = FaceDetector(scale_factor=1.1, min_neighbors=3)
+    reference_boxes, reference_times = run(reference, imgs, args.repeat)
+
+    print(f"{'max_side':>9} {'face':>8} {'scale':>6} {'mean ms':>9} {'p95 ms':>9} {'speedup':>8} {'agreement':>10}")
+    for max_side, face, scale_factor in itertools.product(
+        [parse_max_side(v) for v in args.max_sides.split(",")],
+        args.faces.split(","),
+        [float(v) for v in args.scale_factors.split(",")],
+    ):
+        detector = FaceDetector(
+            max_side=max_side,
+            face=face,
+            scale_factor=scale_factor,
+            min_neighbors=args.min_neighbors,
+            min_size=(args.min_size, args.min_size) if args.min_size else None,
+        )
+        boxes, times = run(detector, imgs, args.repeat)
+
+        print(
+            f"{str(max_side):>9} {face:>8} {scale_factor:>6} {times.mean():>9.2f} {np.percentile(times, 95):>9.2f} "
+            f"{reference_times.sum() / times.sum():>7.2f}x {agreement(boxes, reference_boxes, args.min_iou):>9.1%}"
+        )
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- Added the --faces option, the reference is the default (original) detector
+"""
@@ -0,0 +1,109 @@
+""" FIT3162: Benchmark - Import Time
+This file measures how long importing the model modules takes, and checks that it does not import TensorFlow.
+TensorFlow is only imported on first use (@see lazy_module.py), so tooling that only needs the model classes,
+their constants or constructors (e.g. hyperparameter tooling, test collection, config validation) starts quickly.
+
+Every module is imported in a new process, with a model constructed from its class, so nothing is cached between runs.
+TensorFlow itself is timed as a reference.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--max-seconds 1.0]
+
+The script exits with an error when a model module imports TensorFlow, or takes longer than --max-seconds to import,
+so it can guard against regressions (e.g. a new module-level "import tensorflow").
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import json
+import statistics
+import subprocess
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================================================================================= #
+
+# Constants
+# (module, class constructed after the import)
+MODULES = [
+    ("BaseModel", "BaseModel"),
+    ("ResNetModel", "ResNetModel"),
+    ("SkipConnModel", "SkipConnModel"),
+]
+
+# Run in a new process: imports a module, constructs a model, and reports if TensorFlow was imported
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+
+import importlib
+module = importlib.import_module(sys.argv[1])
+if sys.argv[2]:
+    getattr(module, sys.argv[2])(verbose=0)
+
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "tensorflow_imported": "tensorflow" in sys.modules,
+}))
+"""
+
+# ============================================================================================================= #
+
+
+# Helper Function
+def time_import(module: str, class_name: str = "") -> dict:
+    """Imports a module (and constructs a model of one of its classes) in a new process and returns its measurements"""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, module, class_name],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=1.0, help="Largest accepted import time of a model module")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<14} {'median s':>9} {'max s':>7} {'TensorFlow imported':>20}")
+    for module, class_name in [("tensorflow", ""), *MODULES]:
+        runs = [time_import(module, class_name) for _ in range(args.runs)]
+        seconds = [run["seconds"] for run in runs]
+        tensorflow_imported = any(run["tensorflow_imported"] for run in runs)
+        print(
+            f"{module:<14} {statistics.median(seconds):>9.3f} {max(seconds):>7.3f} {str(tensorflow_imported):>20}"
+        )
+
+        if module == "tensorflow":
+            continue
+        if tensorflow_imported:
+            failures.append(f"importing {module} imports TensorFlow")
+        if statistics.median(seconds) > args.max_seconds:
+            failures.append(f"importing {module} takes longer than {args.max_seconds}s")
+
+    if failures:
+        sys.exit("Regression: " + ", ".join(failures))
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,131 @@
+""" FIT3162: Benchmark - Serving Inference Latency
+This file compares the latency of keras.Model.predict against the compiled inference function (CompiledModel)
+used by the prediction server.
+
+Usage:
+    python benchmarks/bench_inference.py [--model my_app/lib/lfw_skipconn_model] [--runs 200] [--batch-size 1]
+
+If no model is given, a stand-in SkipConnModel with the same input signature is built and saved to a temporary directory.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import tensorflow as tf
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "my_app", "lib"))
+
+from SkipConnModel import SkipConnModel
+from constants import WIDTH, HEIGHT, DEPTH
+from inference import CompiledModel
+
+# ============================================================================================================= #
+
+# Constants
+STAND_IN_NUM_CLASSES = 100
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def save_stand_in_model(directory: str) -> str:
+    """Builds and saves an untrained SkipConnModel with the serving input signature
+
+    @param directory (str): The directory to save the model in
+
+    @rtype:  str
+    @return: The path of the saved model
+    """
+    stand_in = SkipConnModel(
+        input_width=WIDTH,
+        input_height=HEIGHT,
+        depth=DEPTH,
+        num_classes=STAND_IN_NUM_CLASSES,
+    )
+    stand_in.build_cnn()
+
+    model_path = os.path.join(directory, "stand_in_model")
+    stand_in.model.save(model_path)
+    return model_path
+
+
+def time_calls(fn, batch: np.ndarray, runs: int) -> np.ndarray:
+    """Times repeated calls of a prediction function
+
+    @param fn (Callable):     The prediction function
+    @param batch (ndarray):   The batch passed to every call
+    @param runs (int):        The number of timed calls
+
+    @rtype:  ndarray
+    @return: The latency of every call in milliseconds
+    """
+    # Untimed call, so tracing and first-call costs are excluded
+    fn(batch)
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(batch)
+        latencies.append(1000 * (time.perf_counter() - start))
+
+    return np.array(latencies)
+
+
+def report(name: str, latencies: np.ndarray):
+    """Prints the p50/p99 latency of a prediction function"""
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"{name:<24} p50: {p50:8.2f} ms   p99: {p99:8.2f} ms")
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras model")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = args.model or save_stand_in_model(tmp_dir)
+
+        compiled_model = CompiledModel(model_path)
+        keras_model = tf.keras.models.load_model(model_path)
+
+        batch = np.random.randint(
+            0, 256, (args.batch_size, *compiled_model.input_shape), np.uint8
+        )
+
+        # First request latency, including the tracing cost that warm_up() moves to startup
+        cold_model = CompiledModel(model_path)
+        start = time.perf_counter()
+        cold_model.predict(batch)
+        print(f"Cold first call:         {1000 * (time.perf_counter() - start):8.2f} ms")
+
+        report(
+            "keras.Model.predict",
+            time_calls(lambda x: keras_model.predict(x, verbose=0), batch, args.runs),
+        )
+        report("CompiledModel.predict", time_calls(compiled_model.predict, batch, args.runs))
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,299 @@
+""" FIT3162: Benchmark - Load Test of the Prediction API
+This file load tests the /predict endpoint of the prediction server, so serving changes can be judged on numbers.
+
+It starts the server in a separate process, replays a corpus of images as /predict requests
+from a fixed number of concurrent clients (each with its own keep-alive connection, sending its next request
+as soon as it gets a response), and reports the throughput (req/s) and the p50/p95/p99 latency of every concurrency.
+It then reports how the time of a request splits across the decode, Haar detection, sharpen, resize, inference
+and preview encoding stages: as timed by the server under load (from its /metrics endpoint), and with the corpus run
+through the same stages in this process, one image at a time.
+
+Usage:
+    python benchmarks/bench_load.py [--model my_app/lib/lfw_skipconn_model] [--images <directory>]
+                                    [--server flask|gunicorn|async] [--concurrency 1,4,16]
+                                    [--duration 10] [--preview png] [--cache]
+
+--images is a directory (searched recursively) of .jpg/.jpeg/.png face images. Without it, synthetic images are used.
+If no model is given, a stand-in SkipConnModel with the same input signature as lfw_skipconn_model is built
+and saved to a temporary directory. The result cache of the server is disabled unless --cache is given,
+since the corpus is replayed many times.
+Every other server setting can be passed as an MCS13_ environment variable (@see app.DEFAULT_CONFIG).
+
+@author MCS13
+@version 1.2.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import base64
+import http.client
+import json
+import subprocess
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.join(ROOT_DIR, "my_app", "lib")
+sys.path.append(ROOT_DIR)
+sys.path.append(LIB_DIR)
+
+from bench_inference import save_stand_in_model
+
+# ============================================================================================================= #
+
+# Constants
+HOST = "127.0.0.1"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+NUM_SYNTHETIC_IMAGES = 16
+SYNTHETIC_SIZE = (960, 1280)
+STARTUP_TIMEOUT = 180
+
+# Commands starting each server on a port
+SERVERS = {
+    "flask": lambda port: [
+        sys.executable, "-c", f"from app import create_app; create_app().run(host='{HOST}', port={port}, threaded=True)"
+    ],
+    "gunicorn": lambda port: [
+        sys.executable, "-m", "gunicorn", "app:create_app()", "--worker-class", "gthread",
+        "--workers", "1", "--threads", os.environ.get("MCS13_THREADS", "4"),
+        "--bind", f"{HOST}:{port}", "--timeout", "120",
+    ],
+    "async": lambda port: [sys.executable, "async_app.py", "--host", HOST, "--port", str(port)],
+}
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def load_corpus(directory: str | None) -> list:
+    """Loads the encoded images of a directory (searched recursively), or generates synthetic ones
+
+    @rtype: List[bytes]
+    @return: The encoded image files
+    """
+    if directory is None:
+        rng = np.random.default_rng(0)
+        return [
+            cv2.imencode(".jpg", cv2.GaussianBlur(rng.integers(0, 256, (*SYNTHETIC_SIZE, 3), dtype=np.uint8), (9, 9), 0))[1].tobytes()
+            for _ in range(NUM_SYNTHETIC_IMAGES)
+        ]
+
+    corpus = []
+    for root, _, files in os.walk(directory):
+        for file in sorted(files):
+            if file.lower().endswith(IMAGE_EXTENSIONS):
+                with open(os.path.join(root, file), "rb") as image_file:
+                    corpus.append(image_file.read())
+    return corpus
+
+
+def start_server(server: str, port: int, env: dict) -> subprocess.Popen:
+    """Starts a server process and waits until it answers
+    The server logs go to a temporary file, only read if the server fails to start. A pipe would fill up under load
+    (the werkzeug server logs every request), and block the server once nothing reads it.
+
+    @raise RuntimeError: When the server exits or does not answer within STARTUP_TIMEOUT seconds
+    """
+    with tempfile.TemporaryFile() as log:
+        process = subprocess.Popen(SERVERS[server](port), cwd=LIB_DIR, env=env, stdout=subprocess.DEVNULL, stderr=log)
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                log.seek(0)
+                raise RuntimeError(f"The {server} server exited:\n{log.read().decode(errors='replace')[-2000:]}")
+            try:
+                connection = http.client.HTTPConnection(HOST, port, timeout=5)
+                connection.request("GET", "/names")
+                connection.getresponse().read()
+                # The server keeps writing to its own handle of the (deleted) file
+                return process
+            except OSError:
+                time.sleep(0.5)
+
+        process.terminate()
+        raise RuntimeError(f"The {server} server did not start within {STARTUP_TIMEOUT}s")
+
+
+def run_load(port: int, bodies: list, concurrency: int, duration: float) -> dict:
+    """Sends /predict requests from concurrent clients for a duration
+
+    @rtype: dict
+    @return: The number of requests and errors, the req/s, and the latencies in milliseconds
+    """
+    latencies, errors = [], []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    end = start + duration
+
+    def client(index):
+        connection = http.client.HTTPConnection(HOST, port, timeout=120)
+        i = index
+        while time.perf_counter() < end:
+            body = bodies[i % len(bodies)]
+            i += concurrency
+
+            sent = time.perf_counter()
+            try:
+                connection.request("POST", "/predict", body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection(HOST, port, timeout=120)
+                ok = False
+
+            with lock:
+                (latencies if ok else errors).append(1000 * (time.perf_counter() - sent))
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "req_per_sec": len(latencies) / elapsed,
+        "latencies": np.array(latencies),
+    }
+
+
+def server_stage_times(port: int) -> dict:
+    """Reads the stage timings of the server from its /metrics endpoint
+
+    @rtype: dict
+    @return: The mean milliseconds of every stage
+    """
+    connection = http.client.HTTPConnection(HOST, port, timeout=30)
+    connection.request("GET", "/metrics")
+    metrics = connection.getresponse().read().decode()
+
+    sums, counts = {}, {}
+    for line in metrics.splitlines():
+        for suffix, values in (("_sum", sums), ("_count", counts)):
+            prefix = f"mcs13_stage_duration_seconds{suffix}{{stage=\""
+            if line.startswith(prefix):
+                stage, value = line[len(prefix):].split('"} ')
+                values[stage] = float(value)
+
+    return {stage: 1000 * sums[stage] / counts[stage] for stage in sums if counts[stage]}
+
+
+def stage_times(model_path: str, corpus: list, preview: str, runs: int) -> dict:
+    """Runs the corpus through the stages of the /predict pipeline, with the server settings (MCS13_ variables)
+
+    @rtype: dict
+    @return: The mean milliseconds of every stage
+    """
+    from app import INPUT_SHAPE, add_preview, create_app, decode_image, sharpen
+
+    service = create_app({"MODEL_PATH": model_path}).extensions["face_recognition"]
+    resize_first = service.preprocessing_order == "resize_sharpen"
+    stages = {stage: [] for stage in ("decode", "detect", "sharpen", "resize", "inference", "encode")}
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        stages[stage].append(1000 * (time.perf_counter() - start))
+        return result
+
+    for _ in range(runs):
+        for encoded in corpus:
+            img = timed("decode", decode_image, encoded)
+            img = timed("detect", service.face_detector.crop, img)
+            if resize_first:
+                img = timed("resize", cv2.resize, img, INPUT_SHAPE[1::-1])
+                input = img = timed("sharpen", sharpen, img)
+            else:
+                img = timed("sharpen", sharpen, img)
+                input = timed("resize", cv2.resize, img, INPUT_SHAPE[1::-1])
+            timed("inference", service.registry.predict, input[None])
+            timed("encode", lambda: json.dumps(add_preview({}, img, preview)))
+
+    return {stage: float(np.mean(times)) for stage, times in stages.items()}
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras (or .tflite) model")
+    parser.add_argument("--images", help="Directory of face images to replay")
+    parser.add_argument("--server", choices=SERVERS, default="flask")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma separated numbers of concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load for every concurrency")
+    parser.add_argument("--preview", default="png", choices=("png", "jpeg", "none"))
+    parser.add_argument("--cache", action="store_true", help="Keep the result cache of the server enabled")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--stage-runs", type=int, default=3, help="Passes over the corpus for the stage timings")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.images)
+    bodies = [
+        json.dumps({"base64_bytes": base64.b64encode(encoded).decode(), "preview": args.preview}).encode()
+        for encoded in corpus
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = os.path.abspath(args.model) if args.model else save_stand_in_model(tmp_dir)
+
+        env = dict(os.environ, MCS13_MODEL_PATH=model_path)
+        if not args.cache:
+            env["MCS13_RESULT_CACHE_MAX_ENTRIES"] = "0"
+            os.environ["MCS13_RESULT_CACHE_MAX_ENTRIES"] = "0"
+
+        print(f"{len(corpus)} images, {args.server} server, preview {args.preview}, {args.duration:.0f}s per concurrency\n")
+        server = start_server(args.server, args.port, env)
+        try:
+            # Untimed requests, so the first-request costs are excluded
+            run_load(args.port, bodies, 1, 1.0)
+
+            print(f"{'concurrency':>11} {'requests':>9} {'errors':>7} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+            for concurrency in map(int, args.concurrency.split(",")):
+                result = run_load(args.port, bodies, concurrency, args.duration)
+                p50, p95, p99 = np.percentile(result["latencies"], [50, 95, 99]) if result["requests"] else [np.nan] * 3
+                print(
+                    f"{concurrency:>11} {result['requests']:>9} {result['errors']:>7} {result['req_per_sec']:>7.1f} "
+                    f"{p50:>8.1f} {p95:>8.1f} {p99:>8.1f}"
+                )
+
+            # Under load, inference includes the wait for the micro-batch and every stage competes for the CPU
+            server_stages = server_stage_times(args.port)
+        finally:
+            server.terminate()
+            server.wait()
+
+        stages = stage_times(model_path, corpus, args.preview, args.stage_runs)
+        server_total, total = sum(server_stages.values()), sum(stages.values())
+        print(f"\n{'stage':<11} {'server mean ms':>15} {'share':>7} {'isolated mean ms':>17} {'share':>7}")
+        for stage, ms in stages.items():
+            server_ms = server_stages.get(stage, 0.0)
+            print(f"{stage:<11} {server_ms:>15.2f} {server_ms / server_total:>7.1%} {ms:>17.2f} {ms / total:>7.1%}")
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- Added the stage timings of the server, from its /metrics endpoint
+
+1.2.0
+- The server logs go to a temporary file instead of an unread pipe, which blocked the server once full
+"""
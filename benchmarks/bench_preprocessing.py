@@ -0,0 +1,140 @@
+""" FIT3162: Benchmark - Preprocessing Order
+This file compares the preprocessing orders of the prediction server (@see app.PREPROCESSING_ORDERS):
+sharpening the full-resolution face crop before resizing it ("sharpen_resize"),
+or only sharpening the resized 224x224 model input ("resize_sharpen").
+
+For every order, it reports the latency of the preprocessing and of the PNG encoding of the preview image,
+then the accuracy on the test split (or, without test images, the top-1 agreement with "sharpen_resize").
+
+Usage:
+    python benchmarks/bench_preprocessing.py [--model my_app/lib/lfw_skipconn_model] [--images RealWorldOccludedFaces-main/images/neutral]
+                                             [--runs 20] [--size 1280x960]
+
+--images is a directory with one sub-directory of images per person (@see dataset.list_image_files),
+named like the labels of the model (LABELS_PATH). Like in the notebook, a seeded random 20% of the images is the test split.
+Without it, the latency is measured on a synthetic --size image and the parity on synthetic images.
+If no model is given, a stand-in SkipConnModel with the same input signature is built and saved to a temporary directory.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "my_app", "lib"))
+
+from app import PREPROCESSING_ORDERS, create_app
+from bench_inference import save_stand_in_model
+from dataset import list_image_files
+
+# ============================================================================================================= #
+
+# Constants
+TEST_SPLIT = 0.2
+SEED = 42
+NUM_SYNTHETIC_IMAGES = 32
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def test_split(directory: str, labels: list):
+    """Lists the test split of an image directory, keeping the people the model knows
+
+    @rtype: Tuple[List[str], ndarray]
+    @return: The image paths, and the label index of the model for every image
+    """
+    paths, class_ids, class_names = list_image_files(directory)
+    known = [(path, labels.index(class_names[i])) for path, i in zip(paths, class_ids) if class_names[i] in labels]
+
+    order = np.random.default_rng(SEED).permutation(len(known))
+    test = [known[i] for i in order[: int(round(TEST_SPLIT * len(known)))]]
+    return [path for path, _ in test], np.array([label for _, label in test])
+
+
+def synthetic_image(rng, height: int, width: int) -> np.ndarray:
+    """Generates a smooth random BGR image"""
+    return cv2.GaussianBlur(rng.integers(0, 256, (height, width, 3), dtype=np.uint8), (9, 9), 0)
+
+
+def median_ms(fn, runs: int) -> float:
+    """Times repeated calls of a function, and returns the median in milliseconds"""
+    fn()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(1000 * (time.perf_counter() - start))
+    return float(np.median(times))
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras model")
+    parser.add_argument("--images", help="Directory with one sub-directory of images per person")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--size", default="1280x960", help="Size (WIDTHxHEIGHT) of the synthetic images")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = args.model or save_stand_in_model(tmp_dir)
+        app = create_app({"MODEL_PATH": model_path})
+        service = app.extensions["face_recognition"]
+
+        rng = np.random.default_rng(SEED)
+        width, height = map(int, args.size.split("x"))
+        if args.images:
+            paths, y_test = test_split(args.images, service.labels)
+            images = [cv2.imread(path, cv2.IMREAD_COLOR) for path in paths]
+            print(f"Test split: {len(images)} images of {args.images}")
+        else:
+            images = [synthetic_image(rng, height, width) for _ in range(NUM_SYNTHETIC_IMAGES)]
+            y_test = None
+            print(f"{len(images)} synthetic {width}x{height} images")
+
+        # The largest image is used for the latency, like a full-resolution phone upload
+        latency_image = max(images, key=lambda img: img.size)
+
+        predictions = {}
+        column = "accuracy" if y_test is not None else "top-1 agreement"
+        print(f"\n{'order':<16} {'preprocess ms':>14} {'preview png ms':>15} {'total ms':>9} {column:>16}")
+        for order in PREPROCESSING_ORDERS:
+            service.preprocessing_order = order
+
+            preprocess_ms = median_ms(lambda: service.preprocess(latency_image), args.runs)
+            _, preview = service.preprocess(latency_image)
+            preview_ms = median_ms(lambda: cv2.imencode(".png", preview), args.runs)
+
+            predictions[order] = np.array(
+                [np.argmax(service.registry.predict(service.preprocess(img)[0][None])) for img in images]
+            )
+            reference = y_test if y_test is not None else predictions[PREPROCESSING_ORDERS[0]]
+            score = np.mean(predictions[order] == reference)
+
+            print(
+                f"{order:<16} {preprocess_ms:>14.2f} {preview_ms:>15.2f} {preprocess_ms + preview_ms:>9.2f} {score:>16.1%}"
+            )
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,117 @@
+""" FIT3162: Benchmark - Quantised TFLite Export
+This file compares the served Keras model (CompiledModel) with its TFLite exports (TFLiteModel):
+float32, dynamic range and int8 quantised. It reports the size on disk, the p50/p99 latency,
+and either the accuracy delta on a test split or, without test data, the top-1 agreement with the Keras model.
+
+Usage:
+    python benchmarks/bench_quantisation.py [--model my_app/lib/lfw_skipconn_model] [--cache RealWorldOccludedFaces-cache]
+                                            [--runs 50] [--batch-size 1] [--threads 1]
+
+--cache is a dataset cache (@see dataset.build_dataset_cache) with 224x224 images, matching the classes of the model.
+Its first 80% are used for calibration and the last 20% as the test split.
+If no model is given, a stand-in SkipConnModel with the same input signature is built and saved to a temporary directory.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import tempfile
+
+import numpy as np
+import tensorflow as tf
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "my_app", "lib"))
+
+from BaseModel import BaseModel, TFLITE_QUANTISATIONS
+from bench_inference import save_stand_in_model, time_calls
+from constants import RESIZED_SHAPE
+from dataset import load_dataset_cache
+from inference import CompiledModel, TFLiteModel
+
+# ============================================================================================================= #
+
+# Constants
+NUM_STAND_IN_IMAGES = 64
+TRAIN_SPLIT = 0.8
+
+# ============================================================================================================= #
+
+
+# Helper Function
+def directory_size(path: str) -> int:
+    """Computes the size of a file, or of all files of a directory, in bytes"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras model")
+    parser.add_argument("--cache", help="Dataset cache directory, for calibration and the test split")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=None, help="Threads of the TFLite interpreter")
+    args = parser.parse_args()
+
+    if args.cache:
+        images, labels, _ = load_dataset_cache(args.cache, RESIZED_SHAPE)
+        num_train = int(TRAIN_SPLIT * len(images))
+        x_train, x_test, y_test = images[:num_train], images[num_train:], labels[num_train:]
+    else:
+        x_train = np.random.randint(0, 256, (NUM_STAND_IN_IMAGES, *RESIZED_SHAPE[::-1], 3), np.uint8)
+        x_test, y_test = x_train, None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = args.model or save_stand_in_model(tmp_dir)
+
+        # Wraps the saved model, to use the export of BaseModel
+        compiled_model = CompiledModel(model_path)
+        exporter = BaseModel(verbose=0, sparse_labels=True)
+        exporter.model = compiled_model.model
+
+        backends = {"keras (CompiledModel)": (compiled_model, directory_size(model_path))}
+        for quantisation in TFLITE_QUANTISATIONS:
+            path = os.path.join(tmp_dir, f"model_{quantisation}.tflite")
+            size = exporter.export_tflite(path, x_train, quantisation)
+            backends[f"tflite {quantisation}"] = (TFLiteModel(path, num_threads=args.threads), size)
+
+        batch = np.random.randint(0, 256, (args.batch_size, *compiled_model.input_shape), np.uint8)
+        reference = compiled_model.predict(np.asarray(x_test, np.uint8)).argmax(axis=1)
+
+        column = "accuracy" if y_test is not None else "top-1 agreement"
+        print(f"\n{'backend':<22} {'size MB':>8} {'p50 ms':>8} {'p99 ms':>8} {column:>16}")
+        for name, (model, size) in backends.items():
+            model.warm_up(args.batch_size)
+            p50, p99 = np.percentile(time_calls(model.predict, batch, args.runs), [50, 99])
+
+            predictions = np.concatenate(
+                [model.predict(np.asarray(x_test[i : i + 1], np.uint8)) for i in range(len(x_test))]
+            ).argmax(axis=1)
+            score = np.mean(predictions == (y_test if y_test is not None else reference))
+
+            print(f"{name:<22} {size / 1e6:>8.2f} {p50:>8.2f} {p99:>8.2f} {score:>16.1%}")
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,133 @@
+""" FIT3162: Benchmark - Request Memory
+This file measures the memory use of the /predict pipeline of the prediction server under concurrent load:
+- the peak size of the numpy and OpenCV arrays alive at once, traced with tracemalloc
+  (TensorFlow tensors are not included)
+- the minor page faults per call, i.e. the allocator churn of a request: with a fixed glibc mmap threshold
+  (e.g. MALLOC_MMAP_THRESHOLD_=131072), every full-size temporary array is mapped and unmapped again,
+  and faults in all of its pages
+- the peak resident set size of the process (VmHWM)
+
+The decoding, preprocessing (face detection, sharpen, resize) and micro-batched prediction of
+FaceRecognitionService.predict_image are measured on their own first, then full /predict requests
+(with the result cache disabled), both from --concurrency threads at once. Linux only.
+
+Usage:
+    MALLOC_MMAP_THRESHOLD_=131072 python benchmarks/bench_request_memory.py [--model my_app/lib/lfw_skipconn_model] [--requests 200]
+                                                                     [--concurrency 4] [--size 1280x960]
+
+If no model is given, a stand-in SkipConnModel with the same input signature is built and saved to a temporary directory.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import base64
+import resource
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "my_app", "lib"))
+
+from app import create_app, decode_image
+from bench_inference import save_stand_in_model
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def peak_rss_mb() -> float:
+    """Gets the peak resident set size of the process (VmHWM) in MB"""
+    with open("/proc/self/status") as status:
+        line = next(line for line in status if line.startswith("VmHWM"))
+    return int(line.split()[1]) / 1024
+
+
+def measure(fn, num_calls: int, concurrency: int) -> dict:
+    """Calls a function from concurrent threads, and measures the time, the memory and the page faults
+
+    @rtype: dict
+    @return: The milliseconds and minor page faults per call, the peak size of the arrays alive at once (MB)
+             and the peak RSS (MB)
+    """
+    with ThreadPoolExecutor(concurrency) as pool:
+        # Untimed calls, so the first-call costs are excluded
+        list(pool.map(lambda _: fn(), range(concurrency)))
+
+        faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+        start = time.perf_counter()
+        list(pool.map(lambda _: fn(), range(num_calls)))
+        duration = time.perf_counter() - start
+        faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults
+
+        # Traced separately, since tracing slows the calls down
+        tracemalloc.start()
+        list(pool.map(lambda _: fn(), range(num_calls)))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "ms": 1000 * duration / num_calls,
+        "faults": faults / num_calls,
+        "peak_arrays_mb": peak / 1e6,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras model")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--size", default="1280x960", help="Size (WIDTHxHEIGHT) of the uploaded images")
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split("x"))
+    image = cv2.GaussianBlur(np.random.randint(0, 256, (height, width, 3), np.uint8), (9, 9), 0)
+    encoded = cv2.imencode(".png", image)[1].tobytes()
+    body = {"base64_bytes": base64.b64encode(encoded).decode(), "preview": "png"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = args.model or save_stand_in_model(tmp_dir)
+        app = create_app({"MODEL_PATH": model_path, "RESULT_CACHE_MAX_ENTRIES": 0})
+        service = app.extensions["face_recognition"]
+        local = app.test_client()
+
+        def predict_image():
+            service.predict_image(decode_image(encoded))
+
+        def predict():
+            assert local.post("/predict", json=body).status_code == 200
+
+        print(f"{args.requests} calls of a {width}x{height} image, {args.concurrency} threads\n")
+        print(f"{'stage':<14} {'ms/call':>8} {'page faults/call':>17} {'peak arrays MB':>15} {'peak RSS MB':>12}")
+        for name, fn in (("predict_image", predict_image), ("/predict", predict)):
+            result = measure(fn, args.requests, args.concurrency)
+            print(
+                f"{name:<14} {result['ms']:>8.2f} {result['faults']:>17.0f} "
+                f"{result['peak_arrays_mb']:>15.1f} {result['peak_rss_mb']:>12.0f}"
+            )
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
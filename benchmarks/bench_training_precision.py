@@ -0,0 +1,110 @@
+""" FIT3162: Benchmark - Training Precision
+This file compares the training speed of every model architecture in float32, with XLA (jit_compile),
+with bfloat16 mixed precision, and with both, to decide for each architecture if the options are worth it.
+
+Every configuration trains on the same random data. The first epoch includes tracing (and XLA compilation),
+so it is reported separately from the median time of the following epochs, which the speedup is computed from.
+
+Usage:
+    python benchmarks/bench_training_precision.py [--models base,resnet,skipconn] [--size 96]
+                                                  [--num-samples 512] [--batch-size 32] [--epochs 4]
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+
+import numpy as np
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseModel import BaseModel, ThroughputLogger, bfloat16_supported
+from ResNetModel import ResNetModel
+from SkipConnModel import SkipConnModel
+from constants import DEPTH
+
+# ============================================================================================================= #
+
+# Constants
+MODELS = {"base": BaseModel, "resnet": ResNetModel, "skipconn": SkipConnModel}
+NUM_CLASSES = 100
+
+# (name, jit_compile, mixed_precision)
+CONFIGS = [
+    ("float32", False, False),
+    ("xla", True, False),
+    ("bf16", False, True),
+    ("bf16 + xla", True, True),
+]
+
+# ============================================================================================================= #
+
+
+# Helper Function
+def epoch_times(model_class, jit_compile: bool, mixed_precision: bool, x, y, args):
+    """Trains a new model and returns the duration of every epoch in seconds"""
+    model = model_class(
+        input_width=args.size,
+        input_height=args.size,
+        depth=DEPTH,
+        num_classes=NUM_CLASSES,
+        batch_size=args.batch_size,
+        verbose=0,
+        sparse_labels=True,
+        jit_compile=jit_compile,
+        mixed_precision=mixed_precision,
+    )
+    model.build_cnn()
+    history = model.fit(
+        x,
+        y,
+        num_epochs=args.epochs,
+        callbacks=[ThroughputLogger(args.batch_size, len(x), verbose=False)],
+    )
+    return history.history["epoch_time"]
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--models", default="base,resnet,skipconn")
+    parser.add_argument("--size", type=int, default=96)
+    parser.add_argument("--num-samples", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=4)
+    args = parser.parse_args()
+
+    x = np.random.randint(0, 256, (args.num_samples, args.size, args.size, DEPTH)).astype(np.float32)
+    y = np.random.randint(0, NUM_CLASSES, args.num_samples).astype(np.int32)
+
+    print(f"bfloat16 supported: {bfloat16_supported()}")
+    print(f"{args.num_samples} images of {args.size}x{args.size}, batch size {args.batch_size}\n")
+
+    print(f"{'model':>9} {'config':>11} {'first epoch s':>14} {'epoch s':>8} {'speedup':>8}")
+    for model_name in args.models.split(","):
+        baseline = None
+        for config_name, jit_compile, mixed_precision in CONFIGS:
+            times = epoch_times(MODELS[model_name], jit_compile, mixed_precision, x, y, args)
+            steady = float(np.median(times[1:])) if len(times) > 1 else times[0]
+            baseline = baseline or steady
+
+            print(
+                f"{model_name:>9} {config_name:>11} {times[0]:>14.2f} {steady:>8.2f} {baseline / steady:>7.2f}x"
+            )
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
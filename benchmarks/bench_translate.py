@@ -0,0 +1,89 @@
+""" FIT3162: Benchmark - Batched Translation
+This file compares the per-image np.roll translations of the original data augmentation
+with the vectorised translate_batch of augmentation.py.
+
+Every method translates every image of a batch laterally and vertically by its own random offsets.
+
+Usage:
+    python benchmarks/bench_translate.py [--batch-size 256] [--size 224] [--repeat 10]
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import time
+
+import numpy as np
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from augmentation import MIN_TRANSLATION, MAX_TRANSLATION, translate_batch
+from constants import DEPTH
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def roll_loop(images, dx, dy):
+    """Translates every image with two np.roll calls, as the original data augmentation did"""
+    return np.stack(
+        [np.roll(np.roll(image, y, axis=0), x, axis=1) for image, x, y in zip(images, dx, dy)]
+    )
+
+
+def timeit(fn, repeat: int) -> float:
+    """Returns the fastest run time of a function in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return 1000 * best
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--size", type=int, default=224)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    images = np.random.randint(
+        0, 256, (args.batch_size, args.size, args.size, DEPTH), np.uint8
+    )
+    dx = np.random.randint(MIN_TRANSLATION, MAX_TRANSLATION, args.batch_size)
+    dy = np.random.randint(MIN_TRANSLATION, MAX_TRANSLATION, args.batch_size)
+    out = np.empty_like(images)
+
+    assert np.array_equal(roll_loop(images, dx, dy), translate_batch(images, dx, dy))
+
+    results = {
+        "np.roll per image": timeit(lambda: roll_loop(images, dx, dy), args.repeat),
+        "translate_batch": timeit(lambda: translate_batch(images, dx, dy), args.repeat),
+        "translate_batch (out=)": timeit(
+            lambda: translate_batch(images, dx, dy, out=out), args.repeat
+        ),
+    }
+
+    print(f"{args.batch_size} images of {args.size}x{args.size}x{DEPTH}\n")
+    baseline = results["np.roll per image"]
+    for name, ms in results.items():
+        print(f"{name:>24}: {ms:8.2f} ms  ({baseline / ms:.2f}x)")
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
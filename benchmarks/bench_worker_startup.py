@@ -0,0 +1,127 @@
+""" FIT3162: Benchmark - Worker Startup
+This file measures how long a prediction server worker takes to start, and how much memory it uses,
+with every inference backend of my_app/lib/inference.py.
+
+Every backend is started in a new process, which creates the app (@see create_app) and answers one /predict_batch request.
+The startup time covers the imports, the model loading and its warm-up.
+The memory is the peak resident set size of the worker (VmHWM, Linux only).
+
+Usage:
+    python benchmarks/bench_worker_startup.py [--model my_app/lib/lfw_skipconn_model] [--tflite-model model.tflite]
+
+If no models are given, a stand-in SkipConnModel is built and saved to a temporary directory, and exported as an int8 TFLite model.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import argparse
+import json
+import subprocess
+import tempfile
+
+import numpy as np
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.join(ROOT_DIR, "my_app", "lib")
+
+# ============================================================================================================= #
+
+# Constants
+# Run in the worker process: creates the app, then answers one request with a random image
+WORKER_SCRIPT = """
+import base64, json, sys, time
+start = time.perf_counter()
+
+from app import create_app
+
+app = create_app({"MODEL_PATH": sys.argv[1], "MODEL_BACKEND": sys.argv[2]})
+startup = time.perf_counter() - start
+
+import cv2, numpy as np
+image = np.random.randint(0, 256, (480, 640, 3), np.uint8)
+body = {"images": [base64.b64encode(cv2.imencode(".png", image)[1]).decode()]}
+status = app.test_client().post("/predict_batch", json=body).status_code
+
+print(json.dumps({
+    "startup": startup,
+    "status": status,
+    "max_rss_mb": int(next(l for l in open("/proc/self/status") if l.startswith("VmHWM")).split()[1]) / 1024,
+    "tensorflow_imported": "tensorflow" in sys.modules,
+}))
+"""
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def save_stand_in_models(directory: str):
+    """Builds a stand-in SkipConnModel, saves it and exports it as an int8 TFLite model
+
+    @rtype:  Tuple[str, str]
+    @return: The path of the saved model, the path of the TFLite model
+    """
+    sys.path.append(ROOT_DIR)
+    from bench_inference import save_stand_in_model
+    from BaseModel import BaseModel
+    from constants import RESIZED_SHAPE, DEPTH
+    import tensorflow as tf
+
+    model_path = save_stand_in_model(directory)
+
+    exporter = BaseModel(verbose=0)
+    exporter.model = tf.keras.models.load_model(model_path)
+    tflite_path = os.path.join(directory, "stand_in_model.tflite")
+    calibration_images = np.random.randint(0, 256, (16, *RESIZED_SHAPE[::-1], DEPTH), np.uint8)
+    exporter.export_tflite(tflite_path, calibration_images)
+
+    return model_path, tflite_path
+
+
+def start_worker(model_path: str, backend: str) -> dict:
+    """Starts a worker process with a backend and returns its measurements"""
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT, model_path, backend],
+        cwd=LIB_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--model", help="Path to a saved Keras model")
+    parser.add_argument("--tflite-model", help="Path to a TFLite model")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path, tflite_path = args.model, args.tflite_model
+        if not (model_path and tflite_path):
+            model_path, tflite_path = save_stand_in_models(tmp_dir)
+
+        print(f"{'backend':<8} {'startup s':>10} {'max RSS MB':>11} {'TensorFlow imported':>20} {'status':>7}")
+        for backend, path in (("keras", model_path), ("tflite", tflite_path)):
+            worker = start_worker(path, backend)
+            print(
+                f"{backend:<8} {worker['startup']:>10.2f} {worker['max_rss_mb']:>11.0f} "
+                f"{str(worker['tensorflow_imported']):>20} {worker['status']:>7}"
+            )
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
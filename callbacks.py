@@ -0,0 +1,79 @@
+""" FIT3162 - MCS13 Code
+This file contains the Keras callbacks used when training the models (@see BaseModel.fit).
+It is only imported once training starts, since defining the callbacks imports TensorFlow.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import time
+
+from tensorflow import keras
+
+# ============================================================================================================= #
+
+
+# Class
+class ThroughputLogger(keras.callbacks.Callback):
+    """Keras Callback reporting the training throughput
+    The number of images processed per second and the duration in seconds are added to the logs of every epoch
+    (as "images_per_sec" and "epoch_time"), so they also end up in the History object returned by fit().
+
+    @since 1.0.0
+
+    Attributes:
+        batch_size (int):         The size of each training batch
+        num_samples (int | None): The number of training images, if known
+        verbose (int | bool):     Boolean stating if the throughput is printed
+    """
+
+    def __init__(
+        self, batch_size: int, num_samples: int | None = None, verbose: int | bool = True
+    ):
+        """Constructor for the ThroughputLogger class
+
+        @param batch_size(int):         The size of each training batch
+        @param num_samples(int | None): (Optional) The number of training images.
+                                        If None, every batch is assumed to be full
+        @param verbose(int | bool):     (Optional) Boolean stating if the throughput is printed
+        """
+        super().__init__()
+        self.batch_size = batch_size
+        self.num_samples = num_samples
+        self.verbose = verbose
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._num_batches = 0
+        self._start = time.perf_counter()
+
+    def on_train_batch_end(self, batch, logs=None):
+        self._num_batches += 1
+
+    def on_epoch_end(self, epoch, logs=None):
+        duration = time.perf_counter() - self._start
+        num_images = self._num_batches * self.batch_size
+        if self.num_samples is not None:
+            num_images = min(num_images, self.num_samples)
+
+        images_per_sec = num_images / duration
+        if logs is not None:
+            logs["images_per_sec"] = images_per_sec
+            logs["epoch_time"] = duration
+
+        if self.verbose:
+            print(f"Epoch {epoch + 1}: {images_per_sec:.1f} images/sec ({duration:.2f}s)")
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file, with ThroughputLogger (moved from BaseModel.py)
+"""
@@ -2,7 +2,7 @@
 This file contains constant values which are helpful throughout this repository
 
 @author Benjamin Leong Tjen Ho
-@version 1.0.0
+@version 1.1.0
 @since 29/03/2024
 """
 
@@ -11,6 +11,7 @@ This file contains constant values which are helpful throughout this repository
 # File paths
 DATASET_NAME_MAIN = "RealWorldOccludedFaces-main"
 DATASET_NAME_RESIZED = "RealWorldOccludedFaces-resized"
+DATASET_NAME_CACHE = "RealWorldOccludedFaces-cache"
 NEUTRAL_DIR = "images/neutral"
 
 # Image
@@ -36,4 +37,7 @@ if __name__ == "__main__":
 """ 
 1.0.0
 - Created file
+
+1.1.0
+- Added DATASET_NAME_CACHE
 """
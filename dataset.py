@@ -0,0 +1,399 @@
+""" FIT3162 - MCS13 Code
+This file contains the input pipeline functions for the face image datasets.
+Instead of loading every image into a single ndarray, the images are streamed from the
+dataset directory tree with a tf.data pipeline, so memory usage stays bounded regardless of the dataset size.
+
+The directory tree is expected to follow the layout of the RealWorldOccludedFaces dataset:
+    <directory>/<person name>/<image file>
+
+The images can also be decoded and resized once into a dataset cache (@see build_dataset_cache).
+The cache stores every resolution as one contiguous uint8 array file, which is memory-mapped when opened,
+so training and evaluation skip the per-file open/decode cost and only page in the images they use.
+
+Every pipeline can apply an augmentation stage to its batches (@see augmentation.build_augmentation).
+
+The labels of every pipeline are either one-hot vectors (label_mode="categorical", for categorical_crossentropy)
+or int32 class ids (label_mode="int", for sparse_categorical_crossentropy, @see BaseModel sparse_labels).
+
+@author MCS13
+@version 1.4.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import os
+from typing import Callable, List, Tuple
+
+import numpy as np
+import tensorflow as tf
+from numpy.typing import NDArray
+from PIL import Image
+
+from constants import *
+
+# ============================================================================================================= #
+
+# Constants
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Label encodings
+LABEL_MODES = ("categorical", "int")
+
+# Dataset cache file names
+CACHE_IMAGES_FILE = "images_{}x{}.npy"
+CACHE_LABELS_FILE = "labels.npy"
+CACHE_CLASSES_FILE = "classes.txt"
+
+# ============================================================================================================= #
+
+
+# Functions
+def list_image_files(directory: str) -> Tuple[List[str], List[int], List[str]]:
+    """Lists all image files of the dataset directory tree
+    Every sub-directory of the input directory is treated as a class (a person).
+    The sub-directories are sorted so that the class ids are consistent between runs and machines.
+
+    @since 1.0.0
+
+    @param directory(str): The directory containing one sub-directory per class
+
+    @rtype: Tuple[List[str], List[int], List[str]]
+    @return: file paths, class ids (one per file path), class names (indexed by class id)
+    """
+    class_names = sorted(
+        f for f in os.listdir(directory) if os.path.isdir(os.path.join(directory, f))
+    )
+
+    paths = []
+    labels = []
+
+    for class_id, class_name in enumerate(class_names):
+        class_path = os.path.join(directory, class_name)
+        for img_name in sorted(os.listdir(class_path)):
+            if img_name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.join(class_path, img_name))
+                labels.append(class_id)
+
+    return paths, labels, class_names
+
+
+def build_image_dataset(
+    paths: List[str],
+    labels: List[int],
+    num_classes: int,
+    resized_shape: Tuple[int, int] = RESIZED_SHAPE,
+    batch_size: int = 32,
+    shuffle: bool = True,
+    shuffle_buffer: int | None = None,
+    seed: int | None = None,
+    augmentation: Callable | None = None,
+    label_mode: str = "categorical",
+) -> tf.data.Dataset:
+    """Builds a streaming tf.data pipeline from image file paths
+    The pipeline is as follows:
+        shuffle (file paths only, so the buffer holds strings instead of images)
+        read + decode + resize (in parallel)
+        batch
+        augment (optional, in parallel)
+        prefetch
+
+    Only a few batches of decoded images are held in memory at any given time.
+    Labels are encoded as one-hot vectors by default, matching the categorical_crossentropy loss used by BaseModel.
+
+    @since 1.0.0
+
+    @param paths(List[str]):              The file paths of the images
+    @param labels(List[int]):             The class id of every image
+    @param num_classes(int):              The number of classes, used for the one-hot encoding
+    @param resized_shape(Tuple[int, int]): The (width, height) every image is resized to
+    @param batch_size(int):               The size of each batch
+    @param shuffle(bool):                 Boolean stating if the images are shuffled (every epoch)
+    @param shuffle_buffer(int | None):    (Optional) The shuffle buffer size. Defaults to the number of images
+    @param seed(int | None):              (Optional) The seed used for shuffling
+    @param augmentation(Callable | None): (Optional) The augmentation applied to every batch
+    @param label_mode(str):               The label encoding, "categorical" (one-hot) or "int" (class ids)
+
+    @rtype: Dataset
+    @return: A dataset of (images, labels) batches
+    """
+    width, height = resized_shape
+
+    def load_image(path, label):
+        image = tf.io.decode_image(
+            tf.io.read_file(path), channels=DEPTH, expand_animations=False
+        )
+        image = tf.image.resize(image, (height, width))
+        image.set_shape((height, width, DEPTH))
+        return image, encode_labels(label, num_classes, label_mode)
+
+    dataset = tf.data.Dataset.from_tensor_slices((paths, np.asarray(labels, np.int32)))
+
+    if shuffle:
+        dataset = dataset.shuffle(
+            shuffle_buffer or len(paths), seed=seed, reshuffle_each_iteration=True
+        )
+
+    dataset = dataset.map(load_image, num_parallel_calls=tf.data.AUTOTUNE).batch(batch_size)
+
+    return augment_batches(dataset, augmentation).prefetch(tf.data.AUTOTUNE)
+
+
+def image_dataset_from_directory(
+    directory: str,
+    resized_shape: Tuple[int, int] = RESIZED_SHAPE,
+    batch_size: int = 32,
+    shuffle: bool = True,
+    seed: int | None = None,
+    augmentation: Callable | None = None,
+    label_mode: str = "categorical",
+) -> Tuple[tf.data.Dataset, List[str]]:
+    """Builds a streaming tf.data pipeline straight from the dataset directory tree
+
+    @since 1.0.0
+
+    @see list_image_files
+    @see build_image_dataset
+
+    @param directory(str):                The directory containing one sub-directory per class
+    @param resized_shape(Tuple[int, int]): The (width, height) every image is resized to
+    @param batch_size(int):               The size of each batch
+    @param shuffle(bool):                 Boolean stating if the images are shuffled (every epoch)
+    @param seed(int | None):              (Optional) The seed used for shuffling
+    @param augmentation(Callable | None): (Optional) The augmentation applied to every batch
+    @param label_mode(str):               The label encoding, "categorical" (one-hot) or "int" (class ids)
+
+    @rtype: Tuple[Dataset, List[str]]
+    @return: The dataset of (images, labels) batches, the class names
+    """
+    paths, labels, class_names = list_image_files(directory)
+    dataset = build_image_dataset(
+        paths,
+        labels,
+        len(class_names),
+        resized_shape=resized_shape,
+        batch_size=batch_size,
+        shuffle=shuffle,
+        seed=seed,
+        augmentation=augmentation,
+        label_mode=label_mode,
+    )
+    return dataset, class_names
+
+
+def build_dataset_cache(
+    directory: str,
+    cache_dir: str,
+    resized_shapes: List[Tuple[int, int]] = RESIZED_SHAPES,
+):
+    """Builds the pre-resized dataset cache (run once)
+    Every image is decoded once and resized to every shape.
+    The cache directory then holds:
+        images_<width>x<height>.npy  (one per shape) uint8 array of shape (num_images, height, width, DEPTH)
+        labels.npy                   int32 array of the class id of every image
+        classes.txt                  the class names, one per line, indexed by class id
+
+    @since 1.1.0
+
+    @param directory(str):                      The directory containing one sub-directory per class
+    @param cache_dir(str):                      The directory to save the cache files in
+    @param resized_shapes(List[Tuple[int, int]]): The (width, height) shapes to store
+    """
+    paths, labels, class_names = list_image_files(directory)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # The arrays are written straight to disk, so the dataset never has to fit in memory
+    images = [
+        np.lib.format.open_memmap(
+            os.path.join(cache_dir, CACHE_IMAGES_FILE.format(*shape)),
+            mode="w+",
+            dtype=np.uint8,
+            shape=(len(paths), shape[1], shape[0], DEPTH),
+        )
+        for shape in resized_shapes
+    ]
+
+    for i, path in enumerate(paths):
+        with Image.open(path) as image:
+            image = image.convert("RGB")
+            for shape, shape_images in zip(resized_shapes, images):
+                shape_images[i] = np.asarray(image.resize(shape), np.uint8)
+
+    for shape_images in images:
+        shape_images.flush()
+
+    np.save(os.path.join(cache_dir, CACHE_LABELS_FILE), np.array(labels, np.int32))
+    with open(os.path.join(cache_dir, CACHE_CLASSES_FILE), "w") as classes_file:
+        classes_file.write("\n".join(class_names))
+
+
+def load_dataset_cache(
+    cache_dir: str, resized_shape: Tuple[int, int] = RESIZED_SHAPE
+) -> Tuple[NDArray, NDArray, List[str]]:
+    """Opens one resolution of the dataset cache
+    The images are memory-mapped (read-only), so opening the cache is instant
+    and images are only read from disk when they are used.
+
+    @since 1.1.0
+
+    @param cache_dir(str):                The directory of the cache files
+    @param resized_shape(Tuple[int, int]): The (width, height) shape to open
+
+    @rtype: Tuple[ndarray, ndarray, List[str]]
+    @return: images (memory-mapped), class ids, class names
+    """
+    images = np.load(
+        os.path.join(cache_dir, CACHE_IMAGES_FILE.format(*resized_shape)), mmap_mode="r"
+    )
+    labels = np.load(os.path.join(cache_dir, CACHE_LABELS_FILE))
+    with open(os.path.join(cache_dir, CACHE_CLASSES_FILE), "r") as classes_file:
+        class_names = classes_file.read().split("\n")
+
+    return images, labels, class_names
+
+
+def build_array_dataset(
+    images: NDArray,
+    labels: NDArray,
+    num_classes: int,
+    batch_size: int = 32,
+    shuffle: bool = True,
+    seed: int | None = None,
+    augmentation: Callable | None = None,
+    label_mode: str = "categorical",
+    indices: NDArray | None = None,
+) -> tf.data.Dataset:
+    """Builds a tf.data pipeline over (memory-mapped) image arrays
+    Passing a memory-mapped array straight to keras.Model.fit would copy the whole array into memory,
+    so the pipeline only gathers one batch of images at a time.
+    The indices of each batch are sorted, so the images are read from disk in order.
+
+    A split of the images (e.g. the training images) is given by its indices,
+    since indexing the memory-mapped array itself would copy the whole split into memory.
+
+    @since 1.1.0
+
+    @param images(ndarray):   The images, e.g. from load_dataset_cache
+    @param labels(ndarray):   The class id of every image
+    @param num_classes(int):  The number of classes, used for the one-hot encoding
+    @param batch_size(int):   The size of each batch
+    @param shuffle(bool):     Boolean stating if the images are shuffled (every epoch)
+    @param seed(int | None):  (Optional) The seed used for shuffling
+    @param augmentation(Callable | None): (Optional) The augmentation applied to every batch
+    @param label_mode(str):   The label encoding, "categorical" (one-hot) or "int" (class ids)
+    @param indices(ndarray | None): (Optional) The indices of the images to use. Defaults to every image
+
+    @rtype: Dataset
+    @return: A dataset of (images, labels) batches
+    """
+    height, width, depth = images.shape[1:]
+    labels = np.asarray(labels, np.int32)
+    indices = np.arange(len(images)) if indices is None else np.asarray(indices, np.int64)
+
+    def gather(indices):
+        indices = np.sort(indices)
+        return images[indices], labels[indices]
+
+    def load_batch(indices):
+        batch_images, batch_labels = tf.numpy_function(
+            gather, [indices], (tf.uint8, tf.int32)
+        )
+        batch_images.set_shape((None, height, width, depth))
+        batch_labels.set_shape((None,))
+        return tf.cast(batch_images, tf.float32), encode_labels(
+            batch_labels, num_classes, label_mode
+        )
+
+    dataset = tf.data.Dataset.from_tensor_slices(indices)
+
+    if shuffle:
+        dataset = dataset.shuffle(len(indices), seed=seed, reshuffle_each_iteration=True)
+
+    dataset = dataset.batch(batch_size).map(load_batch, num_parallel_calls=tf.data.AUTOTUNE)
+
+    return augment_batches(dataset, augmentation).prefetch(tf.data.AUTOTUNE)
+
+
+def encode_labels(labels: tf.Tensor, num_classes: int, label_mode: str) -> tf.Tensor:
+    """Encodes int32 class ids following the label mode
+
+    @since 1.3.0
+
+    @raise ValueError: When the label mode is not one of LABEL_MODES
+
+    @param labels(Tensor):   The class ids
+    @param num_classes(int): The number of classes, used for the one-hot encoding
+    @param label_mode(str):  The label encoding, "categorical" (one-hot) or "int" (class ids)
+
+    @rtype: Tensor
+    @return: The one-hot vectors, or the class ids unchanged
+    """
+    if label_mode not in LABEL_MODES:
+        raise ValueError(
+            f"The label mode must be one of {LABEL_MODES}, got label_mode = '{label_mode}'."
+        )
+
+    if label_mode == "int":
+        return labels
+
+    return tf.one_hot(labels, num_classes)
+
+
+def augment_batches(
+    dataset: tf.data.Dataset, augmentation: Callable | None = None
+) -> tf.data.Dataset:
+    """Applies an augmentation to every batch of a dataset
+    The augmentation runs lazily, so every epoch draws new augmentations without storing any augmented copies.
+
+    @since 1.2.0
+
+    @param dataset(Dataset):              The dataset of (images, labels) batches
+    @param augmentation(Callable | None): (Optional) The augmentation, e.g. from augmentation.build_augmentation
+
+    @rtype: Dataset
+    @return: The dataset of augmented batches, or the input dataset if there is no augmentation
+    """
+    if augmentation is None:
+        return dataset
+
+    return dataset.map(augmentation, num_parallel_calls=tf.data.AUTOTUNE)
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    # Builds the dataset cache, e.g.
+    #   python dataset.py RealWorldOccludedFaces-main/images/neutral RealWorldOccludedFaces-cache
+    import sys
+
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else f"{DATASET_NAME_MAIN}/{NEUTRAL_DIR}"
+    cache_dir = sys.argv[2] if len(sys.argv) > 2 else DATASET_NAME_CACHE
+
+    build_dataset_cache(source_dir, cache_dir)
+    print(f"Dataset cache of {RESIZED_SHAPES} saved in {cache_dir}")
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+- Streaming tf.data input pipeline built from the dataset directory tree
+
+1.1.0
+- Pre-resized dataset cache, stored as memory-mapped uint8 arrays
+- tf.data pipeline over (memory-mapped) image arrays
+
+1.2.0
+- Optional augmentation stage applied to every batch
+
+1.3.0
+- Labels as int32 class ids (label_mode="int") for sparse_categorical_crossentropy
+
+1.4.0
+- Pipelines over a split of the (memory-mapped) image arrays, given by its indices
+"""
@@ -0,0 +1,75 @@
+""" FIT3162 - MCS13 Code
+This file contains the LazyModule class.
+Importing TensorFlow takes several seconds, so the model modules (BaseModel, ResNetModel, SkipConnModel)
+refer to it through lazy modules, which only import it the first time one of its attributes is used, e.g.
+    tf = LazyModule("tensorflow")
+    tf.data.Dataset  # imports tensorflow here
+
+Importing the model modules (e.g. for their constants, constructors or _get_optimiser) then takes milliseconds,
+and TensorFlow is only loaded by the methods that need it, e.g. build_cnn or fit.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import importlib
+import types
+
+# ============================================================================================================= #
+
+
+# Class
+class LazyModule(types.ModuleType):
+    """A module that is only imported the first time one of its attributes is used
+    After the import, every attribute access is forwarded to the imported module.
+
+    Attributes:
+        __name__ (str): The full name of the module (e.g., tensorflow.keras.layers)
+
+    Methods:
+        is_loaded
+    """
+
+    def __init__(self, name: str) -> LazyModule:
+        """Constructor for the LazyModule class
+
+        @param name(str): The full name of the module to import
+
+        @rtype: LazyModule
+        @return: The new constructed LazyModule instance
+        """
+        super().__init__(name)
+        self._module = None
+
+    def is_loaded(self) -> bool:
+        """Checks if the module was imported already
+
+        @rtype: bool
+        @return: True if the module was imported
+        """
+        return self._module is not None
+
+    def __getattr__(self, attr: str):
+        # Only called for the attributes that are not set on the LazyModule itself
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -11,6 +11,10 @@ class SelectNamePage extends StatefulWidget {
 }
 
 class _SelectNamePageState extends State<SelectNamePage> {
+  // Names from the last successful request, revalidated with their ETag
+  static List<String>? _cachedNames;
+  static String? _namesETag;
+
   String? enteredName;
   List<String> names = [];
   String? message;
@@ -24,13 +28,23 @@ class _SelectNamePageState extends State<SelectNamePage> {
   Future<void> _fetchNames() async {
     const String url = 'https://2d4e-118-139-138-171.ngrok-free.app';
     // Get response and disable the web security
-    final response = await http.get(Uri.parse('$url/names'), headers: {"ngrok-skip-browser-warning": "69420"});
+    final response = await http.get(Uri.parse('$url/names'), headers: {
+      "ngrok-skip-browser-warning": "69420",
+      if (_namesETag != null) "If-None-Match": _namesETag!,
+    });
 
     if (response.statusCode == 200) {
       final jsonData = jsonDecode(response.body);
+      _cachedNames = jsonData['names'].cast<String>();
+      _namesETag = response.headers['etag'];
       // Set the names to the list
       setState(() {
-        names = jsonData['names'].cast<String>();
+        names = _cachedNames!;
+      });
+    } else if (response.statusCode == 304 && _cachedNames != null) {
+      // The names did not change since the last request
+      setState(() {
+        names = _cachedNames!;
       });
     } else {
       throw Exception('Failed to load names: unexpected response status code');
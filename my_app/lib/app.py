@@ -1,63 +1,697 @@
 import base64
+import binascii
 import flask
+import hashlib
+import hmac
+import json
 import os
-import tensorflow as tf
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import cv2
 
-app = flask.Flask(__name__) 
+from batcher import MicroBatcher
+from buffers import ThreadBuffers
+from cache import ResultCache
+from detection import DEFAULT_CASCADE_PATH, FaceDetector
+from inference import INPUT_SHAPE, backend_name, load_backend
+from metrics import CONTENT_TYPE, Histogram, MetricsWriter, StageTimer
+from registry import ModelRegistry
 
-@app.route('/predict', methods=['POST'])
-def predict():
+LIB_DIR = os.path.dirname(os.path.abspath(__file__))
 
-    img_data = flask.request.json['base64_bytes']
+# Default settings, each one can be overridden with an environment variable prefixed with MCS13_
+# e.g. MCS13_MAX_BATCH_SIZE=64
+DEFAULT_CONFIG = {
+    # A saved Keras model, or a .tflite file (e.g. int8 quantised with BaseModel.export_tflite)
+    'MODEL_PATH': os.path.join(LIB_DIR, 'lfw_skipconn_model'),
+    # The inference backend running the model: 'keras', 'tflite', or 'auto' to pick it from MODEL_PATH (@see inference.py)
+    'MODEL_BACKEND': 'auto',
+    'LABELS_PATH': os.path.join(LIB_DIR, 'lfw_names.txt'),
+    'NAMES_PATH': os.path.join(LIB_DIR, 'names.txt'),
+    'CASCADE_PATH': DEFAULT_CASCADE_PATH,
+
+    # Face detection settings (@see detection.FaceDetector)
+    # Sizes are (width, height) in full-resolution pixels, e.g. MCS13_DETECTION_MIN_SIZE='[40, 40]'
+    'DETECTION_SCALE_FACTOR': 1.1,
+    'DETECTION_MIN_NEIGHBORS': 3,
+    'DETECTION_MIN_SIZE': None,
+    'DETECTION_MAX_SIZE': None,
+    # Opt-in speed-ups, both of which can change the cropped face (check them with benchmarks/bench_face_detector.py):
+    # the longest image side detection runs at (None for full resolution, e.g. 640),
+    # and which face is cropped when several are found ('first' like the original pipeline, or 'largest')
+    'DETECTION_MAX_SIDE': None,
+    'DETECTION_FACE': 'first',
+
+    # Quality of the JPEG previews of the sharpened image
+    'PREVIEW_JPEG_QUALITY': 90,
+
+    # Order of the preprocessing steps after the face crop (@see PREPROCESSING_ORDERS)
+    # 'sharpen_resize' sharpens the full-resolution crop, 'resize_sharpen' only sharpens the resized model input,
+    # which is then also the preview image
+    'PREPROCESSING_ORDER': 'sharpen_resize',
+
+    # /predict_batch settings
+    'MAX_IMAGES_PER_REQUEST': 32,
+    'DEFAULT_TOP_K': 5,
+    'DETECTION_THREADS': os.cpu_count(),
+
+    # Seconds between checks of names.txt for changes
+    'NAMES_CHECK_INTERVAL': 1.0,
+
+    # Number of threads of the TFLite interpreter (None for the TFLite default)
+    'TFLITE_NUM_THREADS': None,
+
+    # Model hot-swap settings (@see registry.ModelRegistry)
+    # Seconds between checks of MODEL_PATH for a new model (e.g. saved by a ModelCheckpoint), None to never check
+    'MODEL_WATCH_INTERVAL': None,
+    # Token expected in the X-Admin-Token header of the /admin requests, None to disable them
+    'ADMIN_TOKEN': None,
+
+    # Cache of the /predict and /predict_image responses, keyed by the uploaded bytes and the model version
+    # (@see cache.ResultCache), MCS13_RESULT_CACHE_MAX_ENTRIES=0 disables it
+    'RESULT_CACHE_MAX_ENTRIES': 1024,
+    'RESULT_CACHE_MAX_MB': 64,
+    'RESULT_CACHE_TTL': 300.0,
+
+    # asyncio serving mode (@see async_app.py)
+    # Threads running the decoding, detection and prediction work, and the largest accepted request body
+    'ASYNC_WORKERS': os.cpu_count(),
+    'MAX_UPLOAD_MB': 32,
+
+    # Micro-batching settings
+    'MAX_BATCH_SIZE': 32,
+    'MAX_LATENCY_MS': 10.0,
+
+    # When True, the model is only loaded by FaceRecognitionService.load_model()
+    # Used by gunicorn.conf.py, since TensorFlow cannot be used before forking the workers
+    'DEFER_MODEL_LOADING': False,
+}
+
+api = flask.Blueprint('api', __name__)
+
+
+class NameList:
+    """The names served by /names, kept in memory
+    The file is only re-read when its modification time changes, checked at most every check_interval seconds.
+    The JSON response body and its ETag are computed once per (re)load, and swapped together.
+    If the file cannot be read (e.g. while it is being replaced), the last names read keep being served.
+    """
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._next_check = 0.0
+        self._reload()
+
+    def get(self):
+        """Returns the JSON response body and its ETag, reloading the file if it changed"""
+        now = time.monotonic()
+        if now >= self._next_check:
+            with self._lock:
+                if now >= self._next_check:
+                    self._next_check = now + self.check_interval
+                    try:
+                        if os.stat(self.path).st_mtime_ns != self._mtime:
+                            self._reload()
+                    except OSError:
+                        pass
+        return self._response
+
+    def _reload(self):
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, 'r') as names_file:
+            names = [name.strip() for name in names_file.readlines()]
+
+        body = json.dumps({'names': names}).encode()
+        # A single attribute, so get() never returns the body of one version with the ETag of another
+        self._response = (body, hashlib.sha1(body).hexdigest())
+        self._mtime = mtime
+
+
+class FaceRecognitionService:
+    """Everything a worker needs to serve predictions
+    The model, the Haar cascade and the name list are loaded once per worker, when the app is created.
+    The model is held by a ModelRegistry, so it can be replaced while serving (@see swap_model).
+    """
+
+    def __init__(self, config):
+        self.config = config
+        with open(config['LABELS_PATH'], 'r') as labels_file:
+            self.labels = labels_file.read().split('\n')
+        self.name_list = NameList(config['NAMES_PATH'], config['NAMES_CHECK_INTERVAL'])
+
+        self.face_detector = FaceDetector(
+            config['CASCADE_PATH'],
+            scale_factor=config['DETECTION_SCALE_FACTOR'],
+            min_neighbors=config['DETECTION_MIN_NEIGHBORS'],
+            min_size=config['DETECTION_MIN_SIZE'],
+            max_size=config['DETECTION_MAX_SIZE'],
+            max_side=config['DETECTION_MAX_SIDE'],
+            face=config['DETECTION_FACE'],
+        )
+        self.detection_pool = ThreadPoolExecutor(config['DETECTION_THREADS'])
+
+        if config['PREPROCESSING_ORDER'] not in PREPROCESSING_ORDERS:
+            raise ValueError(
+                f"PREPROCESSING_ORDER must be one of {PREPROCESSING_ORDERS}, got {config['PREPROCESSING_ORDER']!r}."
+            )
+        self.preprocessing_order = config['PREPROCESSING_ORDER']
+
+        # Reusable per-thread arrays for the sharpened images, model inputs and batches
+        self.buffers = ThreadBuffers()
+
+        # Durations of the stages of the predictions, and of the whole /predict and /predict_image predictions
+        # by cache outcome, served by /metrics
+        self.stage_timer = StageTimer()
+        self.request_timer = StageTimer()
+
+        self.registry = ModelRegistry(self.load_backend)
+        self.result_cache = ResultCache(
+            int(config['RESULT_CACHE_MAX_ENTRIES']),
+            int(config['RESULT_CACHE_MAX_MB'] * 1024 * 1024),
+            config['RESULT_CACHE_TTL'],
+        )
+        self.batcher = None
+        if not config['DEFER_MODEL_LOADING']:
+            self.load_model()
+
+    @property
+    def model(self):
+        """The model being served, or None before it is loaded"""
+        current = self.registry.current()
+        return current.model if current else None
+
+    @property
+    def ready(self):
+        """Whether the model is loaded and the micro-batcher started, i.e. predictions can be served
+        False until load_model() is done when DEFER_MODEL_LOADING is set (e.g. by a preloaded gunicorn worker)"""
+        return self.batcher is not None
+
+    def load_model(self):
+        """Loads and warms up the model, then starts the micro-batcher (and the watch of MODEL_PATH, if enabled)"""
+        if self.batcher is not None:
+            return
+
+        model_path = self.config['MODEL_PATH']
+        self.registry.load(model_path, self.config['MODEL_BACKEND'], wait=True)
+
+        # The batcher always runs the batches on the current model of the registry
+        self.batcher = MicroBatcher(self.registry.predict, self.config['MAX_BATCH_SIZE'], self.config['MAX_LATENCY_MS'])
+
+        if self.config['MODEL_WATCH_INTERVAL']:
+            self.registry.watch(model_path, self.config['MODEL_BACKEND'], float(self.config['MODEL_WATCH_INTERVAL']))
+
+    def swap_model(self, model_path, backend='auto', version=None):
+        """Loads and warms up a new model in the background, then swaps it in while the current one keeps serving
+
+        Returns the Future of the load (@see ModelRegistry.load)
+        """
+        return self.registry.load(model_path, backend, version)
+
+    def load_backend(self, model_path, backend):
+        """Loads a model with its inference backend (@see inference.load_backend)
+
+        Returns the model and the backend name
+        """
+        backend = backend_name(model_path, backend)
+
+        options = {}
+        if backend == 'tflite':
+            options['num_threads'] = self.config['TFLITE_NUM_THREADS']
+
+        return load_backend(model_path, backend, **options), backend
+
+    def stats(self):
+        """Returns the batching, model and result cache metrics served by /stats"""
+        return {
+            'batching': self.batcher.stats() if self.batcher is not None else None,
+            'model': self.registry.status(),
+            'cache': self.result_cache.stats(),
+        }
+
+    def metrics(self):
+        """Returns the stage timings, model, batching and result cache metrics served by /metrics,
+        in the Prometheus text format (@see metrics.MetricsWriter)"""
+        writer = MetricsWriter()
+
+        writer.histogram(
+            'stage_duration_seconds', 'Time spent in each stage of the predictions.',
+            [({'stage': stage}, histogram) for stage, histogram in self.stage_timer.histograms().items()],
+        )
+        writer.histogram(
+            'prediction_duration_seconds', 'Time spent on the /predict and /predict_image uploads, by cache outcome.',
+            [({'cache': outcome}, histogram) for outcome, histogram in self.request_timer.histograms().items()],
+        )
+
+        model = self.registry.status()
+        writer.gauge(
+            'model_info', 'The version and backend of the model being served.',
+            [({'version': model['version'], 'backend': model['backend']}, 1)],
+        )
+        writer.gauge(
+            'model_loaded_timestamp_seconds', 'When the model being served was loaded.', [({}, model['loaded_at'] or 0)]
+        )
+        writer.counter('model_loads', 'Models loaded since the start.', model['num_loads'])
+
+        if self.batcher is not None:
+            batching = self.batcher.stats()
+            # Powers of two up to the largest batch size
+            max_batch_size = self.batcher.max_batch_size
+            batch_sizes = Histogram({2 ** i for i in range(max_batch_size.bit_length())} | {max_batch_size})
+            for size, count in batching['batch_sizes'].items():
+                batch_sizes.observe(size, count)
+
+            writer.histogram('batch_size', 'Number of requests in each micro-batch.', [({}, batch_sizes)])
+            writer.gauge(
+                'batch_max_queue_wait_seconds', 'Longest time a request waited for its micro-batch.',
+                [({}, batching['max_queue_wait_ms'] / 1000)],
+            )
+
+        cache = self.result_cache.stats()
+        writer.counter('cache_hits', 'Result cache hits.', cache['hits'])
+        writer.counter('cache_misses', 'Result cache misses.', cache['misses'])
+        writer.counter('cache_evictions', 'Result cache entries evicted to make room.', cache['evictions'])
+        writer.counter('cache_expirations', 'Result cache entries expired.', cache['expirations'])
+        writer.gauge('cache_entries', 'Result cache entries.', [({}, cache['entries'])])
+        writer.gauge('cache_bytes', 'Size of the result cache entries.', [({}, cache['bytes'])])
+
+        return writer.text()
+
+    def predict_upload(self, upload, preview, base64_encoded=False):
+        """Predicts an uploaded image and serialises the response, with the sharpened image encoded in the preview format
+        The whole request pipeline runs on the calling thread, so it can run on any thread (or executor) of any server.
+
+        The serialised responses are cached by the hash of the uploaded bytes and the model version,
+        so repeated uploads skip the whole pipeline, including the base64 decoding and the JSON encoding
+
+        Returns the JSON response body, or None if the upload is not a valid image
+        """
+        start = time.perf_counter()
+        key = ResultCache.key(upload, self.registry.current().version, preview)
+
+        body = self.result_cache.get(key)
+        if body is not None:
+            self.request_timer.observe('hit', time.perf_counter() - start)
+            return body
+
+        with self.stage_timer.span('decode'):
+            try:
+                img = decode_image(base64.b64decode(upload) if base64_encoded else upload)
+            except binascii.Error:
+                img = None
+        if img is None:
+            return None
+
+        prediction, img = self.predict_image(img)
+        with self.stage_timer.span('encode'):
+            response = add_preview({'prediction': prediction}, img, preview, self.config['PREVIEW_JPEG_QUALITY'])
+            body = json.dumps(response, sort_keys=True).encode()
+        self.result_cache.put(key, body, len(body))
+
+        self.request_timer.observe('miss', time.perf_counter() - start)
+        return body
+
+    def predict_batch(self, images_bytes, top_k, preview):
+        """Predicts many uploaded images with a single forward pass (@see predict_images)
+
+        Returns the result of every image: its prediction, top_k names and scores and preview, or an error entry
+        """
+        with self.stage_timer.span('decode'):
+            imgs = [decode_image(img_bytes) if img_bytes else None for img_bytes in images_bytes]
+        valid = [i for i, img in enumerate(imgs) if img is not None]
+
+        results = [dict(INVALID_IMAGE[0]) for _ in imgs]
+        if valid:
+            top, sharpened_imgs = self.predict_images([imgs[i] for i in valid], top_k)
+
+            with self.stage_timer.span('encode'):
+                for i, img_top, img in zip(valid, top, sharpened_imgs):
+                    results[i] = add_preview({
+                        'prediction': self.labels[img_top[0][0]],
+                        'top_k': [{'name': self.labels[idx], 'score': score} for idx, score in img_top],
+                    }, img, preview, self.config['PREVIEW_JPEG_QUALITY'])
+
+        return results
+
+    def predict_image(self, img):
+        """Crops the face out of a BGR image, sharpens it and predicts who it is
+        The sharpened image and the model input are written into the buffers of the current thread,
+        which is blocked until the micro-batcher has copied the input into its batch.
+
+        Returns the predicted name and the sharpened image, valid until the thread predicts another image
+        """
+        input, img = self.preprocess(
+            img,
+            self.buffers.get('input', INPUT_SHAPE),
+            lambda shape: self.buffers.get('sharpened', shape),
+        )
+
+        # Includes the wait for the micro-batch
+        with self.stage_timer.span('inference'):
+            output = self.batcher.predict(input)
+
+        idx = np.argmax(output)
+        return self.labels[idx], img
+
+    def predict_images(self, imgs, top_k):
+        """Predicts many BGR images with a single forward pass
+        Face detection and the rest of the preprocessing run in parallel on the detection pool,
+        which resizes every image straight into its row of the batch.
+
+        Returns the top_k (label index, score) pairs and the sharpened image of every image
+        """
+        batch = self.buffers.get('batch', (len(imgs), *INPUT_SHAPE))
+        prepared = list(self.detection_pool.map(self.preprocess, imgs, batch))
+        with self.stage_timer.span('inference'):
+            outputs = self.registry.predict(batch)
+
+        top_indices = np.argsort(-outputs, axis=1)[:, :top_k]
+        top = [[(idx, float(output[idx])) for idx in indices] for output, indices in zip(outputs, top_indices)]
+        return top, [img for _, img in prepared]
+
+    def preprocess(self, img, input=None, sharpened_buffer=None):
+        """Crops the face out of a BGR image, then sharpens and resizes it in the PREPROCESSING_ORDER
+
+        input is the (224, 224, 3) uint8 array the model input is written into, None for a new one.
+        sharpened_buffer returns the array the sharpened image of a given shape is written into, None for a new one.
+
+        Returns the model input and the sharpened image
+        """
+        with self.stage_timer.span('detect'):
+            img = self.face_detector.crop(img)
+
+        # Only the 224x224 pixels of the model input are sharpened, and they are the preview too
+        if self.preprocessing_order == 'resize_sharpen':
+            with self.stage_timer.span('resize'):
+                resized = cv2.resize(img, INPUT_SHAPE[1::-1], dst=self.buffers.get('resized', INPUT_SHAPE))
+            with self.stage_timer.span('sharpen'):
+                input = sharpen(resized, dst=input)
+            return input, input
+
+        with self.stage_timer.span('sharpen'):
+            img = sharpen(img, sharpened_buffer(img.shape) if sharpened_buffer else None)
+
+        with self.stage_timer.span('resize'):
+            input = cv2.resize(img, INPUT_SHAPE[1::-1], dst=input)
+        return input, img
 
-    if img_data == "":
-        return flask.jsonify({'error': 'Not an image file format! Please use .jpg, .jpeg or .png only.'}), 452
 
-    img_bytes = base64.b64decode(img_data)
+def get_service():
+    return flask.current_app.extensions['face_recognition']
 
+
+PREVIEW_FORMATS = ('png', 'jpeg', 'none')
+
+# Error responses (body, status), shared with the asyncio server (@see async_app.py)
+NOT_AN_IMAGE = ({'error': 'Not an image file format! Please use .jpg, .jpeg or .png only.'}, 452)
+INVALID_IMAGE = ({'error': 'Invalid image, please try using another image.'}, 453)
+INVALID_REQUEST = ({'error': 'Invalid request body, please send a JSON object.'}, 400)
+MODEL_NOT_LOADED = ({'error': 'The model is still loading, please try again shortly.'}, 503)
+
+def unknown_preview_format_error(preview):
+    return {'error': f'Unknown preview format {preview!r}, please use one of {", ".join(PREVIEW_FORMATS)}.'}, 400
+
+def too_many_images_error(max_images):
+    return {'error': f'Too many images, please send at most {max_images} per request.'}, 413
+
+def missing_field_error(field):
+    return {'error': f'Missing or invalid {field!r} field.'}, 400
+
+def invalid_top_k_error(top_k):
+    return {'error': f'Invalid top_k {top_k!r}, please use a positive integer.'}, 400
+
+def parse_top_k(top_k):
+    """Parses the top_k option, an integer of at least 1 (or its string, from a query argument)
+    Raises ValueError for anything else, e.g. 2.7, 0, true or 'five'"""
+    value = top_k
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            pass
+
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f'Invalid top_k {top_k!r}')
+    return value
+
+def decode_base64(img_data):
+    """Decodes a base64 string, or returns empty bytes (i.e. not an image) if it is not valid base64"""
     try:
-        np_array = np.frombuffer(img_bytes, np.uint8)
-        img = cv2.imdecode(np_array, cv2.IMREAD_COLOR)
+        return base64.b64decode(img_data, validate=True)
+    except (binascii.Error, TypeError, ValueError):
+        return b''
+
+def decode_image(img_bytes):
+    """Decodes the encoded image bytes (any buffer) into a BGR image, or None if they are not a valid image"""
+    try:
+        return cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
     except Exception as _:
-        return flask.jsonify({'error': 'Invalid image, please try using another image.'}), 453
-        
-    gray_image = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    face = face_classifier.detectMultiScale(gray_image, minNeighbors=3)
-
-    if len(face) != 0:
-        (x, y, w, h) = face[0]
-        img = img[y:y+h, x:x+w]
-    
-    img = sharpen(img)
-    
-    input = cv2.resize(img, (224, 224))
-    input = input.astype(np.uint8)
-
-    idx = np.argmax(model.predict(np.array([input]))[0])
-    sharpened_image_bytes = cv2.imencode('.png', img)[1].tostring()
-    return flask.jsonify({'prediction': names[idx],'sharpened_image': base64.b64encode(sharpened_image_bytes).decode()}), 200
-
-
-@app.route('/names', methods=['GET'])
+        return None
+
+def add_preview(response, img, preview, quality=DEFAULT_CONFIG['PREVIEW_JPEG_QUALITY']):
+    """Adds the sharpened image, encoded in the requested preview format (and JPEG quality), to a prediction response"""
+    if preview == 'png':
+        response['sharpened_image'] = base64.b64encode(cv2.imencode('.png', img)[1]).decode()
+    elif preview == 'jpeg':
+        response['sharpened_image'] = base64.b64encode(cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, quality])[1]).decode()
+
+    response['sharpened_image_format'] = preview
+    return response
+
+def parse_json_object(body):
+    """Parses a JSON request body, raises ValueError if it is not a JSON object"""
+    options = json.loads(body)
+    if not isinstance(options, dict):
+        raise ValueError('The request body is not a JSON object')
+    return options
+
+
+# Request handling, shared by the Flask app and the asyncio server (@see async_app.py), so both validate requests
+# the same way. Each one returns the response (body, status), where body is the serialised JSON (bytes) or a dict
+def handle_predict(service, body):
+    """Handles a /predict JSON body: {"base64_bytes": ..., "preview": "png"}"""
+    if not service.ready:
+        return MODEL_NOT_LOADED
+
+    try:
+        options = parse_json_object(body)
+    except ValueError:
+        return INVALID_REQUEST
+
+    img_data = options.get('base64_bytes')
+    preview = options.get('preview', 'png')
+
+    if not isinstance(img_data, str):
+        return missing_field_error('base64_bytes')
+
+    if preview not in PREVIEW_FORMATS:
+        return unknown_preview_format_error(preview)
+
+    if img_data == "":
+        return NOT_AN_IMAGE
+
+    response = service.predict_upload(img_data.encode(), preview, base64_encoded=True)
+    return (response, 200) if response is not None else INVALID_IMAGE
+
+def handle_predict_image(service, img_bytes, preview):
+    """Handles a /predict_image upload: the raw image bytes, and the preview format"""
+    if not service.ready:
+        return MODEL_NOT_LOADED
+
+    if preview not in PREVIEW_FORMATS:
+        return unknown_preview_format_error(preview)
+
+    if not img_bytes:
+        return NOT_AN_IMAGE
+
+    response = service.predict_upload(img_bytes, preview)
+    return (response, 200) if response is not None else INVALID_IMAGE
+
+def handle_predict_batch(service, images_bytes, options):
+    """Handles a /predict_batch upload: the images (empty bytes for an invalid one), and the top_k and preview options"""
+    if not service.ready:
+        return MODEL_NOT_LOADED
+
+    preview = options.get('preview', 'none')
+    try:
+        top_k = parse_top_k(options.get('top_k', service.config['DEFAULT_TOP_K']))
+    except ValueError:
+        return invalid_top_k_error(options.get('top_k'))
+
+    if preview not in PREVIEW_FORMATS:
+        return unknown_preview_format_error(preview)
+
+    if not images_bytes:
+        return NOT_AN_IMAGE
+
+    if len(images_bytes) > service.config['MAX_IMAGES_PER_REQUEST']:
+        return too_many_images_error(service.config['MAX_IMAGES_PER_REQUEST'])
+
+    return {'results': service.predict_batch(images_bytes, top_k, preview)}, 200
+
+def handle_predict_batch_json(service, body):
+    """Handles a /predict_batch JSON body: {"images": [...], "top_k": 5, "preview": "none"}"""
+    try:
+        options = parse_json_object(body)
+    except ValueError:
+        return INVALID_REQUEST
+
+    images = options.get('images', [])
+    if not isinstance(images, list):
+        return missing_field_error('images')
+
+    return handle_predict_batch(service, [decode_base64(img_data) for img_data in images], options)
+
+def respond(response):
+    """Builds the Flask response of a (body, status) pair"""
+    body, status = response
+    if isinstance(body, bytes):
+        return flask.Response(body, mimetype='application/json'), status
+    return flask.jsonify(body), status
+
+
+@api.route('/predict', methods=['POST'])
+def predict():
+    return respond(handle_predict(get_service(), flask.request.get_data(cache=False)))
+
+
+@api.route('/predict_image', methods=['POST'])
+def predict_image():
+    """Same as /predict, but takes the raw image bytes instead of base64 inside JSON
+
+    The image is either the whole request body (Content-Type: image/jpeg or image/png),
+    or the 'image' file of a multipart/form-data request.
+    The ?preview= query argument picks the sharpened image format: jpeg (default), png or none.
+    """
+    if flask.request.mimetype in ('image/jpeg', 'image/png'):
+        img_bytes = flask.request.get_data(cache=False)
+    elif 'image' in flask.request.files:
+        img_bytes = flask.request.files['image'].read()
+    else:
+        img_bytes = b''
+
+    return respond(handle_predict_image(get_service(), img_bytes, flask.request.args.get('preview', 'jpeg')))
+
+
+@api.route('/predict_batch', methods=['POST'])
+def predict_batch():
+    """Predicts many images in one request
+
+    The images are either base64 strings in the 'images' list of a JSON body,
+    or the 'images' files of a multipart/form-data request.
+    The top_k (default DEFAULT_TOP_K) and preview (default none) options are JSON fields or query arguments.
+    Invalid images get an error entry instead of failing the whole batch.
+    """
+    if flask.request.is_json:
+        return respond(handle_predict_batch_json(get_service(), flask.request.get_data(cache=False)))
+
+    images_bytes = [file.read() for file in flask.request.files.getlist('images')]
+    return respond(handle_predict_batch(get_service(), images_bytes, flask.request.args))
+
+
+@api.route('/stats', methods=['GET'])
+def get_stats():
+    return flask.jsonify(get_service().stats())
+
+
+@api.route('/metrics', methods=['GET'])
+def get_metrics():
+    """The stage timings, model version, batch sizes and cache counters, for a Prometheus scrape"""
+    return flask.Response(get_service().metrics(), content_type=CONTENT_TYPE)
+
+
+def admin_error():
+    """Checks the X-Admin-Token header of an /admin request, returns the error response if it is not allowed"""
+    token = get_service().config['ADMIN_TOKEN']
+    if not token:
+        return flask.jsonify({'error': 'The admin endpoints are disabled, please set ADMIN_TOKEN.'}), 403
+    if not hmac.compare_digest(flask.request.headers.get('X-Admin-Token', ''), token):
+        return flask.jsonify({'error': 'Invalid admin token.'}), 401
+    return None
+
+@api.route('/admin/model', methods=['GET'])
+def get_model():
+    """Returns the version of the model being served, and the state of the model being loaded (if any)"""
+    error = admin_error()
+    if error:
+        return error
+    return flask.jsonify(get_service().registry.status())
+
+@api.route('/admin/model', methods=['POST'])
+def swap_model():
+    """Loads a new model in the background, then swaps it in without interrupting the predictions
+
+    The JSON body has the 'model_path' (e.g. a ckpts/best_val checkpoint), and optionally the 'backend'
+    (default MODEL_BACKEND) and the 'version' of the model.
+    Responds straight away with 202; GET /admin/model tells when the new model is served.
+    """
+    error = admin_error()
+    if error:
+        return error
+
+    service = get_service()
+    options = flask.request.json or {}
+    model_path = options.get('model_path')
+    if not model_path or not os.path.exists(model_path):
+        return flask.jsonify({'error': f'Model {model_path!r} not found.'}), 404
+
+    try:
+        backend = backend_name(model_path, options.get('backend', service.config['MODEL_BACKEND']))
+    except ValueError as e:
+        return flask.jsonify({'error': str(e)}), 400
+
+    service.swap_model(model_path, backend, options.get('version'))
+    return flask.jsonify(service.registry.status()), 202
+
+@api.route('/names', methods=['GET'])
 def get_names():
-    names = [name.strip() for name in open("names.txt", "r").readlines()]
-    return flask.jsonify({'names': names})
+    body, etag = get_service().name_list.get()
+
+    # The client already has the latest names
+    if etag in flask.request.if_none_match:
+        response = flask.Response(status=304)
+    else:
+        response = flask.Response(body, mimetype='application/json')
+
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+# Orders of the sharpen and resize steps (@see FaceRecognitionService.preprocess)
+PREPROCESSING_ORDERS = ('sharpen_resize', 'resize_sharpen')
+
+SHARPEN_KERNEL = 1/3 * np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+
+def sharpen(image, dst=None):
+    """Sharpens an image, into dst when it is an array of the same shape and type"""
+    return cv2.filter2D(image, -1, SHARPEN_KERNEL, dst=dst)
+
+
+def load_config(config=None):
+    """Builds the settings from DEFAULT_CONFIG, then MCS13_ environment variables, then the config argument"""
+    settings = flask.Config(LIB_DIR)
+    settings.from_mapping(DEFAULT_CONFIG)
+    settings.from_prefixed_env('MCS13')
+    settings.update(config or {})
+    return settings
+
 
-def sharpen(image):
-    kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-    kernel = 1/3 * kernel
-    return cv2.filter2D(image, -1, kernel)
+def create_app(config=None):
+    """App factory, used by WSGI servers (e.g. gunicorn 'app:create_app()')
 
-if __name__ == '__main__': 
-    os.chdir(os.getcwd()+"/lib")
+    Settings are taken from DEFAULT_CONFIG, then MCS13_ environment variables, then the config argument
+    """
+    app = flask.Flask(__name__)
+    app.config.update(load_config(config))
 
-    face_classifier = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-    checkpoint_path = "lfw_skipconn_model/"
-    checkpoint_dir = os.path.dirname(checkpoint_path)
-    model = tf.keras.models.load_model(checkpoint_dir)
+    app.extensions['face_recognition'] = FaceRecognitionService(app.config)
+    app.register_blueprint(api)
+    return app
 
-    names = open("lfw_names.txt", "r").read().split("\n")
 
-    app.run()
\ No newline at end of file
+if __name__ == '__main__':
+    create_app().run()
\ No newline at end of file
@@ -0,0 +1,199 @@
+""" FIT3162 - MCS13 Code
+This file contains the asyncio serving mode of the face recognition API, built on aiohttp.
+
+The Flask app (@see app.py) holds a worker thread for the whole request, including the time a slow mobile client
+takes to upload its image. Here, the event loop reads the uploads without blocking, and only hands complete requests
+to a bounded thread pool (ASYNC_WORKERS threads), which runs the request validation, JSON parsing, decoding,
+face detection, prediction and preview encoding with the same handlers and FaceRecognitionService as the Flask app.
+So a few threads serve many concurrent (slow) clients.
+
+/predict, /predict_image, /predict_batch, /names, /stats and /metrics take and return the same requests and responses
+as the Flask app. The /admin endpoints are only served by the Flask app.
+
+Run from this directory with:
+    python async_app.py [--host 0.0.0.0] [--port 5000]
+or with gunicorn:
+    gunicorn "async_app:create_async_app()" --worker-class aiohttp.GunicornWebWorker
+
+aiohttp is an optional dependency (pip install aiohttp), only needed by this serving mode.
+
+@author MCS13
+@version 1.3.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+from app import (
+    FaceRecognitionService,
+    handle_predict,
+    handle_predict_batch,
+    handle_predict_batch_json,
+    handle_predict_image,
+    load_config,
+)
+from metrics import CONTENT_TYPE
+
+# ============================================================================================================= #
+
+# Constants
+# Keys of the service and of its thread pool in the aiohttp app
+SERVICE_KEY = web.AppKey("face_recognition", FaceRecognitionService) if web else None
+EXECUTOR_KEY = web.AppKey("executor", ThreadPoolExecutor) if web else None
+
+# ============================================================================================================= #
+
+
+# Handlers, run on the event loop
+async def run(request, fn, *args):
+    """Runs a request handling function of the Flask app (e.g. app.handle_predict) on the thread pool,
+    and builds its JSON response"""
+    loop = asyncio.get_running_loop()
+    body, status = await loop.run_in_executor(request.app[EXECUTOR_KEY], fn, request.app[SERVICE_KEY], *args)
+
+    if not isinstance(body, bytes):
+        body = json.dumps(body, sort_keys=True).encode()
+    return web.Response(body=body, status=status, content_type='application/json')
+
+
+def is_json(request) -> bool:
+    """Whether the request body is JSON, like Flask's request.is_json: application/json or application/*+json
+    (the parameters, e.g. charset=utf-8, are not part of the content type)"""
+    mimetype = request.content_type
+    return mimetype == 'application/json' or (mimetype.startswith('application/') and mimetype.endswith('+json'))
+
+
+async def read_image(request, field: str) -> list:
+    """Reads the uploaded images: the whole body (image/jpeg or image/png),
+    or the files named field of a multipart/form-data body"""
+    if request.content_type in ('image/jpeg', 'image/png'):
+        return [await request.read()]
+
+    images_bytes = []
+    if request.content_type == 'multipart/form-data':
+        # Like the Flask app, a malformed multipart body has no files
+        try:
+            reader = await request.multipart()
+            while (part := await reader.next()) is not None:
+                if part.name == field:
+                    images_bytes.append(await part.read())
+        except ValueError:
+            return []
+    return images_bytes
+
+
+async def predict(request):
+    return await run(request, handle_predict, await request.read())
+
+
+async def predict_image(request):
+    """Same as /predict, but takes the raw image bytes instead of base64 inside JSON (@see app.predict_image)"""
+    images_bytes = await read_image(request, 'image')
+    return await run(
+        request, handle_predict_image, images_bytes[0] if images_bytes else b'', request.query.get('preview', 'jpeg')
+    )
+
+
+async def predict_batch(request):
+    """Predicts many images in one request (@see app.predict_batch)"""
+    if is_json(request):
+        return await run(request, handle_predict_batch_json, await request.read())
+
+    return await run(request, handle_predict_batch, await read_image(request, 'images'), request.query)
+
+
+async def get_stats(request):
+    return web.json_response(request.app[SERVICE_KEY].stats())
+
+
+async def get_metrics(request):
+    """The stage timings, model version, batch sizes and cache counters, for a Prometheus scrape (@see app.get_metrics)"""
+    return web.Response(text=request.app[SERVICE_KEY].metrics(), headers={'Content-Type': CONTENT_TYPE})
+
+
+async def get_names(request):
+    body, etag = request.app[SERVICE_KEY].name_list.get()
+
+    # The client already has the latest names
+    if any(tag.value == etag for tag in request.if_none_match or ()):
+        response = web.Response(status=304)
+    else:
+        response = web.Response(body=body, content_type='application/json')
+
+    response.etag = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+# ============================================================================================================= #
+
+
+# App factory
+def create_async_app(config=None):
+    """App factory of the asyncio serving mode
+
+    Settings are taken like the Flask app (@see app.load_config)
+    """
+    if web is None:
+        raise ImportError('The asyncio serving mode needs aiohttp, please run: pip install aiohttp')
+
+    config = load_config(config)
+
+    app = web.Application(client_max_size=int(config['MAX_UPLOAD_MB'] * 1024 * 1024))
+    app[SERVICE_KEY] = FaceRecognitionService(config)
+    app[EXECUTOR_KEY] = ThreadPoolExecutor(config['ASYNC_WORKERS'], thread_name_prefix='request')
+
+    app.router.add_post('/predict', predict)
+    app.router.add_post('/predict_image', predict_image)
+    app.router.add_post('/predict_batch', predict_batch)
+    app.router.add_get('/stats', get_stats)
+    app.router.add_get('/metrics', get_metrics)
+    app.router.add_get('/names', get_names)
+
+    async def shutdown(app):
+        app[EXECUTOR_KEY].shutdown(wait=True)
+
+    app.on_cleanup.append(shutdown)
+    return app
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs the face recognition API in asyncio serving mode')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
+    web.run_app(create_async_app(), host=args.host, port=args.port)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- Added the /metrics endpoint
+
+1.2.0
+- The requests are validated by the request handling functions of the Flask app
+
+1.3.0
+- /predict_batch detects JSON bodies like the Flask app (any charset, and application/*+json types)
+"""
@@ -0,0 +1,211 @@
+""" FIT3162 - MCS13 Code
+This file contains the MicroBatcher class.
+It groups concurrent prediction requests into batches so that the model runs one forward pass per batch
+instead of one forward pass per request.
+
+@author MCS13
+@version 1.2.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Callable
+
+import numpy as np
+
+# ============================================================================================================= #
+
+
+# Class
+class MicroBatcher:
+    """Micro-batching layer in front of a model
+    Requests are put into a queue and a single worker thread groups them into batches.
+    A batch is closed when it reaches max_batch_size, or when the oldest request in it
+    has waited for max_latency_ms, whichever comes first.
+    A request with no other request queued behind it is run straight away, so a request at low load
+    never waits for max_latency_ms. Under load, the requests queued while a batch runs form the next batch.
+
+    The inputs are stacked into a batch buffer which is reused by every batch,
+    so predict_fn must not keep a reference to the batch it is given.
+
+    Attributes:
+        predict_fn (Callable):   The function running one forward pass on a batch of inputs
+        max_batch_size (int):    The largest number of requests in a single batch
+        max_latency_ms (float):  The longest time (in milliseconds) a request waits in the queue for other requests
+
+    Methods:
+        submit
+        predict
+        stats
+        stop
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 32,
+        max_latency_ms: float = 10.0,
+    ) -> MicroBatcher:
+        """Constructor for the MicroBatcher class
+        The worker thread is started straight away.
+
+        @param predict_fn(Callable):   The function running one forward pass on a batch of inputs
+        @param max_batch_size(int):    The largest number of requests in a single batch
+        @param max_latency_ms(float):  The longest time (in milliseconds) a request waits in the queue for other requests
+
+        @rtype: MicroBatcher
+        @return: The new constructed MicroBatcher instance
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_buffer = None
+
+        # Metrics
+        self._batch_sizes = Counter()
+        self._num_requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, input: np.ndarray) -> Future:
+        """Queues a single input for prediction
+
+        @param input(ndarray): A single model input (without the batch dimension)
+
+        @rtype: Future
+        @return: A Future holding the model output for this input
+        """
+        future = Future()
+        self._queue.put((input, future, time.perf_counter()))
+        return future
+
+    def predict(self, input: np.ndarray) -> np.ndarray:
+        """Predicts a single input, blocking until its batch has run
+
+        @param input(ndarray): A single model input (without the batch dimension)
+
+        @rtype: ndarray
+        @return: The model output for this input
+        """
+        return self.submit(input).result()
+
+    def stats(self) -> dict:
+        """Generates the batching metrics
+
+        @rtype: dict
+        @return: The batch size distribution and the queue wait times (in milliseconds)
+        """
+        with self._lock:
+            num_requests = self._num_requests
+            return {
+                "num_batches": sum(self._batch_sizes.values()),
+                "num_requests": num_requests,
+                "batch_sizes": dict(sorted(self._batch_sizes.items())),
+                "mean_queue_wait_ms": (
+                    1000 * self._total_wait / num_requests if num_requests else 0.0
+                ),
+                "max_queue_wait_ms": 1000 * self._max_wait,
+            }
+
+    def stop(self):
+        """Stops the worker thread once the queued requests are done"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Worker thread loop, collecting and running the batches"""
+        while (item := self._queue.get()) is not None:
+            batch = [item]
+            # A lone request does not wait for others
+            deadline = item[2] + self.max_latency_ms / 1000 if not self._queue.empty() else 0.0
+
+            # Fill the batch until it is full or the oldest request reaches its deadline
+            # Requests already waiting in the queue are always taken, even past the deadline
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                try:
+                    if timeout > 0:
+                        item = self._queue.get(timeout=timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._run_batch(batch)
+
+            if stopping:
+                return
+
+    def _run_batch(self, batch):
+        """Runs one forward pass and sends the results back to each request
+
+        @param batch(List[Tuple[ndarray, Future, float]]): The queued inputs, futures and enqueue times
+        """
+        start = time.perf_counter()
+        waits = [start - enqueued for _, _, enqueued in batch]
+
+        with self._lock:
+            self._batch_sizes[len(batch)] += 1
+            self._num_requests += len(batch)
+            self._total_wait += sum(waits)
+            self._max_wait = max(self._max_wait, *waits)
+
+        try:
+            outputs = self.predict_fn(self._stack([input for input, _, _ in batch]))
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future, _), output in zip(batch, outputs):
+            future.set_result(output)
+
+    def _stack(self, inputs):
+        """Stacks the inputs into the batch buffer, (re)allocated for max_batch_size inputs of their shape and type
+
+        @param inputs(List[ndarray]): The inputs of a batch
+
+        @rtype: ndarray
+        @return: The batch, a view of the batch buffer
+        """
+        shape, dtype = inputs[0].shape, inputs[0].dtype
+        buffer = self._batch_buffer
+        if buffer is None or buffer.shape[1:] != shape or buffer.dtype != dtype:
+            buffer = self._batch_buffer = np.empty((self.max_batch_size, *shape), dtype)
+
+        return np.stack(inputs, out=buffer[: len(inputs)])
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- The batches are stacked into a reused batch buffer
+
+1.2.0
+- A request with no other request queued behind it is run straight away, instead of waiting for max_latency_ms
+"""
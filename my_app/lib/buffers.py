@@ -0,0 +1,87 @@
+""" FIT3162 - MCS13 Code
+This file contains the ThreadBuffers class.
+It gives every thread of the server its own reusable arrays for the temporaries of the request pipeline
+(e.g. the grayscale image of the face detection, the resized model input, the batch tensor),
+so a request does not allocate (and page in) new full-size arrays for them.
+
+OpenCV writes into these arrays through its dst arguments. When the dst array does not have the exact shape
+OpenCV needs, it allocates a new one instead, so the result of the call must always be used (not the buffer).
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import threading
+from typing import Tuple
+
+import numpy as np
+
+# ============================================================================================================= #
+
+
+# Class
+class ThreadBuffers:
+    """Named, per-thread buffers, grown when a larger array is needed
+    An array returned by get() stays valid until the same thread calls get() with the same name again.
+
+    Methods:
+        get
+        nbytes
+    """
+
+    def __init__(self) -> ThreadBuffers:
+        """Constructor for the ThreadBuffers class
+
+        @rtype: ThreadBuffers
+        @return: The new constructed ThreadBuffers instance
+        """
+        self._local = threading.local()
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Gets a C-contiguous array of the current thread, without initialising it
+
+        @param name(str):           The name of the buffer (e.g., "gray")
+        @param shape(Tuple[int]):   The shape of the array
+        @param dtype(dtype):        (Optional) The type of the array
+
+        @rtype: ndarray
+        @return: A view of the buffer with the requested shape and type
+        """
+        buffers = self._buffers()
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+
+        buffer = buffers.get(name)
+        if buffer is None or buffer.nbytes < nbytes:
+            buffer = buffers[name] = np.empty(nbytes, np.uint8)
+
+        return buffer[:nbytes].view(dtype).reshape(shape)
+
+    def nbytes(self) -> int:
+        """Computes the size of the buffers of the current thread
+
+        @rtype: int
+        @return: The size in bytes
+        """
+        return sum(buffer.nbytes for buffer in self._buffers().values())
+
+    def _buffers(self) -> dict:
+        """The buffers of the current thread, by name"""
+        if not hasattr(self._local, "buffers"):
+            self._local.buffers = {}
+        return self._local.buffers
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,172 @@
+""" FIT3162 - MCS13 Code
+This file contains the ResultCache class.
+It keeps the responses of recent predictions, so an image uploaded again (e.g. a retry, or a resubmission
+of the drop zone) is answered without decoding, detecting, sharpening and predicting it again.
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+# ============================================================================================================= #
+
+
+# Class
+class ResultCache:
+    """Bounded LRU cache of prediction results, with a time to live
+    Entries are evicted, least recently used first, once the cache holds more than max_entries entries
+    or max_bytes bytes, and expire ttl seconds after they were added.
+
+    Keys start with the hash of the uploaded bytes and the model version (@see key),
+    so a new model never serves the results of the previous one.
+
+    Attributes:
+        max_entries (int):      The largest number of entries
+        max_bytes (int | None): The largest total size of the entries, in bytes (None for no limit)
+        ttl (float | None):     The number of seconds an entry is kept (None to keep them until evicted)
+
+    Methods:
+        key
+        get
+        put
+        stats
+        clear
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int | None = None, ttl: float | None = 300.0
+    ) -> ResultCache:
+        """Constructor for the ResultCache class
+
+        @param max_entries(int):      The largest number of entries
+        @param max_bytes(int | None): (Optional) The largest total size of the entries, in bytes
+        @param ttl(float | None):     (Optional) The number of seconds an entry is kept
+
+        @rtype: ResultCache
+        @return: The new constructed ResultCache instance
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # key -> (value, size, expiry time), least recently used first
+        self._entries: OrderedDict[Hashable, Tuple[Any, int, float]] = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def key(data: bytes, model_version: str, *options: Hashable) -> Tuple:
+        """Generates the key of an upload
+
+        @param data(bytes):          The uploaded (encoded) image bytes
+        @param model_version(str):   The version of the model predicting the image
+        @param options(Hashable):    The request options changing the response (e.g., the preview format)
+
+        @rtype: Tuple
+        @return: The key, made of the SHA-256 digest of the bytes, the model version and the options
+        """
+        return (hashlib.sha256(data).digest(), model_version, *options)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Gets the value of a key, and marks it as the most recently used
+
+        @param key(Hashable): The key (@see key)
+
+        @rtype: Any | None
+        @return: The cached value, or None if it is not cached (or expired)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, size, expiry = entry
+            if expiry < time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, size: int = 0):
+        """Adds a value, evicting the least recently used entries to stay within max_entries and max_bytes
+        Values larger than max_bytes are not cached.
+
+        @param key(Hashable): The key (@see key)
+        @param value(Any):    The value to cache
+        @param size(int):     (Optional) The size of the value in bytes, counted towards max_bytes
+        """
+        if self.max_entries <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expiry)
+            self._num_bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._num_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def stats(self) -> dict:
+        """Generates the cache metrics
+
+        @rtype: dict
+        @return: The hit and miss counts, the hit rate, and the number and size of the entries
+        """
+        with self._lock:
+            num_lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._num_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / num_lookups if num_lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def clear(self):
+        """Removes every entry (the metrics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def _remove(self, key: Hashable):
+        """Removes an entry, the lock must be held"""
+        _, size, _ = self._entries.pop(key)
+        self._num_bytes -= size
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,194 @@
+""" FIT3162 - MCS13 Code
+This file contains the FaceDetector class, the face detection stage of the serving pipeline.
+By default, it crops the same face as the original pipeline: the first face detectMultiScale finds
+at full resolution.
+
+Running the Haar cascade on full-resolution phone photos is often the slowest step of a request, so detection can
+instead run on a downscaled grayscale copy of the image (max_side), with the face box mapped back to full resolution.
+The order of detectMultiScale results changes with the image resolution, so a downscaled detector should keep
+the largest face (face="largest"). Both change the crop, so they are opt-in until
+benchmarks/bench_face_detector.py shows the crops agree on real photos.
+
+@author MCS13
+@version 1.2.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import threading
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+from buffers import ThreadBuffers
+
+# ============================================================================================================= #
+
+# Constants
+DEFAULT_CASCADE_PATH = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+
+# Which face is cropped when several are found: the first one detectMultiScale returns, or the largest one
+FACE_CHOICES = ("first", "largest")
+
+# ============================================================================================================= #
+
+
+# Class
+class FaceDetector:
+    """Haar cascade face detector with configurable detectMultiScale parameters
+
+    Attributes:
+        cascade_path (str):            The path of the Haar cascade XML file
+        scale_factor (float):          How much the image is shrunk at each detection scale
+        min_neighbors (int):           How many neighbouring detections a face needs to be kept
+        min_size (Tuple[int] | None):  The smallest face (width, height) to detect, in full-resolution pixels
+        max_size (Tuple[int] | None):  The largest face (width, height) to detect, in full-resolution pixels
+        max_side (int | None):         The longest image side detection runs at. None runs at full resolution
+        face (str):                    Which face is cropped when several are found (@see FACE_CHOICES)
+
+    Methods:
+        detect
+        crop
+    """
+
+    def __init__(
+        self,
+        cascade_path: str = DEFAULT_CASCADE_PATH,
+        scale_factor: float = 1.1,
+        min_neighbors: int = 3,
+        min_size: Tuple[int, int] | None = None,
+        max_size: Tuple[int, int] | None = None,
+        max_side: int | None = None,
+        face: str = "first",
+    ) -> FaceDetector:
+        """Constructor for the FaceDetector class
+
+        @param cascade_path(str):            The path of the Haar cascade XML file
+        @param scale_factor(float):          How much the image is shrunk at each detection scale
+        @param min_neighbors(int):           How many neighbouring detections a face needs to be kept
+        @param min_size(Tuple[int] | None):  The smallest face (width, height) to detect, in full-resolution pixels
+        @param max_size(Tuple[int] | None):  The largest face (width, height) to detect, in full-resolution pixels
+        @param max_side(int | None):         The longest image side detection runs at. None runs at full resolution
+        @param face(str):                    Which face is cropped when several are found (@see FACE_CHOICES)
+
+        @rtype: FaceDetector
+        @return: The new constructed FaceDetector instance
+
+        @raise ValueError: When face is not one of FACE_CHOICES
+        """
+        if face not in FACE_CHOICES:
+            raise ValueError(f"face must be one of {FACE_CHOICES}, got {face!r}.")
+
+        self.cascade_path = cascade_path
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_side = max_side
+        self.face = face
+
+        # CascadeClassifier is not thread-safe, so every thread gets its own copy
+        self._local = threading.local()
+
+        # The grayscale images are written into reusable per-thread buffers
+        self._buffers = ThreadBuffers()
+
+    @property
+    def classifier(self) -> cv2.CascadeClassifier:
+        """The Haar cascade of the current thread"""
+        if not hasattr(self._local, "classifier"):
+            self._local.classifier = cv2.CascadeClassifier(self.cascade_path)
+        return self._local.classifier
+
+    def detect(self, img: np.ndarray) -> Tuple[int, int, int, int] | None:
+        """Detects a face in a BGR image
+
+        @param img(ndarray): The BGR image
+
+        @rtype: Tuple[int, int, int, int] | None
+        @return: The (x, y, w, h) box of the face found (@see face), in full-resolution pixels, or None if there is no face
+        """
+        gray_image = cv2.cvtColor(
+            img, cv2.COLOR_BGR2GRAY, dst=self._buffers.get("gray", img.shape[:2])
+        )
+
+        # Downscaling the image (and the face size limits along with it)
+        # The buffer has the size OpenCV computes from fx and fy (rounded to the nearest integer)
+        scale = 1.0
+        if self.max_side and max(gray_image.shape) > self.max_side:
+            scale = self.max_side / max(gray_image.shape)
+            small_shape = tuple(round(side * scale) for side in gray_image.shape)
+            gray_image = cv2.resize(
+                gray_image,
+                None,
+                dst=self._buffers.get("small_gray", small_shape),
+                fx=scale,
+                fy=scale,
+                interpolation=cv2.INTER_AREA,
+            )
+
+        face = self.classifier.detectMultiScale(
+            gray_image,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=_scale_size(self.min_size, scale),
+            maxSize=_scale_size(self.max_size, scale),
+        )
+
+        if len(face) == 0:
+            return None
+
+        box = max(face, key=lambda box: box[2] * box[3]) if self.face == "largest" else face[0]
+
+        # Mapping the box back to full resolution
+        height, width = img.shape[:2]
+        x, y, w, h = (int(round(v / scale)) for v in box)
+        x, y = min(x, width - 1), min(y, height - 1)
+        return x, y, min(w, width - x), min(h, height - y)
+
+    def crop(self, img: np.ndarray) -> np.ndarray:
+        """Crops the face found (@see face) out of a BGR image
+
+        @param img(ndarray): The BGR image
+
+        @rtype: ndarray
+        @return: The face crop, or the whole image if there is no face
+        """
+        box = self.detect(img)
+        if box is None:
+            return img
+
+        x, y, w, h = box
+        return img[y : y + h, x : x + w]
+
+
+# ============================================================================================================= #
+
+
+# Helper Function
+def _scale_size(size: Tuple[int, int] | None, scale: float) -> Tuple[int, int]:
+    """Scales a (width, height) size, where None (no limit) becomes (0, 0) as expected by detectMultiScale"""
+    if not size:
+        return (0, 0)
+    return tuple(max(1, int(round(v * scale))) for v in size)
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- The grayscale images are written into reusable per-thread buffers
+
+1.2.0
+- Detection runs at full resolution and crops the first face by default, like the original pipeline
+- Added the face setting, to crop the largest face instead
+"""
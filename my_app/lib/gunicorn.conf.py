@@ -0,0 +1,53 @@
+""" FIT3162 - MCS13 Code
+Multi-process serving configuration for the face recognition API.
+
+Run from this directory with:
+    gunicorn
+
+Every setting can be overridden with an environment variable, e.g.:
+    MCS13_WORKERS=8 MCS13_THREADS=8 MCS13_PRELOAD=1 gunicorn
+
+Workers:  one process per core, so throughput scales with the number of cores.
+Threads:  concurrent requests per worker, grouped into batches by the MicroBatcher.
+Preload:  the app (Python modules, Haar cascade, name lists) is loaded once in the master process
+          and shared copy-on-write by the forked workers.
+          TensorFlow cannot run before forking (the workers deadlock), so the model itself is
+          loaded and warmed up in every worker right after the fork (@see post_worker_init).
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import multiprocessing
+import os
+
+# ============================================================================================================= #
+
+# Settings
+wsgi_app = "app:create_app()"
+bind = os.environ.get("MCS13_BIND", "0.0.0.0:5000")
+
+workers = int(os.environ.get("MCS13_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.environ.get("MCS13_THREADS", 4))
+
+preload_app = os.environ.get("MCS13_PRELOAD", "0") == "1"
+
+# Loading and warming up the model takes a while
+timeout = 120
+
+if preload_app:
+    os.environ["MCS13_DEFER_MODEL_LOADING"] = "true"
+
+# ============================================================================================================= #
+
+
+# Server hooks
+def post_worker_init(worker):
+    """Loads the model in the worker when the app was preloaded by the master process"""
+    if preload_app:
+        worker.wsgi.extensions["face_recognition"].load_model()
@@ -0,0 +1,280 @@
+""" FIT3162 - MCS13 Code
+This file contains the inference backends used by the prediction server:
+    CompiledModel - ("keras") replaces keras.Model.predict in the serving hot path with a compiled tf.function,
+                    which skips the data adapter and predict loop that Keras builds on every predict() call
+    TFLiteModel   - ("tflite") runs a TFLite model (e.g. int8 quantised, @see BaseModel.export_tflite)
+                    with the TFLite interpreter
+
+Every backend implements InferenceBackend: it takes batches of uint8 images, so the server can use any of them.
+The backend is chosen by name with load_backend (@see BACKENDS).
+
+TensorFlow is only imported when a backend needs it. The TFLite backend uses the small tflite_runtime package
+when it is installed, so a server running a .tflite model starts without loading TensorFlow at all.
+
+@author MCS13
+@version 1.2.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import os
+import threading
+from typing import Tuple
+
+import numpy as np
+
+# ============================================================================================================= #
+
+# Constants
+INPUT_SHAPE = (224, 224, 3)
+
+# ============================================================================================================= #
+
+
+# Classes
+class InferenceBackend:
+    """The interface of the inference backends
+    A backend loads a model once, then predicts batches of uint8 images of shape (N, *input_shape).
+    predict() may be called from several threads at once.
+
+    Attributes:
+        input_shape (Tuple[int]):  The shape of a single input image (height, width, depth)
+
+    Methods:
+        warm_up
+        predict
+    """
+
+    input_shape: Tuple[int, int, int] = INPUT_SHAPE
+
+    def warm_up(self, batch_size: int = 1):
+        """Runs a dummy batch through the model
+        This moves the first-call costs (tracing, tensor allocation) from the first real request to startup.
+
+        @param batch_size(int): The size of the dummy batch
+        """
+        self.predict(np.zeros((batch_size, *self.input_shape), np.uint8))
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Predicts a batch of images
+
+        @param batch(ndarray): A batch of uint8 images, with shape (N, *input_shape)
+
+        @rtype: ndarray
+        @return: The model output (class scores) for every image
+        """
+        raise NotImplementedError
+
+
+class CompiledModel(InferenceBackend):
+    """A saved Keras model wrapped in a compiled inference function
+    The function has a fixed input signature of (None, *input_shape) uint8 images,
+    so it is only traced once, no matter the batch size.
+
+    Attributes:
+        model (Model):             The loaded Keras model
+        input_shape (Tuple[int]):  The shape of a single input image (height, width, depth)
+
+    Methods:
+        warm_up
+        predict
+    """
+
+    def __init__(
+        self, model_path: str, input_shape: Tuple[int, int, int] = INPUT_SHAPE
+    ) -> CompiledModel:
+        """Constructor for the CompiledModel class
+
+        @param model_path(str):          The path to the saved Keras model (e.g., a SavedModel directory)
+        @param input_shape(Tuple[int]):  The shape of a single input image (height, width, depth)
+
+        @rtype: CompiledModel
+        @return: The new constructed CompiledModel instance
+        """
+        import tensorflow as tf
+
+        self.model = tf.keras.models.load_model(model_path)
+        self.input_shape = tuple(input_shape)
+
+        self._predict = tf.function(
+            self._forward,
+            input_signature=[tf.TensorSpec((None, *self.input_shape), tf.uint8)],
+        )
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Predicts a batch of images
+
+        @param batch(ndarray): A batch of uint8 images, with shape (N, *input_shape)
+
+        @rtype: ndarray
+        @return: The model output for every image
+        """
+        return self._predict(batch).numpy()
+
+    def _forward(self, images):
+        """The inference function compiled by tf.function"""
+        import tensorflow as tf
+
+        return self.model(tf.cast(images, tf.float32), training=False)
+
+
+class TFLiteModel(InferenceBackend):
+    """A TFLite model run with the TFLite interpreter
+    Quantised inputs and outputs are converted with the scale and zero point of the model,
+    so it takes the same uint8 images and returns the same float scores as CompiledModel.
+
+    The interpreter of tflite_runtime is used when it is installed, otherwise the one of TensorFlow (tf.lite).
+    The interpreter is not thread-safe, so predictions run one at a time.
+    The input tensor is only resized (and the tensors reallocated) when the batch size changes.
+
+    Attributes:
+        interpreter (Interpreter): The TFLite interpreter
+        input_shape (Tuple[int]):  The shape of a single input image (height, width, depth)
+
+    Methods:
+        warm_up
+        predict
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        input_shape: Tuple[int, int, int] = INPUT_SHAPE,
+        num_threads: int | None = None,
+    ) -> TFLiteModel:
+        """Constructor for the TFLiteModel class
+
+        @param model_path(str):          The path to the TFLite model file
+        @param input_shape(Tuple[int]):  The shape of a single input image (height, width, depth)
+        @param num_threads(int | None):  (Optional) The number of threads used by the interpreter
+
+        @rtype: TFLiteModel
+        @return: The new constructed TFLiteModel instance
+        """
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self.interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self.input_shape = tuple(input_shape)
+
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self._batch_size = None
+        self._lock = threading.Lock()
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Predicts a batch of images
+
+        @param batch(ndarray): A batch of uint8 images, with shape (N, *input_shape)
+
+        @rtype: ndarray
+        @return: The model output for every image
+        """
+        batch = self._quantise_input(batch)
+
+        with self._lock:
+            if len(batch) != self._batch_size:
+                self.interpreter.resize_tensor_input(self._input["index"], batch.shape)
+                self.interpreter.allocate_tensors()
+                self._batch_size = len(batch)
+
+            self.interpreter.set_tensor(self._input["index"], batch)
+            self.interpreter.invoke()
+            output = self.interpreter.get_tensor(self._output["index"])
+
+        scale, zero_point = self._output["quantization"]
+        if scale:
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output
+
+    def _quantise_input(self, batch: np.ndarray) -> np.ndarray:
+        """Converts a batch of uint8 images to the input type of the model"""
+        dtype = self._input["dtype"]
+        scale, zero_point = self._input["quantization"]
+
+        # int8 models exported by BaseModel.export_tflite take the uint8 pixel values as they are
+        if dtype == np.uint8 and (scale, zero_point) in ((0.0, 0), (1.0, 0)):
+            return np.ascontiguousarray(batch, np.uint8)
+
+        if not scale:
+            return batch.astype(dtype)
+
+        info = np.iinfo(dtype)
+        return np.clip(np.round(batch / scale + zero_point), info.min, info.max).astype(dtype)
+
+
+# ============================================================================================================= #
+
+# Backends, by name
+BACKENDS = {
+    "keras": CompiledModel,
+    "tflite": TFLiteModel,
+}
+
+# File extensions of the models of the lightweight backends, used by the "auto" backend
+BACKEND_EXTENSIONS = {
+    ".tflite": "tflite",
+}
+
+# ============================================================================================================= #
+
+
+# Functions
+def backend_name(model_path: str, backend: str = "auto") -> str:
+    """Resolves the name of the backend running a model
+    The "auto" backend picks the backend from the file extension of the model, and defaults to "keras".
+
+    @raise ValueError: When the backend is unknown
+
+    @param model_path(str): The path to the model
+    @param backend(str):    The backend name, one of BACKENDS, or "auto"
+
+    @rtype: str
+    @return: The backend name, one of BACKENDS
+    """
+    if backend == "auto":
+        return BACKEND_EXTENSIONS.get(os.path.splitext(model_path.rstrip("/\\"))[1].lower(), "keras")
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"The backend must be one of {tuple(BACKENDS)} or 'auto', got backend = '{backend}'."
+        )
+
+    return backend
+
+
+def load_backend(model_path: str, backend: str = "auto", **options) -> InferenceBackend:
+    """Loads a model with an inference backend
+
+    @see backend_name
+
+    @param model_path(str): The path to the model
+    @param backend(str):    The backend name, one of BACKENDS, or "auto"
+    @param options:         The keyword arguments of the backend constructor (e.g. num_threads for tflite)
+
+    @rtype: InferenceBackend
+    @return: The loaded model
+    """
+    return BACKENDS[backend_name(model_path, backend)](model_path, **options)
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- TFLiteModel, running (quantised) TFLite models
+
+1.2.0
+- InferenceBackend interface, and backends chosen by name
+- TensorFlow is only imported by the backends that need it; tflite_runtime is used when installed
+"""
@@ -0,0 +1,248 @@
+""" FIT3162 - MCS13 Code
+This file contains the ModelRegistry class.
+It holds the model served by the prediction server, and replaces it without restarting the server:
+a new model (e.g. the ckpts/best_val or ckpts/best_acc checkpoint of a new training run) is loaded and warmed up
+on a background thread while the current model keeps serving, then swapped in with a single assignment.
+
+Requests that already started finish on the model they started with, and the next ones use the new model,
+so a swap drops no requests and the first requests on the new model do not pay its loading and warm-up costs.
+
+@author MCS13
+@version 1.1.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+import numpy as np
+
+from inference import InferenceBackend
+
+# ============================================================================================================= #
+
+
+# Classes
+@dataclass(frozen=True)
+class ModelVersion:
+    """A loaded model and where it comes from
+
+    Attributes:
+        model (InferenceBackend):  The loaded (and warmed up) model
+        version (str):             The version of the model, unique for every load (e.g., "best_val#2")
+        path (str):                The path the model was loaded from
+        backend (str):             The name of the inference backend running the model
+        loaded_at (float):         The time (time.time()) at which the model was swapped in
+    """
+
+    model: InferenceBackend
+    version: str
+    path: str
+    backend: str
+    loaded_at: float
+
+
+class ModelRegistry:
+    """The model served by the prediction server, which can be replaced while serving
+    Models are loaded one at a time on a background thread. A model which fails to load or to warm up
+    is never swapped in, so the current model keeps serving.
+
+    The current model is a single ModelVersion attribute: reading it, and replacing it, is atomic.
+
+    Attributes:
+        loader (Callable):               The function loading a model: (path, backend) -> (InferenceBackend, backend name)
+        warm_up_batch_sizes (Tuple[int]): The batch sizes every new model is warmed up with
+
+    Methods:
+        current
+        predict
+        load
+        watch
+        status
+        stop
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str, str], Tuple[InferenceBackend, str]],
+        warm_up_batch_sizes: Tuple[int, ...] = (1,),
+    ) -> ModelRegistry:
+        """Constructor for the ModelRegistry class
+        The registry starts empty, until the first model is loaded.
+
+        @param loader(Callable):               The function loading a model: (path, backend) -> (InferenceBackend, backend name)
+        @param warm_up_batch_sizes(Tuple[int]): The batch sizes every new model is warmed up with
+
+        @rtype: ModelRegistry
+        @return: The new constructed ModelRegistry instance
+        """
+        self.loader = loader
+        self.warm_up_batch_sizes = tuple(warm_up_batch_sizes)
+
+        self._current: ModelVersion | None = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="model-loader")
+        self._lock = threading.Lock()
+        self._num_loads = 0
+        # Paths of the queued and running loads, oldest first
+        self._pending = []
+        self._last_error = None
+
+        self._watch_stop = threading.Event()
+        self._watch_thread = None
+
+    def current(self) -> ModelVersion | None:
+        """Returns the model being served
+
+        @rtype: ModelVersion | None
+        @return: The current model, or None before the first model is loaded
+        """
+        return self._current
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Predicts a batch of images with the current model
+        Used as the predict function of the MicroBatcher, so every batch runs on the latest model.
+
+        @param batch(ndarray): A batch of uint8 images, with shape (N, *input_shape)
+
+        @rtype: ndarray
+        @return: The model output for every image
+        """
+        return self._current.model.predict(batch)
+
+    def load(
+        self, path: str, backend: str = "auto", version: str | None = None, wait: bool = False
+    ) -> Future:
+        """Loads a model on the background thread, warms it up and swaps it in
+
+        @param path(str):            The path to the model
+        @param backend(str):         The backend name (@see inference.backend_name)
+        @param version(str | None):  (Optional) The version of the model. Defaults to the name of the model file
+                                     or directory, followed by the number of the load (e.g., "best_val#2")
+        @param wait(bool):           (Optional) Boolean stating if the call blocks until the model is swapped in,
+                                     raising the loading errors
+
+        @rtype: Future
+        @return: A Future holding the new ModelVersion once it is swapped in
+        """
+        with self._lock:
+            self._pending.append(path)
+
+        try:
+            future = self._executor.submit(self._load, path, backend, version)
+        except RuntimeError:
+            # The registry is stopped
+            with self._lock:
+                self._pending.remove(path)
+            raise
+
+        if wait:
+            future.result()
+        return future
+
+    def watch(self, path: str, backend: str = "auto", interval: float = 10.0):
+        """Reloads a model whenever its file changes, e.g. when a ModelCheckpoint saves a better model
+        The modification time is checked every interval seconds, on a separate thread.
+        For SavedModel directories, the modification time of saved_model.pb is used, since it is written last.
+
+        @param path(str):        The path to the model
+        @param backend(str):     The backend name (@see inference.backend_name)
+        @param interval(float):  The number of seconds between two checks
+        """
+
+        def watch_loop():
+            mtime = ModelRegistry._modification_time(path)
+            while not self._watch_stop.wait(interval):
+                new_mtime = ModelRegistry._modification_time(path)
+                if new_mtime is not None and new_mtime != mtime:
+                    mtime = new_mtime
+                    self.load(path, backend)
+
+        self._watch_thread = threading.Thread(target=watch_loop, daemon=True)
+        self._watch_thread.start()
+
+    def status(self) -> dict:
+        """Generates the state of the registry
+
+        @rtype: dict
+        @return: The current model version, the model being loaded (if any), the models waiting to be loaded
+                 and the last loading error (if any)
+        """
+        current = self._current
+        with self._lock:
+            return {
+                "version": current.version if current else None,
+                "path": current.path if current else None,
+                "backend": current.backend if current else None,
+                "loaded_at": current.loaded_at if current else None,
+                "num_loads": self._num_loads,
+                "loading": self._pending[0] if self._pending else None,
+                "pending": list(self._pending),
+                "last_error": self._last_error,
+            }
+
+    def stop(self):
+        """Stops the watch thread, and the background thread once the queued loads are done"""
+        self._watch_stop.set()
+        self._executor.shutdown(wait=True)
+
+    def _load(self, path: str, backend: str, version: str | None) -> ModelVersion:
+        """Loads, warms up and swaps in a model (runs on the background thread)"""
+        try:
+            try:
+                model, backend = self.loader(path, backend)
+                for batch_size in self.warm_up_batch_sizes:
+                    model.warm_up(batch_size)
+            except Exception as e:
+                with self._lock:
+                    self._last_error = f"{path}: {type(e).__name__}: {e}"
+                raise
+
+            with self._lock:
+                self._num_loads += 1
+                if version is None:
+                    version = f"{os.path.basename(path.rstrip('/')) or path}#{self._num_loads}"
+
+                # The swap: requests read self._current once, so they either use the old or the new model
+                current = self._current = ModelVersion(model, version, path, backend, time.time())
+                self._last_error = None
+
+            return current
+        finally:
+            # Loads run one at a time in the order they were queued, so this load is the oldest pending one
+            with self._lock:
+                self._pending.pop(0)
+
+    @staticmethod
+    def _modification_time(path: str) -> int | None:
+        """Gets the modification time of a model file, or of the saved_model.pb of a SavedModel directory
+
+        @rtype: int | None
+        @return: The modification time in nanoseconds, or None if the model does not exist (yet)
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, "saved_model.pb")
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+
+1.1.0
+- Every queued load is tracked, so "loading" stays set until the last queued model is swapped in
+"""
@@ -0,0 +1,127 @@
+""" FIT3162 - MCS13 Code
+This file contains the Residual and ResNetBlock layers of the SkipConnModel class (@see SkipConnModel.py).
+It is only imported when the model is built, since defining the layers imports TensorFlow.
+
+@author Benjamin Leong Tjen Ho
+@version 1.0.0
+@since 30/03/2024
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import tensorflow as tf
+from tensorflow.keras import layers
+
+from constants import *
+
+# ============================================================================================================= #
+
+
+# Classes
+class Residual(tf.keras.Model):
+    """Class representing a single Residual Block
+    A single block consists of the following layers:
+        Conv2D
+        BatchNormalisation
+        Activation
+
+        Conv2D
+        BatchNormalisation
+        SkipConnection (may be with Conv2D layer)
+        Activation
+
+        AveragePooling2D
+        Dropout
+
+    Note:
+        Documentation is using UK english. Normalisation refers to Normalization in TensorFlow
+
+    Attributes:
+        conv1 (Conv2D)
+        conv2 (Conv2D)
+
+        act1 (Activation)
+        act2 (Activation)
+
+        bn1 (BatchNormalisation)
+        bn2 (BatchNormalisation)
+
+        pool (AveragePooling2D)
+        drop_out (Dropout)
+    """
+
+    def __init__(
+        self,
+        num_channels,
+        use_conv=False,
+        activation_func=RELU,
+        drop_rate=0.2,
+        input_shape=None,
+    ):
+        super().__init__()
+        # Conv layers
+        self.conv1 = layers.Conv2D(
+            filters=num_channels, kernel_size=(3, 3), padding="same"
+        )
+
+        self.conv2 = layers.Conv2D(
+            filters=num_channels, kernel_size=(3, 3), padding="same"
+        )
+
+        # Activation
+        self.act1 = layers.Activation(activation_func)
+        self.act2 = layers.Activation(activation_func)
+
+        # Skip Connection
+        self.skip_conn = None
+        if use_conv:
+            self.skip_conn = layers.Conv2D(filters=num_channels, kernel_size=1)
+
+        # Batch Normalisation
+        self.bn1 = layers.BatchNormalization()
+        self.bn2 = layers.BatchNormalization()
+
+        # Ending
+        self.pool = layers.AveragePooling2D(pool_size=(2, 2), padding="same")
+        self.drop_out = layers.Dropout(drop_rate)
+
+    def call(self, X):
+        Y = self.act1(self.bn1(self.conv1(X)))
+        Y = self.bn2(self.conv2(Y))
+        if self.skip_conn:
+            X = self.skip_conn(X)
+        Y += X
+        Y = self.drop_out(self.pool(self.act2(Y)))
+        return Y
+
+
+class ResNetBlock(tf.keras.layers.Layer):
+    def __init__(
+        self, num_channels, num_residuals, first_block=False, input_shape=None, **kwargs
+    ):
+        super(ResNetBlock, self).__init__(**kwargs)
+        self.residual_layers = [
+            Residual(
+                num_channels,
+                use_conv=(i == 0 and not first_block),
+                input_shape=input_shape,
+            )
+            for i in range(num_residuals)
+        ]
+
+    def call(self, X):
+        for layer in self.residual_layers:
+            X = layer(X)
+        return X
+
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file, with Residual and ResNetBlock (moved from SkipConnModel.py)
+"""
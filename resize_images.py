@@ -0,0 +1,161 @@
+""" FIT3162 - MCS13 Code
+This file contains the parallel resizing tool for the face image datasets.
+It replaces the one-shape-per-call resize_neutral_images of the training notebook:
+    - every source image is decoded once, and every target resolution is written from that one decode
+    - the images are spread over a process pool
+    - outputs that are already up to date (newer than their source image) are skipped,
+      so re-running after adding images only resizes the new ones
+
+The outputs follow the same layout as before:
+    <DATASET_NAME_RESIZED>_<width>/<NEUTRAL_DIR>/<person name>/<image file>
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+from PIL import Image
+
+from constants import *
+
+# ============================================================================================================= #
+
+# Constants
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# ============================================================================================================= #
+
+
+# Functions
+def resized_dir(resized_shape: Tuple[int, int], output_prefix: str = DATASET_NAME_RESIZED) -> str:
+    """Generates the directory holding the images of one resized shape
+
+    @since 1.0.0
+
+    @param resized_shape(Tuple[int, int]): The (width, height) shape
+    @param output_prefix(str):            The prefix of the resized dataset directories
+
+    @rtype: str
+    @return: The directory path
+    """
+    return f"{output_prefix}_{resized_shape[0]}/{NEUTRAL_DIR}"
+
+
+def is_up_to_date(source_path: str, output_path: str) -> bool:
+    """Checks if an output image is newer than its source image
+
+    @since 1.0.0
+
+    @param source_path(str): The path of the source image
+    @param output_path(str): The path of the resized image
+
+    @rtype: bool
+    @return: True if the output exists and is not older than the source
+    """
+    return (
+        os.path.exists(output_path)
+        and os.path.getmtime(output_path) >= os.path.getmtime(source_path)
+    )
+
+
+def resize_image(task: Tuple[str, List[Tuple[str, Tuple[int, int]]]]) -> int:
+    """Decodes one source image and writes all of its resized outputs
+    Runs in the worker processes.
+
+    @since 1.0.0
+
+    @param task(Tuple[str, List[Tuple[str, Tuple[int, int]]]]): The source path, and the (output path, shape) pairs to write
+
+    @rtype: int
+    @return: The number of images written
+    """
+    source_path, outputs = task
+
+    with Image.open(source_path) as image:
+        image.load()
+        for output_path, resized_shape in outputs:
+            image.resize(resized_shape).save(output_path)
+
+    return len(outputs)
+
+
+def resize_neutral_images(
+    source_dir: str = f"{DATASET_NAME_MAIN}/{NEUTRAL_DIR}",
+    resized_shapes: List[Tuple[int, int]] = RESIZED_SHAPES,
+    output_prefix: str = DATASET_NAME_RESIZED,
+    workers: int | None = None,
+) -> int:
+    """Resizes all neutral images to every shape in parallel
+    Only the outputs which are missing or older than their source image are written.
+
+    @since 1.0.0
+
+    @param source_dir(str):                      The directory containing one sub-directory per person
+    @param resized_shapes(List[Tuple[int, int]]): The (width, height) shapes to resize the images to
+    @param output_prefix(str):                   The prefix of the resized dataset directories
+    @param workers(int | None):                  (Optional) The number of processes. Defaults to the number of CPUs
+
+    @rtype: int
+    @return: The number of images written
+    """
+    tasks = []
+
+    for name in sorted(os.listdir(source_dir)):
+        source_name_dir = os.path.join(source_dir, name)
+        if not os.path.isdir(source_name_dir):
+            continue
+
+        for shape in resized_shapes:
+            os.makedirs(os.path.join(resized_dir(shape, output_prefix), name), exist_ok=True)
+
+        for img_name in sorted(os.listdir(source_name_dir)):
+            if not img_name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+
+            source_path = os.path.join(source_name_dir, img_name)
+            outputs = [
+                (output_path, shape)
+                for shape in resized_shapes
+                if not is_up_to_date(
+                    source_path,
+                    output_path := os.path.join(resized_dir(shape, output_prefix), name, img_name),
+                )
+            ]
+
+            if outputs:
+                tasks.append((source_path, outputs))
+
+    if not tasks:
+        return 0
+
+    # Small chunks keep the workers busy, without sending every task on its own
+    workers = workers or os.cpu_count()
+    chunksize = max(1, len(tasks) // (workers * 8))
+
+    with ProcessPoolExecutor(workers) as executor:
+        return sum(executor.map(resize_image, tasks, chunksize=chunksize))
+
+
+# ============================================================================================================= #
+
+# Main function
+if __name__ == "__main__":
+    num_written = resize_neutral_images()
+    print(f"Resized {num_written} images to {RESIZED_SHAPES}")
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created file
+"""
@@ -0,0 +1,427 @@
+""" FIT3162: Whitebox Testing, Test 11 - Prediction API
+This file contains a tester to test the endpoints of the prediction server
+
+@author MCS13
+@version 1.3.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import base64
+import io
+import tempfile
+from unittest import mock
+import cv2
+import numpy as np
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from app import INVALID_IMAGE, MODEL_NOT_LOADED, NOT_AN_IMAGE, PREPROCESSING_ORDERS, create_app
+from inference import BACKENDS, INPUT_SHAPE, InferenceBackend
+
+# ============================================================================================================= #
+
+# Constants
+NAMES = ["Alice", "Bob"]
+NEW_NAMES = ["Alice", "Bob", "Carol"]
+
+NUM_CLASSES = 10
+IMAGE_SIZE = 64
+
+# Settings of an app serving the stand-in model
+STAND_IN_CONFIG = {"MODEL_PATH": "stand_in_model", "MODEL_BACKEND": "stand_in"}
+
+# Shape of a face-less image, cropped as a whole by the face detection
+PHOTO_SHAPE = (300, 400, 3)
+
+# ============================================================================================================= #
+
+
+# Helper Class
+class StandInBackend(InferenceBackend):
+    """Stand-in for a loaded model: the class scores of an image are its first NUM_CLASSES pixel values"""
+
+    def __init__(self, model_path: str, **options):
+        pass
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        return batch.reshape(len(batch), -1)[:, :NUM_CLASSES] / 255
+
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def write_names(path: str, names: list, mtime: int):
+    """Writes a names.txt file, with a given modification time (in seconds)"""
+    with open(path, "w") as names_file:
+        names_file.write("\n".join(names) + "\n")
+    os.utime(path, (mtime, mtime))
+
+
+def make_image(seed: int) -> bytes:
+    """Encodes a random PNG image"""
+    rng = np.random.default_rng(seed)
+    return cv2.imencode(".png", rng.integers(0, 256, (IMAGE_SIZE, IMAGE_SIZE, 3), dtype=np.uint8))[1].tobytes()
+
+
+def b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestNames(TesterBase):
+    """Class of /names Tester
+    Test Cases
+    - Serving the names with an ETag
+    - Answering 304 to a request with the ETag of the latest names, or with *
+    - Serving the new names with a new ETag after names.txt changes
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.names_path = os.path.join(self.tmp_dir.name, "names.txt")
+        write_names(self.names_path, NAMES, 1_000_000)
+
+        # /names does not need the model
+        app = create_app({"NAMES_PATH": self.names_path, "NAMES_CHECK_INTERVAL": 0.0, "DEFER_MODEL_LOADING": True})
+        self.client = app.test_client()
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_names(self):
+        """Tests serving the names with an ETag
+
+        Input, x: A GET request
+        Truth, y: 200 with the names, an ETag, and no-cache so the client always revalidates
+        """
+        response = self.client.get("/names")
+
+        try:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {"names": NAMES})
+            self.assertTrue(response.headers.get("ETag"))
+            self.assertTrue(response.cache_control.no_cache)
+        except Exception as e:
+            self.verification_errors.append(f"/names does not serve the names with an ETag: {str(e)}")
+
+    def test_not_modified(self):
+        """Tests answering 304 to a request with the ETag of the latest names, or with *
+
+        Input, x: GET requests with the ETag of the names, with *, and with another ETag
+        Truth, y: 304 with the ETag and no body, 304, and 200 with the names
+        """
+        etag = self.client.get("/names").headers["ETag"]
+
+        try:
+            response = self.client.get("/names", headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers["ETag"], etag)
+            self.assertEqual(response.data, b"")
+
+            self.assertEqual(self.client.get("/names", headers={"If-None-Match": "*"}).status_code, 304)
+
+            response = self.client.get("/names", headers={"If-None-Match": '"another"'})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {"names": NAMES})
+        except Exception as e:
+            self.verification_errors.append(f"/names does not answer 304 to its ETag: {str(e)}")
+
+    def test_reload(self):
+        """Tests serving the new names with a new ETag after names.txt changes
+
+        Input, x: names.txt rewritten with another name and a later modification time
+        Truth, y: The new names with a new ETag, and the old ETag no longer gets 304
+        """
+        etag = self.client.get("/names").headers["ETag"]
+        write_names(self.names_path, NEW_NAMES, 1_000_001)
+
+        try:
+            response = self.client.get("/names", headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {"names": NEW_NAMES})
+            self.assertNotEqual(response.headers["ETag"], etag)
+        except Exception as e:
+            self.verification_errors.append(f"/names does not reload names.txt: {str(e)}")
+
+
+class TestPredictBatch(TesterBase):
+    """Class of /predict_batch Tester
+    Test Cases
+    - Giving every image its own result, with error entries for the invalid images
+    - Answering 452 to an empty list of images
+    - Answering 400 to a top_k which is not a positive integer
+    - Taking the images as multipart files, and the options as query arguments
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.patch = mock.patch.dict(BACKENDS, {"stand_in": StandInBackend})
+        self.patch.start()
+
+        app = create_app(STAND_IN_CONFIG)
+        self.service = app.extensions["face_recognition"]
+        self.client = app.test_client()
+
+    def tearDown(self):
+        super().tearDown()
+        self.service.batcher.stop()
+        self.service.registry.stop()
+        self.patch.stop()
+
+    def test_mixed_images(self):
+        """Tests giving every image its own result, with error entries for the invalid images
+
+        Input, x: Two valid images, around a string which is not base64 and base64 bytes which are not an image
+        Truth, y: 200, the top_k names and scores of the valid images, and an error entry for each invalid one
+        """
+        images = [b64(make_image(0)), "not base64!", b64(b"not an image"), b64(make_image(1))]
+        response = self.client.post("/predict_batch", json={"images": images, "top_k": 3})
+
+        try:
+            self.assertEqual(response.status_code, 200)
+            results = response.get_json()["results"]
+            self.assertEqual(len(results), len(images))
+            self.assertEqual(results[1], INVALID_IMAGE[0])
+            self.assertEqual(results[2], INVALID_IMAGE[0])
+
+            for result in (results[0], results[3]):
+                scores = [entry["score"] for entry in result["top_k"]]
+                self.assertEqual(len(scores), 3)
+                self.assertEqual(scores, sorted(scores, reverse=True))
+                self.assertEqual(result["prediction"], result["top_k"][0]["name"])
+                self.assertEqual(result["sharpened_image_format"], "none")
+        except Exception as e:
+            self.verification_errors.append(f"The images do not get their own results: {str(e)}")
+
+    def test_empty(self):
+        """Tests answering 452 to an empty list of images
+
+        Input, x: An empty list of images
+        Truth, y: 452 with the not an image error
+        """
+        response = self.client.post("/predict_batch", json={"images": []})
+
+        try:
+            self.assertEqual(response.status_code, NOT_AN_IMAGE[1])
+            self.assertEqual(response.get_json(), NOT_AN_IMAGE[0])
+        except Exception as e:
+            self.verification_errors.append(f"An empty list of images is not rejected: {str(e)}")
+
+    def test_bad_top_k(self):
+        """Tests answering 400 to a top_k which is not a positive integer
+
+        Input, x: A top_k which is a float, 0, negative, a boolean, a string or null
+        Truth, y: 400 with an error, instead of a truncated or clamped top_k
+        """
+        for top_k in (2.7, 2.0, 0, -1, True, "five", None):
+            response = self.client.post("/predict_batch", json={"images": [b64(make_image(0))], "top_k": top_k})
+            try:
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("top_k", response.get_json()["error"])
+            except Exception as e:
+                self.verification_errors.append(f"top_k {top_k!r} is not rejected: {str(e)}")
+
+    def test_multipart(self):
+        """Tests taking the images as multipart files, and the options as query arguments
+
+        Input, x: Two image files, with top_k=2, then with top_k=0
+        Truth, y: Two results of two names each, then 400
+        """
+        def files():
+            return {"images": [(io.BytesIO(make_image(i)), f"{i}.png") for i in range(2)]}
+
+        try:
+            response = self.client.post("/predict_batch?top_k=2", data=files())
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([len(result["top_k"]) for result in response.get_json()["results"]], [2, 2])
+
+            self.assertEqual(self.client.post("/predict_batch?top_k=0", data=files()).status_code, 400)
+        except Exception as e:
+            self.verification_errors.append(f"The multipart images are not predicted: {str(e)}")
+
+
+class TestDeferredLoading(TesterBase):
+    """Class of deferred model loading Tester (as in a preloaded gunicorn worker, @see gunicorn.conf.py)
+    Test Cases
+    - Answering 503 to the predictions before the model is loaded
+    - Serving the predictions once the model is loaded
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.patch = mock.patch.dict(BACKENDS, {"stand_in": StandInBackend})
+        self.patch.start()
+
+        app = create_app({**STAND_IN_CONFIG, "DEFER_MODEL_LOADING": True})
+        self.service = app.extensions["face_recognition"]
+        self.client = app.test_client()
+
+    def tearDown(self):
+        super().tearDown()
+        if self.service.batcher is not None:
+            self.service.batcher.stop()
+        self.service.registry.stop()
+        self.patch.stop()
+
+    def test_not_loaded(self):
+        """Tests answering 503 to the predictions before the model is loaded
+
+        Input, x: A request to every prediction endpoint, and to /stats, before the model is loaded
+        Truth, y: 503 with an error for the predictions, and the stats without the batching metrics
+        """
+        image = make_image(0)
+        responses = [
+            self.client.post("/predict", json={"base64_bytes": b64(image)}),
+            self.client.post("/predict_image", data=image, content_type="image/png"),
+            self.client.post("/predict_batch", json={"images": [b64(image)]}),
+        ]
+
+        try:
+            for response in responses:
+                self.assertEqual(response.status_code, MODEL_NOT_LOADED[1])
+                self.assertEqual(response.get_json(), MODEL_NOT_LOADED[0])
+
+            response = self.client.get("/stats")
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.get_json()["batching"])
+        except Exception as e:
+            self.verification_errors.append(f"The predictions do not wait for the model: {str(e)}")
+
+    def test_loaded(self):
+        """Tests serving the predictions once the model is loaded
+
+        Input, x: A /predict request after load_model()
+        Truth, y: 200 with the prediction
+        """
+        self.service.load_model()
+        response = self.client.post("/predict", json={"base64_bytes": b64(make_image(0))})
+
+        try:
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("prediction", response.get_json())
+        except Exception as e:
+            self.verification_errors.append(f"The predictions are not served once the model is loaded: {str(e)}")
+
+
+class TestPreprocessingOrder(TesterBase):
+    """Class of preprocessing order Tester
+    Test Cases
+    - Preparing a (224, 224, 3) uint8 model input and the preview of every order
+    - Returning the preview, and its format, in the /predict response
+    - Rejecting an unknown order
+    """
+
+    # The preview shape of every order: the full-resolution crop, or the model input
+    PREVIEW_SHAPES = {"sharpen_resize": PHOTO_SHAPE, "resize_sharpen": INPUT_SHAPE}
+
+    def setUp(self):
+        super().setUp()
+        self.patch = mock.patch.dict(BACKENDS, {"stand_in": StandInBackend})
+        self.patch.start()
+        self.services = []
+
+        rng = np.random.default_rng(0)
+        self.image = cv2.GaussianBlur(rng.integers(0, 256, PHOTO_SHAPE, dtype=np.uint8), (9, 9), 0)
+
+    def tearDown(self):
+        super().tearDown()
+        for service in self.services:
+            service.batcher.stop()
+            service.registry.stop()
+        self.patch.stop()
+
+    def create_app(self, order: str):
+        app = create_app({**STAND_IN_CONFIG, "PREPROCESSING_ORDER": order})
+        self.services.append(app.extensions["face_recognition"])
+        return app
+
+    def test_preprocess(self):
+        """Tests preparing a (224, 224, 3) uint8 model input and the preview of every order
+
+        Input, x: A face-less image, preprocessed in every order
+        Truth, y: A (224, 224, 3) uint8 model input, and a uint8 preview of the shape of the order
+        """
+        for order in PREPROCESSING_ORDERS:
+            service = self.create_app(order).extensions["face_recognition"]
+            try:
+                input, preview = service.preprocess(self.image)
+                self.assertEqual(input.shape, INPUT_SHAPE)
+                self.assertEqual(input.dtype, np.uint8)
+                self.assertEqual(preview.shape, self.PREVIEW_SHAPES[order])
+                self.assertEqual(preview.dtype, np.uint8)
+            except Exception as e:
+                self.verification_errors.append(f"The {order} order does not prepare the expected images: {str(e)}")
+
+    def test_predict_preview(self):
+        """Tests returning the preview, and its format, in the /predict response
+
+        Input, x: A /predict request with a PNG preview, in every order
+        Truth, y: The prediction, and the preview of the shape of the order with its format
+        """
+        body = {"base64_bytes": b64(cv2.imencode(".png", self.image)[1].tobytes()), "preview": "png"}
+
+        for order in PREPROCESSING_ORDERS:
+            response = self.create_app(order).test_client().post("/predict", json=body)
+            try:
+                self.assertEqual(response.status_code, 200)
+                result = response.get_json()
+                self.assertEqual(set(result), {"prediction", "sharpened_image", "sharpened_image_format"})
+                self.assertEqual(result["sharpened_image_format"], "png")
+
+                preview = cv2.imdecode(np.frombuffer(base64.b64decode(result["sharpened_image"]), np.uint8), cv2.IMREAD_COLOR)
+                self.assertEqual(preview.shape, self.PREVIEW_SHAPES[order])
+            except Exception as e:
+                self.verification_errors.append(f"The {order} order does not return the expected preview: {str(e)}")
+
+    def test_unknown_order(self):
+        """Tests rejecting an unknown order
+
+        Input, x: PREPROCESSING_ORDER='sharpen_twice'
+        Truth, y: Creating the app raises a ValueError
+        """
+        try:
+            with self.assertRaises(ValueError):
+                self.create_app("sharpen_twice")
+        except Exception as e:
+            self.verification_errors.append(f"An unknown order is not rejected: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    for tester in (TestNames, TestPredictBatch, TestDeferredLoading, TestPreprocessingOrder):
+        suite = unittest.TestLoader().loadTestsFromTestCase(tester)
+        unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested the /names ETag, the 304 responses and the reload of names.txt
+
+1.1.0
+- Tested /predict_batch with a stand-in model: per-image results and errors, empty lists, invalid top_k values
+
+1.2.0
+- Tested the 503 responses before a deferred model is loaded
+
+1.3.0
+- Tested the model input and the preview of every preprocessing order, and the sharpened_image_format key
+"""
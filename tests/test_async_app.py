@@ -0,0 +1,260 @@
+""" FIT3162: Whitebox Testing, Test 12 - Asyncio Serving Mode
+This file contains a tester to test that the asyncio server answers every request like the Flask app
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import asyncio
+import json
+from unittest import mock
+from tester_base import TesterBase
+
+aiohttp = pytest.importorskip("aiohttp")  # Optional dependency of the asyncio serving mode
+from aiohttp.test_utils import TestClient, TestServer
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from app import create_app
+from async_app import SERVICE_KEY, create_async_app
+from inference import BACKENDS
+from test_app import STAND_IN_CONFIG, StandInBackend, b64, make_image
+
+# ============================================================================================================= #
+
+# Constants
+MAX_IMAGES_PER_REQUEST = 4
+CONFIG = {**STAND_IN_CONFIG, "MAX_IMAGES_PER_REQUEST": MAX_IMAGES_PER_REQUEST}
+
+IMAGE = make_image(0)
+OTHER_IMAGE = make_image(1)
+BOUNDARY = "mcs13boundary"
+
+# ============================================================================================================= #
+
+
+# Helper Functions
+def json_request(path: str, body, content_type: str = "application/json") -> tuple:
+    """A POST request with a JSON body (or a raw string body)"""
+    data = body if isinstance(body, str) else json.dumps(body)
+    return "POST", path, data.encode(), {"Content-Type": content_type}
+
+
+def image_request(path: str, data: bytes, content_type: str = "image/png") -> tuple:
+    """A POST request with the raw image bytes as the body"""
+    return "POST", path, data, {"Content-Type": content_type}
+
+
+def multipart_request(path: str, field: str, files: list) -> tuple:
+    """A POST request with the files of a multipart/form-data body"""
+    body = b""
+    for i, data in enumerate(files):
+        body += (
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{field}"; filename="{i}.png"\r\n'
+            f"Content-Type: image/png\r\n\r\n"
+        ).encode() + data + b"\r\n"
+    body += f"--{BOUNDARY}--\r\n".encode()
+    return "POST", path, body, {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestAsyncParity(TesterBase):
+    """Class of Asyncio Serving Mode Tester
+    Every request is sent to the Flask app and to the asyncio server, both serving the stand-in model,
+    and both must answer with the same status and the same JSON body.
+    Test Cases
+    - /predict: 200, 400, 452 and 453
+    - /predict_image: 200, 400, 452 and 453, with raw and multipart uploads
+    - /predict_batch: 200, 400, 413 and 452, with JSON (of any JSON content type) and multipart uploads
+    - /stats and /metrics
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.patch = mock.patch.dict(BACKENDS, {"stand_in": StandInBackend})
+        self.patch.start()
+
+        self.flask_app = create_app(CONFIG)
+        self.async_app = create_async_app(CONFIG)
+
+    def tearDown(self):
+        super().tearDown()
+        for service in (self.flask_app.extensions["face_recognition"], self.async_app[SERVICE_KEY]):
+            service.batcher.stop()
+            service.registry.stop()
+        self.patch.stop()
+
+    def send(self, requests: list) -> tuple:
+        """Sends the requests to both servers, in order
+
+        @rtype: Tuple[List[response], List[response]]
+        @return: The (status, content type, body) of every response of the Flask app, and of the asyncio server
+        """
+        client = self.flask_app.test_client()
+        flask_responses = [
+            (response.status_code, response.mimetype, response.data)
+            for response in (
+                client.open(path, method=method, data=data, headers=headers)
+                for method, path, data, headers in requests
+            )
+        ]
+
+        async def send_async():
+            responses = []
+            async with TestClient(TestServer(self.async_app)) as client:
+                for method, path, data, headers in requests:
+                    response = await client.request(method, path, data=data, headers=headers)
+                    responses.append((response.status, response.content_type, await response.read()))
+            return responses
+
+        return flask_responses, asyncio.run(send_async())
+
+    def check_parity(self, cases: list):
+        """Checks that both servers answer every case with its expected status and the same JSON body
+
+        @param cases(List[Tuple[str, int, tuple]]): The name, expected status and request of every case
+        """
+        flask_responses, async_responses = self.send([request for _, _, request in cases])
+
+        for (name, status, _), flask_response, async_response in zip(cases, flask_responses, async_responses):
+            try:
+                self.assertEqual(flask_response[0], status)
+                self.assertEqual(async_response[0], status)
+                self.assertEqual(flask_response[1], "application/json")
+                self.assertEqual(async_response[1], "application/json")
+                self.assertEqual(json.loads(flask_response[2]), json.loads(async_response[2]))
+            except Exception as e:
+                self.verification_errors.append(f"The servers do not answer {name} the same way: {str(e)}")
+
+    def test_predict(self):
+        """Tests /predict
+
+        Input, x: Valid and invalid /predict requests
+        Truth, y: The same statuses (200, 400, 452, 453) and bodies from both servers
+        """
+        self.check_parity([
+            ("a PNG preview", 200, json_request("/predict", {"base64_bytes": b64(IMAGE)})),
+            ("a JPEG preview", 200, json_request("/predict", {"base64_bytes": b64(OTHER_IMAGE), "preview": "jpeg"})),
+            ("a body which is not JSON", 400, json_request("/predict", "not json")),
+            ("a JSON list", 400, json_request("/predict", [b64(IMAGE)])),
+            ("a missing base64_bytes", 400, json_request("/predict", {"image": b64(IMAGE)})),
+            ("a base64_bytes which is not a string", 400, json_request("/predict", {"base64_bytes": 1})),
+            ("an unknown preview", 400, json_request("/predict", {"base64_bytes": b64(IMAGE), "preview": "gif"})),
+            ("an empty image", 452, json_request("/predict", {"base64_bytes": ""})),
+            ("bytes which are not an image", 453, json_request("/predict", {"base64_bytes": b64(b"not an image")})),
+            ("a string which is not base64", 453, json_request("/predict", {"base64_bytes": "not base64!"})),
+        ])
+
+    def test_predict_image(self):
+        """Tests /predict_image
+
+        Input, x: Valid and invalid /predict_image requests, as raw and multipart uploads
+        Truth, y: The same statuses (200, 400, 452, 453) and bodies from both servers
+        """
+        self.check_parity([
+            ("a raw PNG", 200, image_request("/predict_image", IMAGE)),
+            ("a raw image without preview", 200, image_request("/predict_image?preview=none", OTHER_IMAGE, "image/jpeg")),
+            ("a multipart image", 200, multipart_request("/predict_image?preview=png", "image", [IMAGE])),
+            ("an unknown preview", 400, image_request("/predict_image?preview=gif", IMAGE)),
+            ("an unsupported content type", 452, image_request("/predict_image", IMAGE, "text/plain")),
+            ("a multipart body without image", 452, multipart_request("/predict_image", "photo", [IMAGE])),
+            ("a malformed multipart body", 452, ("POST", "/predict_image", b"--x\r\nnot multipart", {"Content-Type": "multipart/form-data"})),
+            ("an empty raw image", 452, image_request("/predict_image", b"")),
+            ("bytes which are not an image", 453, image_request("/predict_image", b"not an image")),
+        ])
+
+    def test_predict_batch(self):
+        """Tests /predict_batch
+
+        Input, x: Valid and invalid /predict_batch requests, as JSON (of several content types) and multipart uploads
+        Truth, y: The same statuses (200, 400, 413, 452) and bodies, with the same per-image (453) error entries,
+                  from both servers
+        """
+        images = [b64(IMAGE), "not base64!", b64(b"not an image"), b64(OTHER_IMAGE)]
+        body = {"images": images, "top_k": 3}
+
+        self.check_parity([
+            ("mixed images", 200, json_request("/predict_batch", body)),
+            ("a JSON body with a charset", 200, json_request("/predict_batch", body, "application/json; charset=utf-8")),
+            ("a +json content type", 200, json_request("/predict_batch", body, "application/vnd+json")),
+            ("previews", 200, json_request("/predict_batch", {"images": images[:1], "preview": "jpeg"})),
+            ("multipart images", 200, multipart_request("/predict_batch?top_k=2", "images", [IMAGE, b"not an image"])),
+            ("a body which is not JSON", 400, json_request("/predict_batch", "not json")),
+            ("images which are not a list", 400, json_request("/predict_batch", {"images": b64(IMAGE)})),
+            ("a float top_k", 400, json_request("/predict_batch", {"images": images, "top_k": 2.7})),
+            ("a top_k of 0", 400, multipart_request("/predict_batch?top_k=0", "images", [IMAGE])),
+            ("an unknown preview", 400, json_request("/predict_batch", {"images": images, "preview": "gif"})),
+            ("too many images", 413, json_request("/predict_batch", {"images": images * 2})),
+            ("an empty list", 452, json_request("/predict_batch", {"images": []})),
+            ("a multipart body without images", 452, multipart_request("/predict_batch", "image", [IMAGE])),
+        ])
+
+    def test_stats_metrics(self):
+        """Tests /stats and /metrics
+
+        Input, x: The same predictions sent to both servers, then /stats and /metrics
+        Truth, y: The same stats (except the timings) and the same metric series, in the Prometheus content type
+        """
+        flask_responses, async_responses = self.send([
+            json_request("/predict", {"base64_bytes": b64(IMAGE)}),
+            json_request("/predict", {"base64_bytes": b64(IMAGE)}),
+            ("GET", "/stats", None, {}),
+            ("GET", "/metrics", None, {}),
+        ])
+
+        try:
+            (flask_status, _, flask_stats), (async_status, _, async_stats) = flask_responses[2], async_responses[2]
+            self.assertEqual((flask_status, async_status), (200, 200))
+            flask_stats, async_stats = json.loads(flask_stats), json.loads(async_stats)
+            self.assertEqual(set(flask_stats), set(async_stats))
+            self.assertEqual(flask_stats["cache"], async_stats["cache"])
+            self.assertEqual(flask_stats["cache"]["hits"], 1)
+            self.assertEqual(flask_stats["model"]["version"], async_stats["model"]["version"])
+            self.assertEqual(flask_stats["batching"]["num_requests"], async_stats["batching"]["num_requests"])
+        except Exception as e:
+            self.verification_errors.append(f"The servers do not serve the same /stats: {str(e)}")
+
+        try:
+            (flask_status, flask_type, flask_metrics), (async_status, async_type, async_metrics) = (
+                flask_responses[3], async_responses[3]
+            )
+            self.assertEqual((flask_status, async_status), (200, 200))
+            self.assertEqual((flask_type, async_type), ("text/plain", "text/plain"))
+
+            # The names and labels of the samples, without their values (the timings differ)
+            def series(metrics):
+                return [line.rsplit(" ", 1)[0] for line in metrics.decode().splitlines()]
+
+            self.assertEqual(series(flask_metrics), series(async_metrics))
+            self.assertIn('mcs13_stage_duration_seconds_count{stage="inference"}', series(flask_metrics))
+        except Exception as e:
+            self.verification_errors.append(f"The servers do not serve the same /metrics: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAsyncParity)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested that the asyncio server answers /predict, /predict_image, /predict_batch, /stats and /metrics
+  like the Flask app
+"""
@@ -0,0 +1,168 @@
+""" FIT3162: Whitebox Testing, Test 8 - Micro-Batcher
+This file contains a tester to test the micro-batching of the prediction server
+
+@author MCS13
+@version 1.1.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from batcher import MicroBatcher
+
+# ============================================================================================================= #
+
+# Constants
+MAX_BATCH_SIZE = 4
+NUM_REQUESTS = 10
+TIMEOUT = 10
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestMicroBatcher(TesterBase):
+    """Class of Micro-Batcher Tester
+    Test Cases
+    - Returning the output of every request
+    - Grouping queued requests into batches of at most max_batch_size
+    - Running a lone request straight away
+    - Sending a failed batch's error to every request of the batch
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.batches = []
+        # Blocks the first batch, so the other requests queue up behind it
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def tearDown(self):
+        super().tearDown()
+        self.release.set()
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """Stand-in model: records the batch size, and predicts twice every input"""
+        self.started.set()
+        self.release.wait(TIMEOUT)
+        self.batches.append(len(batch))
+        return batch * 2
+
+    def test_outputs(self):
+        """Tests returning the output of every request
+
+        Input, x: Concurrent requests with different inputs
+        Truth, y: Every request gets the output of its own input
+        """
+        self.release.set()
+        batcher = MicroBatcher(self.predict, MAX_BATCH_SIZE, max_latency_ms=5.0)
+
+        try:
+            with ThreadPoolExecutor(NUM_REQUESTS) as pool:
+                outputs = list(pool.map(lambda i: batcher.predict(np.full(3, i)), range(NUM_REQUESTS)))
+            for i, output in enumerate(outputs):
+                np.testing.assert_array_equal(output, np.full(3, 2 * i))
+        except Exception as e:
+            self.verification_errors.append(f"The requests do not get their own outputs: {str(e)}")
+        finally:
+            batcher.stop()
+
+    def test_batch_sizes(self):
+        """Tests grouping queued requests into batches of at most max_batch_size
+
+        Input, x: Requests queued while the first batch is running
+        Truth, y: The queued requests run in full batches, and the stats count every batch and request
+        """
+        batcher = MicroBatcher(self.predict, MAX_BATCH_SIZE, max_latency_ms=0.0)
+        first = batcher.submit(np.zeros(3))
+        self.started.wait(TIMEOUT)
+        futures = [batcher.submit(np.full(3, i)) for i in range(2 * MAX_BATCH_SIZE)]
+        self.release.set()
+
+        try:
+            first.result(TIMEOUT)
+            for future in futures:
+                future.result(TIMEOUT)
+            batcher.stop()
+
+            self.assertEqual(self.batches, [1, MAX_BATCH_SIZE, MAX_BATCH_SIZE])
+            stats = batcher.stats()
+            self.assertEqual(stats["num_batches"], 3)
+            self.assertEqual(stats["num_requests"], 2 * MAX_BATCH_SIZE + 1)
+            self.assertEqual(stats["batch_sizes"], {1: 1, MAX_BATCH_SIZE: 2})
+        except Exception as e:
+            self.verification_errors.append(f"The requests are not batched: {str(e)}")
+
+    def test_lone_request(self):
+        """Tests running a request with no other request queued behind it straight away
+
+        Input, x: A single request, with a max_latency_ms far longer than a prediction
+        Truth, y: The request does not wait for max_latency_ms
+        """
+        self.release.set()
+        batcher = MicroBatcher(self.predict, MAX_BATCH_SIZE, max_latency_ms=1000 * TIMEOUT)
+
+        try:
+            batcher.predict(np.zeros(3))
+            self.assertLess(batcher.stats()["max_queue_wait_ms"], 1000)
+        except Exception as e:
+            self.verification_errors.append(f"A lone request waits for max_latency_ms: {str(e)}")
+        finally:
+            batcher.stop()
+
+    def test_error(self):
+        """Tests sending a failed batch's error to every request of the batch
+
+        Input, x: A model raising an error
+        Truth, y: The request raises the error, and the batcher keeps serving
+        """
+
+        def predict(batch):
+            if batch[0, 0] < 0:
+                raise ValueError("bad input")
+            return batch
+
+        batcher = MicroBatcher(predict, MAX_BATCH_SIZE, max_latency_ms=0.0)
+
+        try:
+            with self.assertRaises(ValueError):
+                batcher.predict(np.full(3, -1))
+            np.testing.assert_array_equal(batcher.predict(np.ones(3)), np.ones(3))
+        except Exception as e:
+            self.verification_errors.append(f"A failed batch is not handled: {str(e)}")
+        finally:
+            batcher.stop()
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMicroBatcher)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested returning the output of every request
+- Tested grouping queued requests into batches of at most max_batch_size
+- Tested sending a failed batch's error to its requests
+
+1.1.0
+- Tested running a lone request straight away
+"""
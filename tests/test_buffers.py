@@ -0,0 +1,108 @@
+""" FIT3162: Whitebox Testing, Test 9 - Thread Buffers
+This file contains a tester to test the reusable per-thread buffers of the prediction server
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from buffers import ThreadBuffers
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestThreadBuffers(TesterBase):
+    """Class of Thread Buffers Tester
+    Test Cases
+    - Getting arrays of the requested shape and type
+    - Reusing a buffer for arrays which fit in it, and growing it for larger ones
+    - Giving every thread its own buffers
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.buffers = ThreadBuffers()
+
+    def test_shape(self):
+        """Tests getting arrays of the requested shape and type
+
+        Input, x: Arrays of several shapes and types
+        Truth, y: C-contiguous arrays of those shapes and types
+        """
+        try:
+            for shape, dtype in (((224, 224, 3), np.uint8), ((4, 5), np.float32), ((7,), np.int64)):
+                array = self.buffers.get("array", shape, dtype)
+                self.assertEqual(array.shape, shape)
+                self.assertEqual(array.dtype, dtype)
+                self.assertTrue(array.flags["C_CONTIGUOUS"])
+        except Exception as e:
+            self.verification_errors.append(f"The arrays do not have the requested shape and type: {str(e)}")
+
+    def test_reuse(self):
+        """Tests reusing a buffer for arrays which fit in it, and growing it for larger ones
+
+        Input, x: A large array, a smaller array and a larger array with the same name, and an array with another name
+        Truth, y: The smaller array shares the memory of the first one, the larger one does not,
+                  and every name has its own buffer
+        """
+        try:
+            large = self.buffers.get("image", (100, 100))
+            smaller = self.buffers.get("image", (50, 50))
+            self.assertTrue(np.shares_memory(large, smaller))
+            self.assertEqual(self.buffers.nbytes(), 100 * 100)
+
+            larger = self.buffers.get("image", (200, 200))
+            self.assertFalse(np.shares_memory(large, larger))
+            self.assertEqual(self.buffers.nbytes(), 200 * 200)
+
+            other = self.buffers.get("gray", (200, 200))
+            self.assertFalse(np.shares_memory(larger, other))
+        except Exception as e:
+            self.verification_errors.append(f"The buffers are not reused: {str(e)}")
+
+    def test_threads(self):
+        """Tests giving every thread its own buffers
+
+        Input, x: An array with the same name got on two threads
+        Truth, y: The arrays do not share memory
+        """
+        try:
+            main = self.buffers.get("image", (10, 10))
+            with ThreadPoolExecutor(1) as pool:
+                other = pool.submit(self.buffers.get, "image", (10, 10)).result()
+            self.assertFalse(np.shares_memory(main, other))
+        except Exception as e:
+            self.verification_errors.append(f"The threads share their buffers: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestThreadBuffers)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested the shape and type of the arrays
+- Tested reusing and growing the buffers
+- Tested the per-thread buffers
+"""
@@ -0,0 +1,213 @@
+""" FIT3162: Whitebox Testing, Test 7 - Result Cache
+This file contains a tester to test the result cache of the prediction server
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+from unittest import mock
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+import cache
+from cache import ResultCache
+
+# ============================================================================================================= #
+
+
+# Helper Class
+class FakeClock:
+    """Stand-in for the time module of cache.py, with a monotonic clock moved by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestResultCache(TesterBase):
+    """Class of Result Cache Tester
+    Test Cases
+    - Evicting the least recently used entries by max_entries
+    - Evicting the least recently used entries by max_bytes
+    - Skipping values larger than max_bytes
+    - Expiring entries after the ttl
+    - Disabling the cache with max_entries=0
+    - Counting hits, misses and evictions
+    - Generating keys from the bytes, the model version and the options
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        self.patch = mock.patch.object(cache, "time", self.clock)
+        self.patch.start()
+
+    def tearDown(self):
+        super().tearDown()
+        self.patch.stop()
+
+    def test_max_entries(self):
+        """Tests evicting the least recently used entries by max_entries
+
+        Input, x: Three values in a cache of two entries, the first one read before adding the third
+        Truth, y: The second value is evicted
+        """
+        results = ResultCache(max_entries=2)
+        results.put("a", 1)
+        results.put("b", 2)
+        results.get("a")
+        results.put("c", 3)
+
+        try:
+            self.assertEqual(results.get("a"), 1)
+            self.assertIsNone(results.get("b"))
+            self.assertEqual(results.get("c"), 3)
+            self.assertEqual(results.stats()["entries"], 2)
+        except Exception as e:
+            self.verification_errors.append(f"Entries are not evicted by max_entries: {str(e)}")
+
+    def test_max_bytes(self):
+        """Tests evicting the least recently used entries by max_bytes
+
+        Input, x: Values of 40, 40 and 30 bytes in a cache of 100 bytes
+        Truth, y: The first value is evicted, and the size of the entries stays within 100 bytes
+        """
+        results = ResultCache(max_entries=10, max_bytes=100)
+        results.put("a", 1, size=40)
+        results.put("b", 2, size=40)
+        results.put("c", 3, size=30)
+
+        try:
+            self.assertIsNone(results.get("a"))
+            self.assertEqual(results.get("b"), 2)
+            self.assertEqual(results.get("c"), 3)
+            self.assertEqual(results.stats()["bytes"], 70)
+        except Exception as e:
+            self.verification_errors.append(f"Entries are not evicted by max_bytes: {str(e)}")
+
+    def test_too_large(self):
+        """Tests skipping values larger than max_bytes
+
+        Input, x: A value of 101 bytes in a cache of 100 bytes holding another value
+        Truth, y: The large value is not cached, and the other value is kept
+        """
+        results = ResultCache(max_entries=10, max_bytes=100)
+        results.put("a", 1, size=10)
+        results.put("b", 2, size=101)
+
+        try:
+            self.assertIsNone(results.get("b"))
+            self.assertEqual(results.get("a"), 1)
+            self.assertEqual(results.stats()["evictions"], 0)
+        except Exception as e:
+            self.verification_errors.append(f"Values larger than max_bytes are cached: {str(e)}")
+
+    def test_ttl(self):
+        """Tests expiring entries after the ttl
+
+        Input, x: A value read just before and just after its ttl of 10 seconds
+        Truth, y: The value is returned before, and counted as expired after
+        """
+        results = ResultCache(ttl=10.0)
+        results.put("a", 1)
+
+        try:
+            self.clock.now += 10.0
+            self.assertEqual(results.get("a"), 1)
+
+            self.clock.now += 0.001
+            self.assertIsNone(results.get("a"))
+
+            stats = results.stats()
+            self.assertEqual(stats["expirations"], 1)
+            self.assertEqual(stats["entries"], 0)
+        except Exception as e:
+            self.verification_errors.append(f"Entries do not expire after the ttl: {str(e)}")
+
+    def test_disabled(self):
+        """Tests disabling the cache with max_entries=0
+
+        Input, x: A value added to a cache of 0 entries
+        Truth, y: The value is not cached
+        """
+        results = ResultCache(max_entries=0)
+        results.put("a", 1)
+
+        try:
+            self.assertIsNone(results.get("a"))
+            self.assertEqual(results.stats()["entries"], 0)
+        except Exception as e:
+            self.verification_errors.append(f"A cache of 0 entries caches values: {str(e)}")
+
+    def test_counters(self):
+        """Tests counting hits, misses and evictions
+
+        Input, x: Two hits, one miss and one eviction in a cache of one entry
+        Truth, y: The counters and the hit rate
+        """
+        results = ResultCache(max_entries=1)
+        results.put("a", 1)
+        results.get("a")
+        results.get("a")
+        results.get("b")
+        results.put("b", 2)
+
+        try:
+            stats = results.stats()
+            self.assertEqual(stats["hits"], 2)
+            self.assertEqual(stats["misses"], 1)
+            self.assertEqual(stats["evictions"], 1)
+            self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        except Exception as e:
+            self.verification_errors.append(f"The counters are wrong: {str(e)}")
+
+    def test_key(self):
+        """Tests generating keys from the bytes, the model version and the options
+
+        Input, x: Keys of the same bytes with another model version or option, and of other bytes
+        Truth, y: Only the same bytes, model version and options give the same key
+        """
+        key = ResultCache.key(b"image", "model#1", "png")
+
+        try:
+            self.assertEqual(key, ResultCache.key(b"image", "model#1", "png"))
+            self.assertNotEqual(key, ResultCache.key(b"image", "model#2", "png"))
+            self.assertNotEqual(key, ResultCache.key(b"image", "model#1", "jpeg"))
+            self.assertNotEqual(key, ResultCache.key(b"other", "model#1", "png"))
+        except Exception as e:
+            self.verification_errors.append(f"The keys are wrong: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestResultCache)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested evicting entries by max_entries and max_bytes, and skipping values larger than max_bytes
+- Tested expiring entries after the ttl, with a fake clock
+- Tested disabling the cache with max_entries=0
+- Tested the hit, miss and eviction counters, and the keys
+"""
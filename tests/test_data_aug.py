@@ -2,7 +2,7 @@
 This file contains a tester to test the Data Augmentation code from the main model training file
 
 @author Benjamin Leong Tjen Ho
-@version 1.1.0
+@version 1.3.0
 @since 15/05/2024
 """
 
@@ -21,6 +21,7 @@ import os, sys  # Importing other files
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from constants import DATASET_NAME_MAIN, NEUTRAL_DIR
+from augmentation import translate, translate_batch, random_translate, random_flip
 
 # ============================================================================================================= #
 
@@ -33,6 +34,8 @@ MIN_TRANSLATION = -5
 MAX_TRANSLATION = 5
 OFFSET = 1
 
+BATCH_SIZE = 8
+
 IMAGE_INPUT = np.array(
     [
         np.array(
@@ -141,6 +144,9 @@ class TestDataAug(TesterBase):
     - Converting Image object into nparray
     - Lateral Translations
     - Vertical Translations
+    - Batched translations of augmentation.py
+    - Batched random translations and flips of augmentation.py
+    - NumPy batched translations of augmentation.py, with and without an output buffer
     """
 
     def test_lateral_translation(self):
@@ -179,6 +185,87 @@ class TestDataAug(TesterBase):
 
         self.verification_errors.append("Vertical Translation failed.")
 
+    def test_batch_translation(self):
+        """Test for the batched translation
+
+        Input, x: A batch of copies of some image, with one offset pair per image
+        Truth, y: Every image shifted with wraparound, as with np.roll
+        """
+        images = np.repeat(IMAGE_INPUT[np.newaxis], BATCH_SIZE, axis=0)
+        dx = np.arange(BATCH_SIZE, dtype=np.int32) - BATCH_SIZE // 2
+        dy = BATCH_SIZE // 2 - np.arange(BATCH_SIZE, dtype=np.int32)
+
+        translated = translate(images, dx, dy).numpy()
+
+        for i in range(BATCH_SIZE):
+            expected = np.roll(np.roll(IMAGE_INPUT, dy[i], axis=0), dx[i], axis=1)
+            if not np.array_equal(translated[i], expected):
+                self.verification_errors.append(
+                    f"Batched translation by ({dx[i]}, {dy[i]}) failed."
+                )
+
+    def test_numpy_batch_translation(self):
+        """Test for the NumPy batched translation
+
+        Input, x: A batch of different images, with one offset pair per image (some larger than the image)
+        Truth, y: Every image shifted with wraparound, as with np.roll
+        """
+        images = np.stack([IMAGE_INPUT + 100 * i for i in range(BATCH_SIZE)])
+        dx = np.array([0, 1, -1, 4, -5, 7, -12, 25])
+        dy = np.array([0, -1, 2, 5, -4, -8, 11, 3])
+
+        translated = translate_batch(images, dx, dy)
+
+        for i in range(BATCH_SIZE):
+            expected = np.roll(np.roll(images[i], dy[i], axis=0), dx[i], axis=1)
+            if not np.array_equal(translated[i], expected):
+                self.verification_errors.append(
+                    f"NumPy batched translation by ({dx[i]}, {dy[i]}) failed."
+                )
+
+    def test_numpy_batch_translation_out(self):
+        """Test for the NumPy batched translation into a preallocated buffer
+
+        Input, x: A batch of images, random offsets in [-5, 5) and an output buffer
+        Truth, y: The buffer is returned, holding the translated images
+        """
+        images = np.stack([IMAGE_INPUT + 100 * i for i in range(BATCH_SIZE)])
+        dx = np.random.randint(MIN_TRANSLATION, MAX_TRANSLATION, BATCH_SIZE)
+        dy = np.random.randint(MIN_TRANSLATION, MAX_TRANSLATION, BATCH_SIZE)
+        out = np.empty_like(images)
+
+        try:
+            self.assertIs(translate_batch(images, dx, dy, out=out), out)
+            self.assertTrue(np.array_equal(out, translate_batch(images, dx, dy)))
+        except Exception as e:
+            self.verification_errors.append(
+                f"NumPy batched translation into a buffer failed: {str(e)}"
+            )
+
+    def test_batch_random_augmentation(self):
+        """Test for the batched random translations and flips
+
+        Input, x: A batch of copies of some image
+        Truth, y: Every image is the input rolled by offsets in [-5, 5), or the input flipped left to right
+        """
+        images = np.repeat(IMAGE_INPUT[np.newaxis], BATCH_SIZE, axis=0)
+        translations = [
+            np.roll(np.roll(IMAGE_INPUT, dy, axis=0), dx, axis=1)
+            for dx in range(MIN_TRANSLATION, MAX_TRANSLATION)
+            for dy in range(MIN_TRANSLATION, MAX_TRANSLATION)
+        ]
+
+        for image in random_translate(images).numpy():
+            if not any(np.array_equal(image, expected) for expected in translations):
+                self.verification_errors.append("Batched random translation failed.")
+
+        for image in random_flip(images).numpy():
+            if not (
+                np.array_equal(image, IMAGE_INPUT)
+                or np.array_equal(image, IMAGE_INPUT[:, ::-1])
+            ):
+                self.verification_errors.append("Batched random flip failed.")
+
 
 # ============================================================================================================= #
 
@@ -196,4 +283,10 @@ if __name__ == "__main__":
 - Copy pasted the unit function
 - Created a Test class for this function
 - Tested lateral and vertical translation
+
+1.2.0
+- Tested the batched translations and flips of augmentation.py
+
+1.3.0
+- Tested the NumPy batched translations of augmentation.py
 """
@@ -0,0 +1,347 @@
+""" FIT3162: Whitebox Testing, Test 3 - Dataset
+This file contains a tester to test the streaming tf.data input pipeline
+
+@author MCS13
+@version 1.4.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import tempfile
+import numpy as np
+import tensorflow as tf
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseModel import BaseModel
+from augmentation import build_augmentation
+from dataset import (
+    list_image_files,
+    build_image_dataset,
+    image_dataset_from_directory,
+    build_dataset_cache,
+    load_dataset_cache,
+    build_array_dataset,
+)
+from PIL import Image
+
+# ============================================================================================================= #
+
+# Constants
+CLASS_NAMES = ["person_b", "person_a"]
+IMAGES_PER_CLASS = 3
+IMAGE_SIZE = 80
+RESIZED_SHAPE = (64, 64)
+RESIZED_SHAPES = [(32, 32), (64, 48)]
+BATCH_SIZE = 4
+
+# ============================================================================================================= #
+
+
+# Helper Function
+def make_dataset_dir(directory: str):
+    """Creates a small dataset directory tree with random PNG images
+
+    @param directory (str): The directory to create the class sub-directories in
+    """
+    for class_name in CLASS_NAMES:
+        os.makedirs(os.path.join(directory, class_name))
+        for i in range(IMAGES_PER_CLASS):
+            image = np.random.randint(0, 256, (IMAGE_SIZE, IMAGE_SIZE, 3), np.uint8)
+            tf.io.write_file(
+                os.path.join(directory, class_name, f"{i}.png"),
+                tf.io.encode_png(image),
+            )
+
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestDataset(TesterBase):
+    """Class of Dataset functions Tester
+    Test Cases
+    - Testing list_image_files()
+    - Testing the batches of build_image_dataset()
+    - Testing BaseModel.fit() with a Dataset
+    - Testing the dataset cache
+    - Testing the batches of build_array_dataset()
+    - Testing build_array_dataset() over a split of the images
+    - Testing the augmentation stage
+    - Testing the integer class id labels
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        make_dataset_dir(self.tmp_dir.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_list_image_files(self):
+        """Tests list_image_files()
+
+        Input, x: A dataset directory tree
+        Truth, y: Every image file path, with class ids following the sorted class names
+        """
+        paths, labels, class_names = list_image_files(self.tmp_dir.name)
+
+        try:
+            self.assertEqual(class_names, sorted(CLASS_NAMES))
+            self.assertEqual(len(paths), len(CLASS_NAMES) * IMAGES_PER_CLASS)
+            self.assertEqual(
+                [class_names[label] for label in labels],
+                [os.path.basename(os.path.dirname(path)) for path in paths],
+            )
+        except Exception as e:
+            self.verification_errors.append(
+                f"list_image_files() does not list the expected files: {str(e)}"
+            )
+
+    def test_build_image_dataset(self):
+        """Tests the batches of build_image_dataset()
+
+        Input, x: The image file paths and class ids
+        Truth, y: Batches of resized images with one-hot labels
+        """
+        paths, labels, class_names = list_image_files(self.tmp_dir.name)
+        dataset = build_image_dataset(
+            paths,
+            labels,
+            len(class_names),
+            resized_shape=RESIZED_SHAPE,
+            batch_size=BATCH_SIZE,
+        )
+
+        try:
+            batches = list(dataset)
+            self.assertEqual(
+                [len(images) for images, _ in batches],
+                [BATCH_SIZE, len(paths) - BATCH_SIZE],
+            )
+            images, ids = batches[0]
+            self.assertEqual(images.shape[1:], (*RESIZED_SHAPE, 3))
+            self.assertEqual(ids.shape[1:], (len(class_names),))
+            self.assertTrue(np.all(tf.reduce_sum(ids, axis=1).numpy() == 1))
+        except Exception as e:
+            self.verification_errors.append(
+                f"build_image_dataset() does not produce the expected batches: {str(e)}"
+            )
+
+    def test_fit_dataset(self):
+        """Tests BaseModel.fit() with a Dataset
+
+        Input, x: A Dataset built from the dataset directory tree
+        Truth, y: The model trains without any y values
+        """
+        dataset, class_names = image_dataset_from_directory(
+            self.tmp_dir.name, resized_shape=RESIZED_SHAPE, batch_size=BATCH_SIZE
+        )
+
+        try:
+            dummy_model = BaseModel(num_classes=len(class_names), verbose=0)
+            dummy_model.build_cnn()
+            history = dummy_model.fit(dataset, None, x_val=dataset, num_epochs=1)
+            self.assertIn("val_loss", history.history)
+        except Exception as e:
+            self.verification_errors.append(
+                f"BaseModel.fit() cannot train with a Dataset: {str(e)}"
+            )
+
+    def test_dataset_cache(self):
+        """Tests build_dataset_cache() and load_dataset_cache()
+
+        Input, x: A dataset directory tree
+        Truth, y: Every shape holds every image resized, with the same labels and class names
+        """
+        paths, labels, class_names = list_image_files(self.tmp_dir.name)
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        build_dataset_cache(self.tmp_dir.name, cache_dir, RESIZED_SHAPES)
+
+        for width, height in RESIZED_SHAPES:
+            try:
+                images, cached_labels, cached_class_names = load_dataset_cache(
+                    cache_dir, (width, height)
+                )
+                self.assertTrue(isinstance(images, np.memmap))
+                self.assertEqual(images.shape, (len(paths), height, width, 3))
+                self.assertEqual(cached_labels.tolist(), labels)
+                self.assertEqual(cached_class_names, class_names)
+                self.assertTrue(
+                    np.array_equal(
+                        images[-1],
+                        np.asarray(Image.open(paths[-1]).resize((width, height))),
+                    )
+                )
+            except Exception as e:
+                self.verification_errors.append(
+                    f"The dataset cache for {width}x{height} is not as expected: {str(e)}"
+                )
+
+    def test_build_array_dataset(self):
+        """Tests the batches of build_array_dataset()
+
+        Input, x: The (memory-mapped) images and class ids of the dataset cache
+        Truth, y: Batches of images with one-hot labels, covering every image once
+        """
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        build_dataset_cache(self.tmp_dir.name, cache_dir, [RESIZED_SHAPE])
+        images, labels, class_names = load_dataset_cache(cache_dir, RESIZED_SHAPE)
+        dataset = build_array_dataset(
+            images, labels, len(class_names), batch_size=BATCH_SIZE
+        )
+
+        try:
+            batches = list(dataset)
+            self.assertEqual(
+                [len(batch_images) for batch_images, _ in batches],
+                [BATCH_SIZE, len(images) - BATCH_SIZE],
+            )
+            self.assertEqual(batches[0][0].shape[1:], (*RESIZED_SHAPE, 3))
+            self.assertEqual(
+                sorted(np.concatenate([ids.numpy().argmax(1) for _, ids in batches])),
+                sorted(labels.tolist()),
+            )
+        except Exception as e:
+            self.verification_errors.append(
+                f"build_array_dataset() does not produce the expected batches: {str(e)}"
+            )
+
+    def test_array_dataset_split(self):
+        """Tests build_array_dataset() over a split of the images
+
+        Input, x: The (memory-mapped) images of the dataset cache, and the indices of a split
+        Truth, y: Every image of the split once (read in index order), with its label, and no other image
+        """
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        build_dataset_cache(self.tmp_dir.name, cache_dir, [RESIZED_SHAPE])
+        images, labels, class_names = load_dataset_cache(cache_dir, RESIZED_SHAPE)
+        indices = np.array([4, 0, 3])
+        dataset = build_array_dataset(
+            images,
+            labels,
+            len(class_names),
+            batch_size=BATCH_SIZE,
+            shuffle=False,
+            label_mode="int",
+            indices=indices,
+        )
+
+        try:
+            split_images = np.concatenate([batch.numpy() for batch, _ in dataset])
+            split_labels = np.concatenate([ids.numpy() for _, ids in dataset])
+            self.assertTrue(np.array_equal(split_images, images[np.sort(indices)]))
+            self.assertEqual(split_labels.tolist(), labels[np.sort(indices)].tolist())
+        except Exception as e:
+            self.verification_errors.append(
+                f"build_array_dataset() does not produce the batches of the split: {str(e)}"
+            )
+
+    def test_augmentation_stage(self):
+        """Tests the augmentation stage of build_array_dataset()
+
+        Input, x: The images and class ids of the dataset cache, with translations and flips
+        Truth, y: Every image appears once per epoch (no augmented copies), with its label unchanged
+        """
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        build_dataset_cache(self.tmp_dir.name, cache_dir, [RESIZED_SHAPE])
+        images, labels, class_names = load_dataset_cache(cache_dir, RESIZED_SHAPE)
+        dataset = build_array_dataset(
+            images,
+            labels,
+            len(class_names),
+            batch_size=BATCH_SIZE,
+            shuffle=False,
+            augmentation=build_augmentation(flip=True),
+        )
+
+        try:
+            augmented_images = np.concatenate([batch.numpy() for batch, _ in dataset])
+            augmented_labels = np.concatenate([ids.numpy().argmax(1) for _, ids in dataset])
+            self.assertEqual(augmented_images.shape, images.shape)
+            self.assertEqual(augmented_labels.tolist(), labels.tolist())
+        except Exception as e:
+            self.verification_errors.append(
+                f"The augmentation stage does not produce the expected batches: {str(e)}"
+            )
+
+    def test_int_label_mode(self):
+        """Tests the integer class id labels of the pipelines
+
+        Input, x: The dataset directory tree and its dataset cache, with label_mode="int"
+        Truth, y: The labels are int32 class ids; an unknown label mode raises a ValueError
+        """
+        paths, labels, class_names = list_image_files(self.tmp_dir.name)
+        cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        build_dataset_cache(self.tmp_dir.name, cache_dir, [RESIZED_SHAPE])
+        images, cached_labels, _ = load_dataset_cache(cache_dir, RESIZED_SHAPE)
+
+        datasets = [
+            build_image_dataset(
+                paths, labels, len(class_names), resized_shape=RESIZED_SHAPE,
+                batch_size=BATCH_SIZE, shuffle=False, label_mode="int",
+            ),
+            build_array_dataset(
+                images, cached_labels, len(class_names),
+                batch_size=BATCH_SIZE, shuffle=False, label_mode="int",
+            ),
+        ]
+
+        for dataset in datasets:
+            try:
+                ids = np.concatenate([batch_ids.numpy() for _, batch_ids in dataset])
+                self.assertEqual(ids.dtype, np.int32)
+                self.assertEqual(ids.tolist(), labels)
+            except Exception as e:
+                self.verification_errors.append(
+                    f"The pipeline does not produce integer class ids: {str(e)}"
+                )
+
+        try:
+            with self.assertRaises(ValueError):
+                build_array_dataset(images, cached_labels, len(class_names), label_mode="binary")
+        except Exception as e:
+            self.verification_errors.append(
+                f"An unknown label mode does not raise a ValueError: {str(e)}"
+            )
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDataset)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested listing the dataset directory tree
+- Tested the Dataset batches
+- Tested training BaseModel with a Dataset
+
+1.1.0
+- Tested the dataset cache
+- Tested the Dataset batches over (memory-mapped) arrays
+
+1.2.0
+- Tested the augmentation stage
+
+1.3.0
+- Tested the integer class id labels
+
+1.4.0
+- Tested the Dataset batches over a split of the images
+"""
@@ -0,0 +1,114 @@
+""" FIT3162: Whitebox Testing, Test 5 - Import Time
+This file contains a tester to check that the model modules only import TensorFlow on first use
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import json
+import subprocess
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ============================================================================================================= #
+
+# Constants
+# Largest accepted import time, in seconds (TensorFlow alone takes a few seconds)
+MAX_IMPORT_SECONDS = 1.0
+
+# Run in a new process, so the TensorFlow imported by the other testers does not count
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+
+from BaseModel import BaseModel, TFLITE_QUANTISATIONS, bfloat16_supported
+from ResNetModel import ResNetModel
+from SkipConnModel import SkipConnModel
+
+models = [BaseModel(verbose=0), ResNetModel(verbose=0), SkipConnModel(verbose=0, optimiser="sgd")]
+seconds = time.perf_counter() - start
+imported_before_use = "tensorflow" in sys.modules
+
+models[0].optimiser
+print(json.dumps({
+    "seconds": seconds,
+    "imported_before_use": imported_before_use,
+    "imported_on_use": "tensorflow" in sys.modules,
+}))
+"""
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestImportTime(TesterBase):
+    """Class of Import Time Tester
+    Test Cases
+    - Importing the model modules and constructing models, without importing TensorFlow
+    - Importing TensorFlow on first use
+    """
+
+    def setUp(self):
+        super().setUp()
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.result = json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_lazy_import(self):
+        """Testing that importing the model modules and constructing models does not import TensorFlow
+
+        Input, x: The model modules, imported in a new process
+        Truth, y: TensorFlow is not imported, and the imports take less than MAX_IMPORT_SECONDS
+        """
+        try:
+            self.assertFalse(self.result["imported_before_use"])
+        except Exception as e:
+            self.verification_errors.append(f"Importing the model modules imports TensorFlow: {str(e)}")
+
+        try:
+            self.assertLess(self.result["seconds"], MAX_IMPORT_SECONDS)
+        except Exception as e:
+            self.verification_errors.append(f"Importing the model modules is too slow: {str(e)}")
+
+    def test_import_on_use(self):
+        """Testing that TensorFlow is imported on first use
+
+        Input, x: The optimiser of a constructed model
+        Truth, y: TensorFlow is imported
+        """
+        try:
+            self.assertTrue(self.result["imported_on_use"])
+        except Exception as e:
+            self.verification_errors.append(f"TensorFlow is not imported on first use: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestImportTime)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested importing the model modules without TensorFlow
+- Tested importing TensorFlow on first use
+"""
@@ -0,0 +1,155 @@
+""" FIT3162: Whitebox Testing, Test 10 - Metrics
+This file contains a tester to test the stage timing histograms and the Prometheus metrics of the prediction server
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from metrics import Histogram, MetricsWriter, StageTimer
+
+# ============================================================================================================= #
+
+# Constants
+BUCKETS = (0.1, 1.0, 10.0)
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestMetrics(TesterBase):
+    """Class of Metrics Tester
+    Test Cases
+    - Counting the observed values in cumulative buckets
+    - Timing stages with spans, including failed ones
+    - Writing histograms in the Prometheus text format, with the +Inf bucket
+    - Writing counters and gauges, with escaped labels
+    """
+
+    def test_histogram(self):
+        """Tests counting the observed values in cumulative buckets
+
+        Input, x: Values below, on and above the bucket bounds, one of them observed twice
+        Truth, y: The cumulative bucket counts (a value on a bound is in its bucket), the sum and the count
+        """
+        histogram = Histogram(BUCKETS)
+        for value in (0.05, 0.1, 5.0, 50.0):
+            histogram.observe(value)
+        histogram.observe(0.5, count=2)
+
+        try:
+            counts, total, count = histogram.snapshot()
+            self.assertEqual(counts, [2, 4, 5, 6])
+            self.assertAlmostEqual(total, 56.15)
+            self.assertEqual(count, 6)
+        except Exception as e:
+            self.verification_errors.append(f"The histogram counts are wrong: {str(e)}")
+
+    def test_spans(self):
+        """Tests timing stages with spans, including failed ones
+
+        Input, x: Two spans of one stage, one of them raising, and one span of another stage
+        Truth, y: One histogram per stage, in the order they were first timed, counting every span
+        """
+        timer = StageTimer(BUCKETS)
+        with timer.span("decode"):
+            pass
+        try:
+            with timer.span("decode"):
+                raise ValueError("bad image")
+        except ValueError:
+            pass
+        with timer.span("detect"):
+            pass
+
+        try:
+            histograms = timer.histograms()
+            self.assertEqual(list(histograms), ["decode", "detect"])
+            self.assertEqual(histograms["decode"].snapshot()[2], 2)
+            self.assertEqual(histograms["detect"].snapshot()[2], 1)
+        except Exception as e:
+            self.verification_errors.append(f"The spans are not timed: {str(e)}")
+
+    def test_histogram_text(self):
+        """Tests writing histograms in the Prometheus text format
+
+        Input, x: A histogram of a labelled series
+        Truth, y: The HELP and TYPE lines, the cumulative buckets ending with +Inf, the sum and the count
+        """
+        histogram = Histogram(BUCKETS)
+        histogram.observe(0.5)
+        histogram.observe(20.0)
+
+        writer = MetricsWriter()
+        writer.histogram("stage_duration_seconds", "Time spent in each stage.", [({"stage": "detect"}, histogram)])
+
+        try:
+            self.assertEqual(
+                writer.text().splitlines(),
+                [
+                    "# HELP mcs13_stage_duration_seconds Time spent in each stage.",
+                    "# TYPE mcs13_stage_duration_seconds histogram",
+                    'mcs13_stage_duration_seconds_bucket{stage="detect",le="0.1"} 0',
+                    'mcs13_stage_duration_seconds_bucket{stage="detect",le="1"} 1',
+                    'mcs13_stage_duration_seconds_bucket{stage="detect",le="10"} 1',
+                    'mcs13_stage_duration_seconds_bucket{stage="detect",le="+Inf"} 2',
+                    'mcs13_stage_duration_seconds_sum{stage="detect"} 20.5',
+                    'mcs13_stage_duration_seconds_count{stage="detect"} 2',
+                ],
+            )
+        except Exception as e:
+            self.verification_errors.append(f"The histogram text is wrong: {str(e)}")
+
+    def test_counter_gauge_text(self):
+        """Tests writing counters and gauges, with escaped labels
+
+        Input, x: A counter, and a gauge with a label holding a quote, a backslash and a newline
+        Truth, y: The counter name ends with _total, and the label is escaped
+        """
+        writer = MetricsWriter()
+        writer.counter("cache_hits", "Result cache hits.", 3)
+        writer.gauge("model_info", "The model being served.", [({"version": 'a"b\\c\nd'}, 1)])
+
+        try:
+            self.assertEqual(
+                writer.text().splitlines(),
+                [
+                    "# HELP mcs13_cache_hits_total Result cache hits.",
+                    "# TYPE mcs13_cache_hits_total counter",
+                    "mcs13_cache_hits_total 3",
+                    "# HELP mcs13_model_info The model being served.",
+                    "# TYPE mcs13_model_info gauge",
+                    'mcs13_model_info{version="a\\"b\\\\c\\nd"} 1',
+                ],
+            )
+        except Exception as e:
+            self.verification_errors.append(f"The counter and gauge text is wrong: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestMetrics)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested the cumulative histogram buckets and the stage spans
+- Tested the Prometheus text of histograms, counters and gauges
+"""
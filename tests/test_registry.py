@@ -0,0 +1,158 @@
+""" FIT3162: Whitebox Testing, Test 6 - Model Registry
+This file contains a tester to test the model registry of the prediction server
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import threading
+import numpy as np
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "my_app", "lib"))
+
+from registry import ModelRegistry
+
+# ============================================================================================================= #
+
+# Constants
+TIMEOUT = 10
+
+# ============================================================================================================= #
+
+
+# Helper Classes
+class FakeModel:
+    """Stand-in for an InferenceBackend, predicting its own output for every image"""
+
+    def __init__(self, output: float):
+        self.output = output
+
+    def warm_up(self, batch_size: int = 1):
+        pass
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        return np.full((len(batch), 1), self.output)
+
+
+class FakeLoader:
+    """Stand-in loader: a path is "good_<output>", "bad" (fails to load) or "slow_<output>" (waits for release)"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def __call__(self, path: str, backend: str):
+        if path == "bad":
+            raise OSError("no model here")
+        if path.startswith("slow"):
+            self.release.wait(TIMEOUT)
+        return FakeModel(float(path.split("_")[1])), "fake"
+
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestModelRegistry(TesterBase):
+    """Class of Model Registry Tester
+    Test Cases
+    - Swapping in a loaded model
+    - Keeping the current model when a load fails
+    - Reporting every queued load as loading
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.loader = FakeLoader()
+        self.registry = ModelRegistry(self.loader)
+        self.registry.load("good_1", wait=True)
+
+    def tearDown(self):
+        super().tearDown()
+        self.loader.release.set()
+        self.registry.stop()
+
+    def test_swap(self):
+        """Tests swapping in a loaded model
+
+        Input, x: A second model, loaded after the first one
+        Truth, y: The predictions use the second model, which gets the next version
+        """
+        self.registry.load("good_2", wait=True)
+
+        try:
+            self.assertEqual(self.registry.predict(np.zeros((1, 2)))[0, 0], 2.0)
+            self.assertEqual(self.registry.current().version, "good_2#2")
+            self.assertIsNone(self.registry.status()["loading"])
+        except Exception as e:
+            self.verification_errors.append(f"The loaded model is not swapped in: {str(e)}")
+
+    def test_failed_load(self):
+        """Tests that a failed load keeps the current model
+
+        Input, x: A model which fails to load
+        Truth, y: The load raises, the first model keeps serving, and the error is reported
+        """
+        try:
+            with self.assertRaises(OSError):
+                self.registry.load("bad", wait=True)
+
+            status = self.registry.status()
+            self.assertEqual(self.registry.predict(np.zeros((1, 2)))[0, 0], 1.0)
+            self.assertEqual(status["version"], "good_1#1")
+            self.assertIsNone(status["loading"])
+            self.assertIn("no model here", status["last_error"])
+        except Exception as e:
+            self.verification_errors.append(f"A failed load does not keep the current model: {str(e)}")
+
+    def test_queued_loads(self):
+        """Tests that every queued load is reported as loading
+
+        Input, x: Two loads queued at once, the first one blocked until released
+        Truth, y: Loading is reported until the last queued model is swapped in
+        """
+        first = self.registry.load("slow_2")
+        second = self.registry.load("good_3")
+
+        try:
+            status = self.registry.status()
+            self.assertEqual(status["loading"], "slow_2")
+            self.assertEqual(status["pending"], ["slow_2", "good_3"])
+
+            self.loader.release.set()
+            first.result(TIMEOUT)
+            second.result(TIMEOUT)
+
+            status = self.registry.status()
+            self.assertIsNone(status["loading"])
+            self.assertEqual(status["pending"], [])
+            self.assertEqual(status["version"], "good_3#3")
+        except Exception as e:
+            self.verification_errors.append(f"Queued loads are not reported: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestModelRegistry)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested swapping in a loaded model
+- Tested keeping the current model when a load fails
+- Tested reporting every queued load
+"""
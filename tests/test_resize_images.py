@@ -0,0 +1,114 @@
+""" FIT3162: Whitebox Testing, Test 4 - Resize Images
+This file contains a tester to test the parallel resizing tool
+
+@author MCS13
+@version 1.0.0
+@since 18/10/2026
+"""
+
+# ============================================================================================================= #
+
+# Imports
+import unittest
+import pytest
+import tempfile
+import numpy as np
+from PIL import Image
+from tester_base import TesterBase
+
+import os, sys  # Importing other files
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resize_images import resize_neutral_images, resized_dir
+
+# ============================================================================================================= #
+
+# Constants
+NAMES = ["person_a", "person_b"]
+IMAGES_PER_NAME = 2
+IMAGE_SIZE = 80
+RESIZED_SHAPES = [(32, 32), (48, 48)]
+WORKERS = 2
+
+# ============================================================================================================= #
+
+
+# Tester
+class TestResizeImages(TesterBase):
+    """Class of Resize Images Tester
+    Test Cases
+    - Resizing to every shape
+    - Skipping the outputs which are up to date
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.join(self.tmp_dir.name, "source")
+        self.output_prefix = os.path.join(self.tmp_dir.name, "resized")
+
+        for name in NAMES:
+            os.makedirs(os.path.join(self.source_dir, name))
+            for i in range(IMAGES_PER_NAME):
+                image = np.random.randint(0, 256, (IMAGE_SIZE, IMAGE_SIZE, 3), np.uint8)
+                Image.fromarray(image).save(os.path.join(self.source_dir, name, f"{i}.png"))
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def resize(self) -> int:
+        return resize_neutral_images(
+            self.source_dir, RESIZED_SHAPES, self.output_prefix, workers=WORKERS
+        )
+
+    def test_resize_all_shapes(self):
+        """Tests resizing to every shape
+
+        Input, x: A source directory tree
+        Truth, y: Every image is written once per shape, with the expected size
+        """
+        try:
+            self.assertEqual(self.resize(), len(NAMES) * IMAGES_PER_NAME * len(RESIZED_SHAPES))
+            for shape in RESIZED_SHAPES:
+                for name in NAMES:
+                    for i in range(IMAGES_PER_NAME):
+                        path = os.path.join(resized_dir(shape, self.output_prefix), name, f"{i}.png")
+                        self.assertEqual(Image.open(path).size, shape)
+        except Exception as e:
+            self.verification_errors.append(f"Images are not resized to every shape: {str(e)}")
+
+    def test_skip_up_to_date(self):
+        """Tests that up to date outputs are skipped
+
+        Input, x: A source directory tree that was already resized, with one new image
+        Truth, y: Only the new image is resized
+        """
+        self.resize()
+        image = np.zeros((IMAGE_SIZE, IMAGE_SIZE, 3), np.uint8)
+        Image.fromarray(image).save(os.path.join(self.source_dir, NAMES[0], "new.png"))
+
+        try:
+            self.assertEqual(self.resize(), len(RESIZED_SHAPES))
+            self.assertEqual(self.resize(), 0)
+        except Exception as e:
+            self.verification_errors.append(f"Up to date images are resized again: {str(e)}")
+
+
+# ============================================================================================================= #
+
+# Main Function
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestResizeImages)
+    unittest.TextTestRunner(verbosity=0).run(suite)
+
+# ============================================================================================================= #
+
+# Version Overview
+"""
+1.0.0
+- Created the tester file
+- Tested resizing to every shape
+- Tested skipping up to date images
+"""